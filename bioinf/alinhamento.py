@@ -1,3 +1,17 @@
+import os
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from numbers import Integral
+
+try:
+    import numpy as np
+except ImportError:  # o NumPy é opcional; só é necessário para ``motor="numpy"``
+    np = None
+
+
 BLOSUM62 = {
     'A': {'A': 4,  'C': 0,  'G': 0,  'T': 0},
     'C': {'A': 0,  'C': 9,  'G': -3, 'T': -1},
@@ -13,6 +27,9 @@ Nota:
     funções que acedem a esta matriz podem levantar ``KeyError``.
 """
 
+_FIM, _DIAG, _CIMA, _ESQ = 0, 1, 2, 3
+"""Códigos de direção (2 bits) guardados por célula para o traceback."""
+
 
 def score_subst(a, b, matriz):
     """Obtém o score de substituição entre dois símbolos.
@@ -23,8 +40,9 @@ def score_subst(a, b, matriz):
     Args:
         a (str): Símbolo da sequência 1 (tipicamente um carácter).
         b (str): Símbolo da sequência 2 (tipicamente um carácter).
-        matriz (dict): Matriz de substituição no formato
-            ``dict[símbolo][símbolo] -> score`` (ex.: PAM/BLOSUM ou matriz custom).
+        matriz (dict | SubstitutionMatrix): Matriz de substituição no formato
+            ``dict[símbolo][símbolo] -> score`` (ex.: PAM/BLOSUM ou matriz custom),
+            ou a sua versão compilada.
 
     Returns:
         int | float: Score de substituição definido na matriz.
@@ -40,6 +58,231 @@ def score_subst(a, b, matriz):
     return matriz[a][b]
 
 
+class SubstitutionMatrix:
+    """Matriz de substituição compilada: alfabeto indexado + tabela densa.
+
+    Converte uma matriz ``dict[símbolo][símbolo] -> score`` numa tabela
+    ``tabela[índice_a][índice_b]`` (lista de listas) e num mapa símbolo -> índice,
+    para que os ciclos de programação dinâmica usem apenas indexação inteira
+    (``O(1)``, sem hashing de strings). As sequências são codificadas uma única
+    vez com :meth:`codificar`.
+
+    O objeto continua a suportar o acesso ``matriz[a][b]`` (como um ``dict``),
+    pelo que pode ser passado a qualquer função que receba ``matriz_subst``.
+
+    Args:
+        matriz (dict): Matriz no formato ``dict[símbolo][símbolo] -> score``.
+        nome (str | None, optional): Nome descritivo (ex.: ``"BLOSUM62"``).
+
+    Attributes:
+        alfabeto (tuple[str, ...]): Símbolos da matriz (ordem de aparecimento).
+        indice (dict[str, int]): Mapa símbolo -> índice em ``alfabeto``.
+        tabela (list[list[int | float | None]]): Scores densos (``None`` nos pares
+            que não existem em ``matriz``).
+        completa (bool): ``True`` se todos os pares do alfabeto tiverem score.
+        inteira (bool): ``True`` se todos os scores forem inteiros.
+
+    Examples:
+        >>> sm = SubstitutionMatrix({'A': {'A': 1, 'C': -1}, 'C': {'A': -1, 'C': 1}})
+        >>> sm.score('A', 'C'), sm['C']['C'], sm.codificar("CA")
+        (-1, 1, [1, 0])
+    """
+
+    def __init__(self, matriz, nome=None):
+        simbolos = list(matriz)
+        for linha in matriz.values():
+            simbolos.extend(linha)
+        self.alfabeto = tuple(dict.fromkeys(simbolos))
+        self.indice = {s: k for k, s in enumerate(self.alfabeto)}
+        self.tabela = [[matriz.get(a, {}).get(b) for b in self.alfabeto] for a in self.alfabeto]
+        valores = [v for linha in self.tabela for v in linha if v is not None]
+        self.completa = len(valores) == len(self.alfabeto)**2
+        self.inteira = all(isinstance(v, Integral) for v in valores)
+        self.nome = nome
+        self._linhas = {a: dict(linha) for a, linha in matriz.items()}
+        self._array = None
+
+    def __repr__(self):
+        return f"SubstitutionMatrix(nome={self.nome!r}, alfabeto={''.join(self.alfabeto)!r})"
+
+    def __getitem__(self, a):
+        return self._linhas[a]
+
+    def __contains__(self, a):
+        return a in self._linhas
+
+    def __iter__(self):
+        return iter(self._linhas)
+
+    def score(self, a, b):
+        """Devolve o score de substituição entre os símbolos ``a`` e ``b``.
+
+        Raises:
+            KeyError: Se algum dos símbolos (ou o par) não existir na matriz.
+        """
+        valor = self.tabela[self.indice[a]][self.indice[b]]
+        if valor is None:
+            raise KeyError(b)
+        return valor
+
+    def codificar(self, seq):
+        """Converte uma sequência numa lista de índices do alfabeto.
+
+        Raises:
+            KeyError: Se algum símbolo de ``seq`` não existir na matriz.
+        """
+        return [self.indice[c] for c in seq]
+
+    def codificar_par(self, seq1, seq2):
+        """Codifica duas sequências que vão ser comparadas entre si.
+
+        Em matrizes incompletas verifica também que existem todos os pares
+        (símbolo de ``seq1``, símbolo de ``seq2``) usados, para que o erro seja o
+        mesmo ``KeyError`` de :func:`score_subst`.
+
+        Returns:
+            tuple[list[int], list[int]]: Códigos de ``seq1`` e de ``seq2``.
+
+        Raises:
+            KeyError: Se algum símbolo ou par de símbolos não existir na matriz.
+        """
+        cod1, cod2 = self.codificar(seq1), self.codificar(seq2)
+        if not self.completa:
+            for a in set(cod1):
+                for b in set(cod2):
+                    if self.tabela[a][b] is None:
+                        raise KeyError(self.alfabeto[b])
+        return cod1, cod2
+
+    @property
+    def array(self):
+        """numpy.ndarray: Tabela densa como array NumPy (``int64`` ou ``float64``).
+
+        Os pares inexistentes valem 0 (devem ser excluídos com :meth:`codificar_par`).
+
+        Raises:
+            ImportError: Se o NumPy não estiver instalado.
+        """
+        if self._array is None:
+            if np is None:
+                raise ImportError("SubstitutionMatrix.array requer o pacote NumPy.")
+            tipo = np.int64 if self.inteira else np.float64
+            self._array = np.array([[0 if v is None else v for v in linha] for linha in self.tabela],
+                                   dtype=tipo).reshape(len(self.alfabeto), len(self.alfabeto))
+        return self._array
+
+    def para_dict(self):
+        """Devolve a matriz no formato ``dict[símbolo][símbolo] -> score``."""
+        return {a: dict(linha) for a, linha in self._linhas.items()}
+
+    @classmethod
+    def de_ficheiro(cls, caminho, nome=None):
+        """Lê uma matriz no formato NCBI (cabeçalho com símbolos e uma linha por símbolo).
+
+        Linhas vazias ou começadas por ``#`` são ignoradas.
+
+        Args:
+            caminho (str): Caminho do ficheiro.
+            nome (str | None, optional): Nome da matriz. Por omissão, o nome do ficheiro.
+
+        Returns:
+            SubstitutionMatrix: Matriz compilada.
+
+        Raises:
+            OSError: Se o ficheiro não puder ser lido.
+            ValueError: Se alguma linha não tiver um score por símbolo do cabeçalho.
+        """
+        with open(caminho) as f:
+            linhas = [l.split() for l in f if l.strip() and not l.startswith("#")]
+        cabecalho, matriz = linhas[0], {}
+        for linha in linhas[1:]:
+            if len(linha) != len(cabecalho) + 1:
+                raise ValueError(f"Linha inválida na matriz {caminho}: {' '.join(linha)}")
+            matriz[linha[0]] = {b: int(v) for b, v in zip(cabecalho, linha[1:])}
+        if nome is None:
+            nome = os.path.splitext(os.path.basename(caminho))[0]
+        return cls(matriz, nome)
+
+
+_PASTA_MATRIZES = os.path.join(os.path.dirname(__file__), "matrizes")
+
+_MATRIZES_COMPILADAS = {}
+"""dict[int, tuple]: Cache LRU de :func:`compilar_matriz`: ``id(dict) -> (dict, impressão, compilada)``."""
+
+_MAX_MATRIZES_COMPILADAS = 32
+"""int: Número máximo de matrizes ``dict`` mantidas compiladas em cache."""
+
+
+def carregar_matriz(nome):
+    """Carrega (uma única vez) uma matriz de proteínas incluída no pacote.
+
+    As matrizes são lidas da pasta ``bioinf/matrizes`` apenas quando pedidas
+    pela primeira vez; as chamadas seguintes devolvem o mesmo objeto.
+
+    Args:
+        nome (str): Nome da matriz, ex.: ``"BLOSUM62"`` ou ``"PAM250"``
+            (sem distinção de maiúsculas).
+
+    Returns:
+        SubstitutionMatrix: Matriz compilada (alfabeto de 20 aminoácidos mais
+        ``B``, ``Z``, ``X`` e ``*``).
+
+    Raises:
+        ValueError: Se não existir nenhuma matriz com esse nome.
+
+    Examples:
+        >>> carregar_matriz("BLOSUM62").score("W", "W")
+        11
+    """
+    return _ler_matriz(nome.upper())
+
+
+@lru_cache(maxsize=None)
+def _ler_matriz(nome):
+    """Lê e compila a matriz ``bioinf/matrizes/<nome>.txt`` (em cache)."""
+    caminho = os.path.join(_PASTA_MATRIZES, nome + ".txt")
+    if not os.path.exists(caminho):
+        disponiveis = sorted(f[:-4] for f in os.listdir(_PASTA_MATRIZES) if f.endswith(".txt"))
+        raise ValueError(f"Matriz desconhecida: {nome!r} (disponíveis: {', '.join(disponiveis)})")
+    return SubstitutionMatrix.de_ficheiro(caminho, nome)
+
+
+def compilar_matriz(matriz_subst):
+    """Devolve a versão compilada (:class:`SubstitutionMatrix`) de uma matriz.
+
+    Um ``dict`` é compilado apenas na primeira vez que é usado; as chamadas
+    seguintes com o mesmo objeto devolvem a versão em cache. Se ``matriz_subst``
+    já for uma :class:`SubstitutionMatrix`, é devolvida sem alterações.
+
+    A cache guarda só as ``_MAX_MATRIZES_COMPILADAS`` matrizes usadas mais
+    recentemente (as matrizes criadas num ciclo não ficam presas em memória) e,
+    em cada chamada, compara uma impressão dos pares ``(a, b, score)`` do
+    ``dict``: um dicionário alterado depois de compilado é recompilado.
+
+    Args:
+        matriz_subst (dict | SubstitutionMatrix): Matriz de substituição.
+
+    Returns:
+        SubstitutionMatrix: Matriz compilada.
+
+    Examples:
+        >>> compilar_matriz(BLOSUM62) is compilar_matriz(BLOSUM62)
+        True
+    """
+    if isinstance(matriz_subst, SubstitutionMatrix):
+        return matriz_subst
+    impressao = tuple((a, tuple(linha.items())) for a, linha in matriz_subst.items())
+    # pop + reinserção: a entrada passa para o fim (a mais recente)
+    entrada = _MATRIZES_COMPILADAS.pop(id(matriz_subst), None)
+    if entrada is None or entrada[0] is not matriz_subst or entrada[1] != impressao:
+        # guarda-se também o dict, para que o seu id não seja reutilizado
+        entrada = (matriz_subst, impressao, SubstitutionMatrix(matriz_subst))
+    _MATRIZES_COMPILADAS[id(matriz_subst)] = entrada
+    while len(_MATRIZES_COMPILADAS) > _MAX_MATRIZES_COMPILADAS:
+        del _MATRIZES_COMPILADAS[next(iter(_MATRIZES_COMPILADAS))]
+    return entrada[2]
+
+
 def dot_plot(seq1, seq2):
     """Cria uma matriz de pontos (dot plot) binária entre duas sequências.
 
@@ -62,19 +305,142 @@ def dot_plot(seq1, seq2):
     return [[1 if a == b else 0 for b in seq2] for a in seq1]
 
 
-def needleman_wunsch(seq1, seq2, matriz_subst=BLOSUM62, gap=-5):
+def dot_plot_esparso(seq1, seq2, k=1, janela=None, minimo=None, iterador=False):
+    """Cria um dot plot esparso: só as coordenadas dos k-mers coincidentes.
+
+    Em vez da matriz densa de :func:`dot_plot` (que continua a ser a
+    implementação de referência para sequências pequenas), indexa os k-mers de
+    ``seq2`` numa tabela de hash e percorre os de ``seq1``, produzindo apenas os
+    pares ``(i, j)`` com ``seq1[i:i+k] == seq2[j:j+k]``. A memória é
+    ``O(len(seq2))`` mais o número de pontos devolvidos (nenhum, no modo
+    iterador; com filtro, mais o estado das diagonais tocadas nas últimas
+    ``2*janela`` linhas).
+
+    Opcionalmente aplica o filtro clássico de janela/rigor: um ponto só é
+    mantido se pertencer a uma janela de ``janela`` posições consecutivas da
+    mesma diagonal com pelo menos ``minimo`` pontos, o que elimina o ruído de
+    coincidências isoladas.
+
+    Args:
+        seq1 (str): Primeira sequência (coordenada ``i``).
+        seq2 (str): Segunda sequência (coordenada ``j``).
+        k (int, optional): Comprimento dos k-mers. Por omissão ``1``.
+        janela (int | None, optional): Comprimento da janela na diagonal.
+        minimo (int | None, optional): Número mínimo de pontos na janela.
+        iterador (bool, optional): Se ``True``, devolve um gerador que produz os
+            pontos à medida que são encontrados (ordem crescente de ``i``, exceto
+            com filtro, em que um ponto pode surgir até ``janela`` linhas depois).
+
+    Returns:
+        list[tuple[int, int]] | Iterator[tuple[int, int]]: Pontos ``(i, j)``,
+        ordenados, ou um gerador se ``iterador`` for ``True``.
+
+    Raises:
+        ValueError: Se ``k < 1``, se só um de ``janela``/``minimo`` for dado, ou
+            se não se verificar ``1 <= minimo <= janela``.
+
+    Examples:
+        >>> dot_plot_esparso("AC", "AGC")
+        [(0, 0), (1, 2)]
+        >>> dot_plot_esparso("ACGTTT", "TTACGT", k=3)
+        [(0, 2), (1, 3)]
+        >>> dot_plot_esparso("ACGTTT", "TTACGT", janela=3, minimo=3)
+        [(0, 2), (1, 3), (2, 4), (3, 5)]
+    """
+    if k < 1:
+        raise ValueError("O comprimento dos k-mers tem de ser >= 1.")
+    if (janela is None) != (minimo is None):
+        raise ValueError("O filtro precisa de 'janela' e 'minimo' em conjunto.")
+    if janela is not None and not 1 <= minimo <= janela:
+        raise ValueError("É preciso 1 <= minimo <= janela.")
+
+    pontos = _pontos_kmer(seq1, seq2, k)
+    if janela is not None:
+        pontos = _filtrar_diagonais(pontos, janela, minimo)
+    return pontos if iterador else sorted(pontos)
+
+
+def _pontos_kmer(seq1, seq2, k):
+    """Produz os pares ``(i, j)`` de k-mers iguais, por ordem crescente de ``i``.
+
+    Args:
+        seq1 (str): Primeira sequência.
+        seq2 (str): Segunda sequência (indexada).
+        k (int): Comprimento dos k-mers.
+
+    Yields:
+        tuple[int, int]: Coordenadas de início dos k-mers coincidentes.
+    """
+    indice = {}
+    for j in range(len(seq2)-k+1):
+        indice.setdefault(seq2[j:j+k], []).append(j)
+    for i in range(len(seq1)-k+1):
+        for j in indice.get(seq1[i:i+k], ()):
+            yield i, j
+
+
+def _filtrar_diagonais(pontos, janela, minimo):
+    """Mantém só os pontos em janelas diagonais com pelo menos ``minimo`` pontos.
+
+    Os pontos têm de chegar por ordem crescente de ``i``. Para cada diagonal
+    (``j - i``) guarda-se apenas os pontos das últimas ``janela`` posições; quando
+    a janela atinge ``minimo`` pontos, todos os que ainda não saíram são
+    produzidos. A cada ``janela`` linhas são descartadas as diagonais sem pontos
+    na janela atual, por isso só ficam em memória as diagonais tocadas nas
+    últimas ``2*janela`` linhas (e não todas as já vistas).
+
+    Args:
+        pontos (Iterable[tuple[int, int]]): Pontos ``(i, j)`` ordenados por ``i``.
+        janela (int): Comprimento da janela.
+        minimo (int): Número mínimo de pontos na janela.
+
+    Yields:
+        tuple[int, int]: Pontos que passam o filtro.
+    """
+    diagonais = {}
+    varredura = 0
+    for i, j in pontos:
+        if i >= varredura + janela:
+            # uma diagonal sem pontos na janela já não produz nada: o seu estado
+            # pode ser esquecido (os pontos seguintes têm todos i maior)
+            for d in [d for d, (recentes, _) in diagonais.items() if recentes[-1] <= i - janela]:
+                del diagonais[d]
+            varredura = i
+        d = j - i
+        estado = diagonais.get(d)
+        if estado is None:
+            # [pontos recentes (i), último i já produzido]
+            estado = diagonais[d] = [deque(), -1]
+        recentes = estado[0]
+        while recentes and recentes[0] <= i - janela:
+            recentes.popleft()
+        recentes.append(i)
+        if len(recentes) >= minimo:
+            for r in recentes:
+                if r > estado[1]:
+                    yield r, r + d
+            estado[1] = i
+
+
+def needleman_wunsch(seq1, seq2, matriz_subst=BLOSUM62, gap=-5, motor="python"):
     """Executa alinhamento global (Needleman–Wunsch) entre duas sequências.
 
     Implementa a fase de preenchimento da matriz de scores para alinhamento global
-    e, no final, reconstrói um alinhamento ótimo via traceback.
+    e, no final, reconstrói um alinhamento ótimo via traceback. O preenchimento
+    (ver :func:`_preencher_nw`) guarda apenas duas linhas de scores e um byte de
+    direção por célula, que é tudo o que o traceback precisa.
 
     Args:
         seq1 (str): Primeira sequência a alinhar.
         seq2 (str): Segunda sequência a alinhar.
-        matriz_subst (dict, optional): Matriz de substituição (ex.: BLOSUM/PAM ou
+        matriz_subst (dict | SubstitutionMatrix, optional): Matriz de substituição (ex.: BLOSUM/PAM ou
             matriz custom). Por omissão usa ``BLOSUM62``.
         gap (int, optional): Penalização linear de gap (inserção/deleção).
             Por omissão ``-5``.
+        motor (str, optional): Motor usado no preenchimento da matriz:
+            ``"python"`` (listas, por omissão) ou ``"numpy"`` (preenchimento
+            vetorizado por linhas, ver :func:`_preencher_nw_numpy`). Ambos
+            devolvem exatamente o mesmo resultado.
 
     Returns:
         tuple[str, str, int | float]: Triplo ``(seq1_alinhada, seq2_alinhada, score)``,
@@ -84,52 +450,129 @@ def needleman_wunsch(seq1, seq2, matriz_subst=BLOSUM62, gap=-5):
     Raises:
         KeyError: Se a matriz de substituição não contiver algum símbolo presente
             nas sequências.
+        ValueError: Se ``motor`` for desconhecido, ou se ``motor="numpy"`` for usado
+            com scores não inteiros.
+        ImportError: Se ``motor="numpy"`` for pedido sem o NumPy instalado.
 
     Examples:
         >>> a1, a2, sc = needleman_wunsch("AC", "AGC")
         >>> len(a1) == len(a2)
         True
     """
+    if motor == "numpy":
+        score, dirs = _preencher_nw_numpy(seq1, seq2, matriz_subst, gap)
+    elif motor == "python":
+        ultima, dirs = _preencher_nw(seq1, seq2, matriz_subst, gap, direcoes=True)
+        score = ultima[-1]
+    else:
+        raise ValueError(f"Motor desconhecido: {motor!r}")
+
+    a1, a2 = _traceback_nw(seq1, seq2, dirs)
+    return a1, a2, score
+
+
+def _tabela_numpy(seq1, seq2, matriz_subst):
+    """Codifica duas sequências como arrays de inteiros e obtém a tabela densa.
+
+    Usa a versão compilada da matriz (:func:`compilar_matriz`): cada sequência é
+    convertida num array de índices do alfabeto e a matriz é o array 2D
+    ``tabela[índice_a, índice_b]``.
+
+    Args:
+        seq1 (str): Primeira sequência.
+        seq2 (str): Segunda sequência.
+        matriz_subst (dict | SubstitutionMatrix): Matriz de substituição.
+
+    Returns:
+        tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: ``(tabela, cod1, cod2)``.
+
+    Raises:
+        KeyError: Se faltar na matriz algum símbolo (ou par de símbolos) das sequências.
+        ValueError: Se a matriz tiver scores não inteiros.
+    """
+    sm = compilar_matriz(matriz_subst)
+    if not sm.inteira:
+        raise ValueError("O motor NumPy só suporta matrizes com scores inteiros.")
+    cod1, cod2 = sm.codificar_par(seq1, seq2)
+    return sm.array, np.array(cod1, dtype=np.intp), np.array(cod2, dtype=np.intp)
+
+
+def _preencher_nw_numpy(seq1, seq2, matriz_subst, gap):
+    """Preenche a matriz de Needleman–Wunsch de forma vetorizada (NumPy).
+
+    Cada linha ``i`` é calculada com operações sobre arrays:
+
+    1) os candidatos diagonal e cima dependem apenas da linha ``i-1``, logo são
+       calculados de uma vez para todas as colunas;
+    2) a dependência à esquerda (``m[i][j-1] + gap``) é resolvida com um máximo
+       acumulado, usando ``m[i][j] = max_k (cand[k] + (j-k)*gap)``;
+    3) a direção de cada célula é obtida comparando o valor final com os
+       candidatos diagonal e cima.
+
+    Só duas linhas de scores são mantidas. Os scores são inteiros (``int64``),
+    por isso as direções são idênticas às de :func:`_preencher_nw` e o traceback
+    mantém a mesma ordem de desempate.
+
+    Args:
+        seq1 (str): Primeira sequência (linhas).
+        seq2 (str): Segunda sequência (colunas).
+        matriz_subst (dict | SubstitutionMatrix): Matriz de substituição.
+        gap (int): Penalização linear de gap.
+
+    Returns:
+        tuple[int, bytearray]: ``(score, dirs)``, com as direções no formato de
+        :func:`_preencher_nw`.
+
+    Raises:
+        ImportError: Se o NumPy não estiver instalado.
+        KeyError: Se a matriz de substituição não contiver símbolos usados.
+        ValueError: Se os scores ou o ``gap`` não forem inteiros.
+    """
+    if np is None:
+        raise ImportError("O motor 'numpy' requer o pacote NumPy.")
+    if not isinstance(gap, Integral):
+        raise ValueError("O motor NumPy só suporta penalizações de gap inteiras.")
+
+    tabela, cod1, cod2 = _tabela_numpy(seq1, seq2, matriz_subst)
     rows, cols = len(seq1)+1, len(seq2)+1
-    m = [[0]*cols for _ in range(rows)]
+    desloc = np.arange(cols, dtype=np.int64) * gap
 
-    for i in range(1, rows):
-        m[i][0] = m[i-1][0] + gap
-    for j in range(1, cols):
-        m[0][j] = m[0][j-1] + gap
+    # o array NumPy escreve diretamente no buffer do bytearray (sem cópia)
+    dirs = bytearray(rows*cols)
+    vista = np.frombuffer(dirs, dtype=np.uint8).reshape(rows, cols)
+    vista[0, 1:] = _ESQ
+    vista[1:, 0] = _CIMA
+    # scores de substituição por símbolo de seq1, já alinhados com as colunas de seq2
+    perfis = tabela[:, cod2]
 
+    ant = desloc.copy()
     for i in range(1, rows):
-        for j in range(1, cols):
-            diag = m[i-1][j-1] + score_subst(seq1[i-1], seq2[j-1], matriz_subst)
-            cima = m[i-1][j] + gap
-            esq  = m[i][j-1] + gap
-            m[i][j] = max(diag, cima, esq)
+        linha = np.empty(cols, dtype=np.int64)
+        linha[0] = i*gap
+        diag = ant[:-1] + perfis[cod1[i-1]]
+        cima = ant[1:] + gap
+        np.maximum(diag, cima, out=linha[1:])
+        np.maximum.accumulate(linha - desloc, out=linha)
+        linha += desloc
+        vista[i, 1:] = np.where(linha[1:] == diag, _DIAG, np.where(linha[1:] == cima, _CIMA, _ESQ))
+        ant = linha
 
-    return _traceback_nw(seq1, seq2, m, matriz_subst, gap)
+    return int(ant[-1]), dirs
 
 
-def _traceback_nw(seq1, seq2, m, matriz_subst, gap):
-    """Reconstrói um alinhamento global ótimo a partir da matriz de scores.
+def _traceback_nw(seq1, seq2, dirs):
+    """Reconstrói um alinhamento global ótimo a partir das direções guardadas.
 
-    Esta função percorre a matriz ``m`` do canto inferior direito para o superior
-    esquerdo, escolhendo transições compatíveis com o score ótimo (diagonal,
-    cima, esquerda), gerando duas strings alinhadas (com gaps).
+    Parte do canto inferior direito ``(len(seq1), len(seq2))`` e segue os
+    ponteiros de :func:`_preencher_nw` até ``(0, 0)`` (ver :func:`_traceback_sw`).
 
     Args:
         seq1 (str): Primeira sequência original.
         seq2 (str): Segunda sequência original.
-        m (list[list[int | float]]): Matriz de programação dinâmica já preenchida.
-        matriz_subst (dict): Matriz de substituição usada no preenchimento.
-        gap (int): Penalização linear de gap usada no preenchimento.
+        dirs (bytearray): Direções por célula (``(len(seq1)+1)*(len(seq2)+1)`` bytes).
 
     Returns:
-        tuple[str, str, int | float]: Triplo ``(seq1_alinhada, seq2_alinhada, score_final)``.
-
-    Raises:
-        KeyError: Se a matriz de substituição não contiver símbolos necessários
-            para comparar durante o traceback.
-        IndexError: Se for chamado com ``m`` incompatível com os comprimentos de
-            ``seq1`` e ``seq2``.
+        tuple[str, str]: ``(seq1_alinhada, seq2_alinhada)``.
 
     Notes:
         Em empates, a preferência de caminho é:
@@ -142,25 +585,609 @@ def _traceback_nw(seq1, seq2, m, matriz_subst, gap):
         >>> (a1, a2, sc)
         ('A', 'A', 4)
     """
+    return _traceback_sw(seq1, seq2, dirs, (len(seq1), len(seq2)))
+
+
+def _preencher_nw(seq1, seq2, matriz_subst, gap, direcoes=False):
+    """Preenche a matriz de Needleman–Wunsch com duas linhas "rolantes".
+
+    Só a linha anterior e a atual são mantidas, pelo que a memória de scores é
+    ``O(len(seq2))``. Opcionalmente, guarda por cada célula um byte com a
+    direção escolhida (``_DIAG``, ``_CIMA``, ``_ESQ``; ``_FIM`` em ``(0, 0)``),
+    com a ordem de desempate diagonal > cima > esquerda.
+
+    Args:
+        seq1 (str): Primeira sequência (linhas).
+        seq2 (str): Segunda sequência (colunas).
+        matriz_subst (dict | SubstitutionMatrix): Matriz de substituição.
+        gap (int): Penalização linear de gap.
+        direcoes (bool, optional): Se ``True``, devolve também as direções.
+
+    Returns:
+        tuple[list[int | float], bytearray | None]: ``(ultima_linha, dirs)``, onde
+        ``ultima_linha`` é a linha ``len(seq1)`` da matriz e ``dirs`` as direções
+        em ordem de linhas (``None`` se ``direcoes`` for ``False``).
+
+    Raises:
+        KeyError: Se a matriz de substituição não contiver algum símbolo usado.
+
+    Examples:
+        >>> _preencher_nw("A", "AT", BLOSUM62, -5)
+        ([-5, 4, -1], None)
+    """
+    sm = compilar_matriz(matriz_subst)
+    cod1, cod2 = sm.codificar_par(seq1, seq2)
+    cols = len(seq2)+1
+    dirs = None
+    if direcoes:
+        dirs = bytearray((len(seq1)+1)*cols)
+        dirs[1:cols] = bytes([_ESQ])*(cols-1)
+
+    ant = [j*gap for j in range(cols)]
+    for i in range(1, len(seq1)+1):
+        linha_subst = sm.tabela[cod1[i-1]]
+        atual = [i*gap] + [0]*len(seq2)
+        base = i*cols
+        valor = i*gap
+        if dirs is None:
+            for j in range(1, cols):
+                diag = ant[j-1] + linha_subst[cod2[j-1]]
+                cima = ant[j] + gap
+                valor += gap
+                if cima > valor:
+                    valor = cima
+                if diag > valor:
+                    valor = diag
+                atual[j] = valor
+        else:
+            # comparações encadeadas em vez de max() + igualdades: a direção
+            # sai do mesmo ramo que escolhe o valor
+            dirs[base] = _CIMA
+            for j in range(1, cols):
+                diag = ant[j-1] + linha_subst[cod2[j-1]]
+                cima = ant[j] + gap
+                valor += gap
+                if diag >= cima and diag >= valor:
+                    valor = diag
+                    dirs[base+j] = _DIAG
+                elif cima >= valor:
+                    valor = cima
+                    dirs[base+j] = _CIMA
+                else:
+                    dirs[base+j] = _ESQ
+                atual[j] = valor
+        ant = atual
+    return ant, dirs
+
+
+def score_global(seq1, seq2, matriz_subst=BLOSUM62, gap=-5):
+    """Calcula apenas o score ótimo de alinhamento global (sem traceback).
+
+    Equivale a ``needleman_wunsch(seq1, seq2, matriz_subst, gap)[2]``, mas usa
+    duas linhas rolantes e não reconstrói o alinhamento, pelo que é indicado para
+    comparar muitos pares (ex.: em :func:`alinhamento_multiplo`).
+
+    Args:
+        seq1 (str): Primeira sequência.
+        seq2 (str): Segunda sequência.
+        matriz_subst (dict | SubstitutionMatrix, optional): Matriz de substituição. Por omissão ``BLOSUM62``.
+        gap (int, optional): Penalização linear de gap. Por omissão ``-5``.
+
+    Returns:
+        int | float: Score ótimo do alinhamento global.
+
+    Raises:
+        KeyError: Se a matriz de substituição não contiver algum símbolo usado.
+
+    Examples:
+        >>> score_global("ACGT", "AGT") == needleman_wunsch("ACGT", "AGT")[2]
+        True
+    """
+    return _preencher_nw(seq1, seq2, matriz_subst, gap)[0][-1]
+
+
+def score_local(seq1, seq2, matriz_subst=BLOSUM62, gap=-5):
+    """Calcula apenas o score ótimo de alinhamento local (sem traceback).
+
+    Equivale a ``smith_waterman(seq1, seq2, matriz_subst, gap)[2]``, usando duas
+    linhas rolantes em vez da matriz completa.
+
+    Args:
+        seq1 (str): Primeira sequência.
+        seq2 (str): Segunda sequência.
+        matriz_subst (dict | SubstitutionMatrix, optional): Matriz de substituição. Por omissão ``BLOSUM62``.
+        gap (int, optional): Penalização linear de gap. Por omissão ``-5``.
+
+    Returns:
+        int | float: Score do melhor alinhamento local (``0`` se não houver nenhum positivo).
+
+    Raises:
+        KeyError: Se a matriz de substituição não contiver algum símbolo usado.
+
+    Examples:
+        >>> score_local("ACGT", "TACG") == smith_waterman("ACGT", "TACG")[2]
+        True
+    """
+    return _preencher_sw(seq1, seq2, matriz_subst, gap)[0]
+
+
+def hirschberg(seq1, seq2, matriz_subst=BLOSUM62, gap=-5):
+    """Executa alinhamento global ótimo em memória linear (Hirschberg).
+
+    Usa a estratégia de divisão e conquista de Hirschberg: ``seq1`` é dividida ao
+    meio, a última linha de Needleman–Wunsch é calculada para a metade esquerda
+    (no sentido direto) e para a metade direita (no sentido inverso), e o ponto
+    de corte em ``seq2`` é o que maximiza a soma das duas. As duas metades são
+    depois alinhadas recursivamente.
+
+    A semântica de scoring é a de :func:`needleman_wunsch` (``matriz_subst`` e gap
+    linear), e o score devolvido é sempre igual ao ótimo global. O tempo é
+    ``O(len(seq1)*len(seq2))`` e a memória ``O(len(seq1)+len(seq2))``.
+
+    Args:
+        seq1 (str): Primeira sequência a alinhar.
+        seq2 (str): Segunda sequência a alinhar.
+        matriz_subst (dict | SubstitutionMatrix, optional): Matriz de substituição. Por omissão ``BLOSUM62``.
+        gap (int, optional): Penalização linear de gap. Por omissão ``-5``.
+
+    Returns:
+        tuple[str, str, int | float]: Triplo ``(seq1_alinhada, seq2_alinhada, score)``.
+
+    Raises:
+        KeyError: Se a matriz de substituição não contiver algum símbolo presente
+            nas sequências.
+
+    Notes:
+        Quando existem vários alinhamentos ótimos, o alinhamento escolhido pode
+        diferir do de :func:`needleman_wunsch` (o score é o mesmo).
+
+    Examples:
+        >>> hirschberg("ACGT", "AGT")[2] == needleman_wunsch("ACGT", "AGT")[2]
+        True
+    """
+    matriz_subst = compilar_matriz(matriz_subst)
+    a1, a2 = [], []
+    _hirschberg(seq1, seq2, matriz_subst, gap, a1, a2)
+
+    score = 0
+    for c1, c2 in zip(a1, a2):
+        score += gap if "-" in (c1, c2) else score_subst(c1, c2, matriz_subst)
+    return "".join(a1), "".join(a2), score
+
+
+def _hirschberg(seq1, seq2, matriz_subst, gap, a1, a2):
+    """Passo recursivo de :func:`hirschberg`.
+
+    Acrescenta às listas ``a1`` e ``a2`` as colunas do alinhamento ótimo de
+    ``seq1`` com ``seq2``. Os casos base (uma das sequências vazia, ou ``seq1``
+    com um único símbolo) são resolvidos diretamente, em memória ``O(len(seq2))``.
+
+    Args:
+        seq1 (str): Primeira (sub)sequência.
+        seq2 (str): Segunda (sub)sequência.
+        matriz_subst (dict | SubstitutionMatrix): Matriz de substituição.
+        gap (int): Penalização linear de gap.
+        a1 (list[str]): Colunas já alinhadas de ``seq1`` (modificada in-place).
+        a2 (list[str]): Colunas já alinhadas de ``seq2`` (modificada in-place).
+    """
+    if not seq1:
+        a1.extend("-" * len(seq2))
+        a2.extend(seq2)
+    elif not seq2:
+        a1.extend(seq1)
+        a2.extend("-" * len(seq1))
+    elif len(seq1) == 1:
+        r1, r2, _ = needleman_wunsch(seq1, seq2, matriz_subst, gap)
+        a1.extend(r1)
+        a2.extend(r2)
+    else:
+        meio = len(seq1) // 2
+        esquerda, _ = _preencher_nw(seq1[:meio], seq2, matriz_subst, gap)
+        direita, _ = _preencher_nw(seq1[meio:][::-1], seq2[::-1], matriz_subst, gap)
+        n = len(seq2)
+        corte = max(range(n+1), key=lambda k: esquerda[k] + direita[n-k])
+        _hirschberg(seq1[:meio], seq2[:corte], matriz_subst, gap, a1, a2)
+        _hirschberg(seq1[meio:], seq2[corte:], matriz_subst, gap, a1, a2)
+
+
+def needleman_wunsch_banda(seq1, seq2, matriz_subst=BLOSUM62, gap=-5, k=10):
+    """Executa alinhamento global (Needleman–Wunsch) restrito a uma banda diagonal.
+
+    Só são calculadas as células ``(i, j)`` com ``|i - j| <= k``, pelo que o custo
+    é ``O(k*len(seq1))`` em vez de ``O(len(seq1)*len(seq2))``. É indicado para
+    sequências quase idênticas (ex.: amplicões re-sequenciados).
+
+    A banda é alargada automaticamente: ``k`` nunca é inferior a
+    ``|len(seq1) - len(seq2)|`` (para que o canto final esteja dentro da banda) e,
+    enquanto o score da banda não superar um limite superior para qualquer
+    caminho que saia dela (ver :func:`_limite_fora_banda`), ``k`` é duplicado e o
+    alinhamento é recalculado. O score devolvido é, por isso, sempre igual ao de
+    :func:`needleman_wunsch`.
+
+    Args:
+        seq1 (str): Primeira sequência a alinhar.
+        seq2 (str): Segunda sequência a alinhar.
+        matriz_subst (dict | SubstitutionMatrix, optional): Matriz de substituição. Por omissão ``BLOSUM62``.
+        gap (int, optional): Penalização linear de gap. Por omissão ``-5``.
+        k (int, optional): Meia-largura inicial da banda. Por omissão ``10``.
+
+    Returns:
+        tuple[str, str, int | float]: Triplo ``(seq1_alinhada, seq2_alinhada, score)``.
+
+    Raises:
+        ValueError: Se ``k`` for negativo.
+        KeyError: Se a matriz de substituição não contiver algum símbolo presente
+            nas sequências.
+
+    Examples:
+        >>> needleman_wunsch_banda("ACGTACGT", "ACGTCGT", k=1)
+        ('ACGTACGT', 'ACGT-CGT', 39)
+    """
+    if k < 0:
+        raise ValueError("A meia-largura da banda k tem de ser >= 0.")
+
+    maior = max(len(seq1), len(seq2))
+    k = max(k, abs(len(seq1) - len(seq2)))
+    while True:
+        linhas = _preencher_banda(seq1, seq2, matriz_subst, gap, k)
+        if k >= maior or linhas[-1][-1] > _limite_fora_banda(seq1, seq2, matriz_subst, gap, k):
+            return _traceback_banda(seq1, seq2, linhas, matriz_subst, gap, k)
+        k = max(2*k, 1)
+
+
+def _limite_fora_banda(seq1, seq2, matriz_subst, gap, k):
+    """Calcula um limite superior para o score de caminhos que saem da banda.
+
+    Um caminho global com ``D`` diagonais, ``U`` movimentos para cima e ``L``
+    para a esquerda (``U - L = len(seq1) - len(seq2)``) só sai da banda
+    ``|i - j| <= k`` se ``U > k`` ou ``L > k``. As ``D`` diagonais usam linhas
+    distintas de ``seq1``, pelo que somam no máximo os ``D`` maiores máximos por
+    linha (e, do mesmo modo, os ``D`` maiores máximos por coluna); os gaps custam
+    exatamente ``(U + L) * gap``. O limite é o máximo desta estimativa sobre os
+    ``U`` (ou ``L``) possíveis.
+
+    Args:
+        seq1 (str): Primeira sequência (linhas).
+        seq2 (str): Segunda sequência (colunas).
+        matriz_subst (dict | SubstitutionMatrix): Matriz de substituição.
+        gap (int): Penalização linear de gap.
+        k (int): Meia-largura da banda.
+
+    Returns:
+        int | float: Limite superior, ou ``-inf`` se nenhum caminho puder sair
+        da banda.
+    """
+    sm = compilar_matriz(matriz_subst)
+    cod1, cod2 = sm.codificar_par(seq1, seq2)
+    n, m = len(cod1), len(cod2)
+    if not n or not m:
+        return float("-inf")
+    simb1, simb2 = set(cod1), set(cod2)
+    max_linha = {a: max(sm.tabela[a][b] for b in simb2) for a in simb1}
+    max_coluna = {b: max(sm.tabela[a][b] for a in simb1) for b in simb2}
+
+    def somas_menores(valores):
+        # somas[u] = soma dos u menores valores
+        somas = [0]
+        for v in sorted(valores):
+            somas.append(somas[-1] + v)
+        return somas
+
+    menores_l = somas_menores(max_linha[a] for a in cod1)
+    menores_c = somas_menores(max_coluna[b] for b in cod2)
+    total_l, total_c = menores_l[-1], menores_c[-1]
+
+    limite = float("-inf")
+    for u in range(max(0, n-m), n+1):
+        l = u - (n-m)
+        if u > k or l > k:
+            estimativa = min(total_l - menores_l[u], total_c - menores_c[l]) + (u+l)*gap
+            limite = max(limite, estimativa)
+    return limite
+
+
+def _preencher_banda(seq1, seq2, matriz_subst, gap, k):
+    """Preenche a matriz de Needleman–Wunsch apenas dentro da banda ``|i-j| <= k``.
+
+    Cada linha ``i`` guarda só as colunas ``max(0, i-k) .. min(len(seq2), i+k)``;
+    as células fora da banda valem ``-inf``.
+
+    Args:
+        seq1 (str): Primeira sequência (linhas).
+        seq2 (str): Segunda sequência (colunas).
+        matriz_subst (dict | SubstitutionMatrix): Matriz de substituição.
+        gap (int): Penalização linear de gap.
+        k (int): Meia-largura da banda.
+
+    Returns:
+        list[list[int | float]]: Linhas da banda (a linha ``i`` começa na coluna
+        ``max(0, i-k)``).
+    """
+    sm = compilar_matriz(matriz_subst)
+    cod1, cod2 = sm.codificar_par(seq1, seq2)
+    neg = float("-inf")
+    linhas = []
+    for i in range(len(seq1)+1):
+        lo, hi = max(0, i-k), min(len(seq2), i+k)
+        linha = [0]*(hi-lo+1)
+        for j in range(lo, hi+1):
+            if i == 0:
+                linha[j-lo] = j*gap
+            elif j == 0:
+                linha[j-lo] = i*gap
+            else:
+                ant, lo_ant = linhas[i-1], max(0, i-1-k)
+                diag = ant[j-1-lo_ant] + sm.tabela[cod1[i-1]][cod2[j-1]]
+                cima = ant[j-lo_ant] + gap if j <= i-1+k else neg
+                esq  = linha[j-1-lo] + gap if j > lo else neg
+                linha[j-lo] = max(diag, cima, esq)
+        linhas.append(linha)
+    return linhas
+
+
+def _traceback_banda(seq1, seq2, linhas, matriz_subst, gap, k):
+    """Reconstrói o alinhamento global a partir da matriz em banda.
+
+    Usa a mesma ordem de desempate de :func:`_traceback_nw` (diagonal, cima,
+    esquerda).
+
+    Args:
+        seq1 (str): Primeira sequência original.
+        seq2 (str): Segunda sequência original.
+        linhas (list[list[int | float]]): Banda preenchida por :func:`_preencher_banda`.
+        matriz_subst (dict | SubstitutionMatrix): Matriz de substituição usada no preenchimento.
+        gap (int): Penalização linear de gap usada no preenchimento.
+        k (int): Meia-largura da banda.
+
+    Returns:
+        tuple[str, str, int | float]: ``(seq1_alinhada, seq2_alinhada, score)``.
+    """
+    def valor(i, j):
+        lo = max(0, i-k)
+        if lo <= j <= min(len(seq2), i+k):
+            return linhas[i][j-lo]
+        return float("-inf")
+
     i, j = len(seq1), len(seq2)
-    a1, a2 = "", ""
+    a1, a2 = [], []
 
     while i > 0 or j > 0:
-        if i > 0 and j > 0 and m[i][j] == m[i-1][j-1] + score_subst(seq1[i-1], seq2[j-1], matriz_subst):
-            a1 += seq1[i-1]
-            a2 += seq2[j-1]
+        atual = valor(i, j)
+        if i > 0 and j > 0 and atual == valor(i-1, j-1) + score_subst(seq1[i-1], seq2[j-1], matriz_subst):
+            a1.append(seq1[i-1])
+            a2.append(seq2[j-1])
             i -= 1
             j -= 1
-        elif i > 0 and m[i][j] == m[i-1][j] + gap:
-            a1 += seq1[i-1]
-            a2 += "-"
+        elif i > 0 and atual == valor(i-1, j) + gap:
+            a1.append(seq1[i-1])
+            a2.append("-")
             i -= 1
         else:
-            a1 += "-"
-            a2 += seq2[j-1]
+            a1.append("-")
+            a2.append(seq2[j-1])
             j -= 1
 
-    return a1[::-1], a2[::-1], m[len(seq1)][len(seq2)]
+    return "".join(reversed(a1)), "".join(reversed(a2)), linhas[-1][-1]
+
+
+def alinhamento_semiglobal(seq1, seq2, matriz_subst=BLOSUM62, gap=-5, livre_inicio1=False,
+                           livre_fim1=False, livre_inicio2=False, livre_fim2=False):
+    """Executa alinhamento semi-global, com gaps terminais gratuitos configuráveis.
+
+    É um Needleman–Wunsch em que cada extremidade de cada sequência pode ficar
+    por alinhar sem penalização: ``livre_inicio1``/``livre_fim1`` deixam um
+    prefixo/sufixo de ``seq1`` sem par, e ``livre_inicio2``/``livre_fim2`` o
+    mesmo para ``seq2``. Com todas as opções a ``False`` equivale a
+    :func:`needleman_wunsch`; com as de ``seq2`` a ``True`` encontra o melhor
+    local de ``seq2`` para ``seq1`` inteira (ex.: uma read numa referência).
+
+    Args:
+        seq1 (str): Primeira sequência.
+        seq2 (str): Segunda sequência.
+        matriz_subst (dict | SubstitutionMatrix, optional): Matriz de substituição.
+            Por omissão ``BLOSUM62``.
+        gap (int, optional): Penalização linear de gap. Por omissão ``-5``.
+        livre_inicio1 (bool, optional): Prefixo de ``seq1`` por alinhar é gratuito.
+        livre_fim1 (bool, optional): Sufixo de ``seq1`` por alinhar é gratuito.
+        livre_inicio2 (bool, optional): Prefixo de ``seq2`` por alinhar é gratuito.
+        livre_fim2 (bool, optional): Sufixo de ``seq2`` por alinhar é gratuito.
+
+    Returns:
+        tuple[str, str, int | float]: ``(seq1_alinhada, seq2_alinhada, score)``.
+        As sequências alinhadas incluem as extremidades livres (frente a gaps),
+        que não contam para o score.
+
+    Raises:
+        KeyError: Se a matriz de substituição não contiver algum símbolo presente
+            nas sequências.
+
+    Notes:
+        Em empates entre pontos finais é preferido o canto ``(len(seq1),
+        len(seq2))``, isto é, o alinhamento sem gaps terminais.
+
+    Examples:
+        >>> alinhamento_semiglobal("ACGT", "TTACGTTT", livre_inicio2=True, livre_fim2=True)
+        ('--ACGT--', 'TTACGTTT', 24)
+    """
+    sm = compilar_matriz(matriz_subst)
+    cod1, cod2 = sm.codificar_par(seq1, seq2)
+    n, m = len(cod1), len(cod2)
+    cols = m+1
+    dirs = bytearray((n+1)*cols)
+    if not livre_inicio2:
+        dirs[1:cols] = bytes([_ESQ])*m
+
+    ant = [0 if livre_inicio2 else j*gap for j in range(cols)]
+    ultima_coluna = [ant[m]]
+    for i in range(1, n+1):
+        linha_subst = sm.tabela[cod1[i-1]]
+        valor = 0 if livre_inicio1 else i*gap
+        atual = [valor] + [0]*m
+        base = i*cols
+        if not livre_inicio1:
+            dirs[base] = _CIMA
+        for j in range(1, cols):
+            diag = ant[j-1] + linha_subst[cod2[j-1]]
+            cima = ant[j] + gap
+            valor += gap
+            if diag >= cima and diag >= valor:
+                valor = diag
+                dirs[base+j] = _DIAG
+            elif cima >= valor:
+                valor = cima
+                dirs[base+j] = _CIMA
+            else:
+                dirs[base+j] = _ESQ
+            atual[j] = valor
+        ultima_coluna.append(atual[m])
+        ant = atual
+
+    score, fim = ant[m], (n, m)
+    if livre_fim1:
+        for i, valor in enumerate(ultima_coluna):
+            if valor > score:
+                score, fim = valor, (i, m)
+    if livre_fim2:
+        for j, valor in enumerate(ant):
+            if valor > score:
+                score, fim = valor, (n, j)
+
+    i, j = fim
+    a1, a2 = _traceback_sw(seq1, seq2, dirs, fim)
+    i0, j0 = i - (len(a1) - a1.count("-")), j - (len(a2) - a2.count("-"))
+    a1 = seq1[:i0] + "-"*j0 + a1 + seq1[i:] + "-"*(m-j)
+    a2 = "-"*i0 + seq2[:j0] + a2 + "-"*(n-i) + seq2[j:]
+    return a1, a2, score
+
+
+_BLOCO_MAPEAMENTO = 1 << 16
+"""int: Número de posições da referência processadas de cada vez em ``mapear_read(motor="numpy")``."""
+
+
+def mapear_read(read, referencia, matriz_subst=BLOSUM62, gap=-5, motor="python"):
+    """Localiza uma read numa referência longa (alinhamento semi-global).
+
+    A read tem de ser alinhada por inteiro, mas as extremidades da referência
+    são gratuitas (como :func:`alinhamento_semiglobal` com ``livre_inicio2`` e
+    ``livre_fim2``). O preenchimento percorre a referência coluna a coluna,
+    guardando só duas colunas de ``len(read) + 1`` scores e, em cada célula, a
+    posição da referência onde o seu caminho começou; a memória é por isso
+    ``O(len(read))`` e o tempo ``O(len(read) * len(referencia))``. O alinhamento
+    em si pode depois ser obtido com ``needleman_wunsch(read,
+    referencia[inicio:fim])``.
+
+    Args:
+        read (str): Sequência curta a localizar.
+        referencia (str): Sequência de referência.
+        matriz_subst (dict | SubstitutionMatrix, optional): Matriz de substituição.
+            Por omissão ``BLOSUM62``.
+        gap (int, optional): Penalização linear de gap. Por omissão ``-5``.
+        motor (str, optional): ``"python"`` (por omissão) ou ``"numpy"``, que
+            processa blocos de ``_BLOCO_MAPEAMENTO`` posições da referência de
+            cada vez (memória ``O(len(read) + bloco)``). Ambos devolvem o mesmo
+            resultado.
+
+    Returns:
+        tuple[int | float, int, int]: ``(score, inicio, fim)``, onde
+        ``referencia[inicio:fim]`` é a região onde a read alinha. Em empates é
+        devolvida a região que termina mais cedo.
+
+    Raises:
+        KeyError: Se a matriz de substituição não contiver algum símbolo presente
+            nas sequências.
+        ValueError: Se ``motor`` for desconhecido, ou se ``motor="numpy"`` for usado
+            com scores não inteiros.
+        ImportError: Se ``motor="numpy"`` for pedido sem o NumPy instalado.
+
+    Examples:
+        >>> mapear_read("ACGT", "TTTTACGTTTTT")
+        (24, 4, 8)
+    """
+    if motor == "numpy":
+        return _mapear_read_numpy(read, referencia, matriz_subst, gap)
+    if motor != "python":
+        raise ValueError(f"Motor desconhecido: {motor!r}")
+
+    sm = compilar_matriz(matriz_subst)
+    simbolos = "".join(set(referencia))
+    cod_read, cod_simb = sm.codificar_par(read, simbolos)
+    # scores de cada posição da read contra cada símbolo da referência
+    perfil = {b: [sm.tabela[a][cb] for a in cod_read] for b, cb in zip(simbolos, cod_simb)}
+    m = len(read)
+
+    ant = [i*gap for i in range(m+1)]
+    ini_ant = [0]*(m+1)
+    melhor, inicio, fim = ant[m], 0, 0
+    for j, b in enumerate(referencia, 1):
+        coluna_subst = perfil[b]
+        atual, ini = [0]*(m+1), [j]*(m+1)
+        valor, origem = 0, j
+        for i in range(1, m+1):
+            diag = ant[i-1] + coluna_subst[i-1]
+            cima = valor + gap
+            esq = ant[i] + gap
+            if diag >= cima and diag >= esq:
+                valor, origem = diag, ini_ant[i-1]
+            elif cima >= esq:
+                valor = cima
+            else:
+                valor, origem = esq, ini_ant[i]
+            atual[i], ini[i] = valor, origem
+        if atual[m] > melhor:
+            melhor, inicio, fim = atual[m], ini[m], j
+        ant, ini_ant = atual, ini
+    return melhor, inicio, fim
+
+
+def _mapear_read_numpy(read, referencia, matriz_subst, gap):
+    """Motor NumPy de :func:`mapear_read`, vetorizado ao longo da referência.
+
+    A referência é processada em blocos; dentro de cada bloco, cada posição da
+    read é uma linha calculada de uma vez. A dependência horizontal (gap na
+    read) é resolvida com um máximo acumulado, como em
+    :func:`_preencher_nw_numpy`, e a origem de cada célula com o índice do último
+    máximo. Entre blocos passa apenas a última coluna (scores e origens).
+
+    Raises:
+        ImportError: Se o NumPy não estiver instalado.
+        ValueError: Se os scores ou o ``gap`` não forem inteiros.
+    """
+    if np is None:
+        raise ImportError("O motor 'numpy' requer o pacote NumPy.")
+    if not isinstance(gap, Integral):
+        raise ValueError("O motor NumPy só suporta penalizações de gap inteiras.")
+    m = len(read)
+    coluna_h = np.arange(m+1, dtype=np.int64) * gap
+    coluna_ini = np.zeros(m+1, dtype=np.int64)
+    melhor, inicio, fim = int(coluna_h[m]), 0, 0
+
+    for b0 in range(0, len(referencia), _BLOCO_MAPEAMENTO):
+        tabela, cod_read, bloco = _tabela_numpy(read, referencia[b0:b0+_BLOCO_MAPEAMENTO], matriz_subst)
+        largura = len(bloco)
+        k = np.arange(largura+1, dtype=np.int64)
+        h = np.zeros(largura, dtype=np.int64)
+        ini = np.arange(b0+1, b0+largura+1, dtype=np.int64)
+        nova_h, nova_ini = np.empty_like(coluna_h), np.empty_like(coluna_ini)
+        nova_h[0], nova_ini[0] = 0, b0+largura
+        for i in range(1, m+1):
+            diag = np.concatenate(([coluna_h[i-1]], h[:-1])) + tabela[cod_read[i-1], bloco]
+            ini_diag = np.concatenate(([coluna_ini[i-1]], ini[:-1]))
+            cima = h + gap
+            usa_diag = diag >= cima
+            t = np.concatenate(([coluna_h[i]], np.where(usa_diag, diag, cima)))
+            ini_t = np.concatenate(([coluna_ini[i]], np.where(usa_diag, ini_diag, ini)))
+            # h[j] = max_{k<=j}(t[k] + (j-k)*gap); a origem é a do último k que atinge o máximo
+            u = t - k*gap
+            acumulado = np.maximum.accumulate(u)
+            origem = np.maximum.accumulate(np.where(u == acumulado, k, 0))
+            h = (acumulado + k*gap)[1:]
+            ini = ini_t[origem][1:]
+            nova_h[i], nova_ini[i] = h[-1], ini[-1]
+        pos = int(np.argmax(h))
+        if h[pos] > melhor:
+            melhor, inicio, fim = int(h[pos]), int(ini[pos]), b0+pos+1
+        coluna_h, coluna_ini = nova_h, nova_ini
+    return melhor, inicio, fim
 
 
 def smith_waterman(seq1, seq2, matriz_subst=BLOSUM62, gap=-5):
@@ -174,7 +1201,7 @@ def smith_waterman(seq1, seq2, matriz_subst=BLOSUM62, gap=-5):
     Args:
         seq1 (str): Primeira sequência a alinhar.
         seq2 (str): Segunda sequência a alinhar.
-        matriz_subst (dict, optional): Matriz de substituição (ex.: BLOSUM/PAM ou
+        matriz_subst (dict | SubstitutionMatrix, optional): Matriz de substituição (ex.: BLOSUM/PAM ou
             matriz custom). Por omissão usa ``BLOSUM62``.
         gap (int, optional): Penalização linear de gap (inserção/deleção).
             Por omissão ``-5``.
@@ -192,44 +1219,89 @@ def smith_waterman(seq1, seq2, matriz_subst=BLOSUM62, gap=-5):
         >>> sc >= 0
         True
     """
-    rows, cols = len(seq1)+1, len(seq2)+1
-    m = [[0]*cols for _ in range(rows)]
-    max_score, max_pos = 0, (0, 0)
+    max_score, max_pos, dirs = _preencher_sw(seq1, seq2, matriz_subst, gap, direcoes=True)
+    a1, a2 = _traceback_sw(seq1, seq2, dirs, max_pos)
+    return a1, a2, max_score
 
-    for i in range(1, rows):
-        for j in range(1, cols):
-            diag = m[i-1][j-1] + score_subst(seq1[i-1], seq2[j-1], matriz_subst)
-            cima = m[i-1][j] + gap
-            esq  = m[i][j-1] + gap
-            m[i][j] = max(0, diag, cima, esq)
-            if m[i][j] > max_score:
-                max_score = m[i][j]
-                max_pos = (i, j)
 
-    return _traceback_sw(seq1, seq2, m, max_pos, matriz_subst, gap)
+def _preencher_sw(seq1, seq2, matriz_subst, gap, direcoes=False):
+    """Preenche a matriz de Smith–Waterman com duas linhas "rolantes".
 
+    Tal como :func:`_preencher_nw`, mantém só duas linhas de scores e,
+    opcionalmente, um byte de direção por célula: ``_FIM`` nas células com
+    score 0 (onde o alinhamento local começa) e ``_DIAG``/``_CIMA``/``_ESQ`` nas
+    restantes, com a ordem de desempate diagonal > cima > esquerda.
 
-def _traceback_sw(seq1, seq2, m, start, matriz_subst, gap):
-    """Reconstrói o melhor alinhamento local a partir da matriz de scores.
+    Args:
+        seq1 (str): Primeira sequência (linhas).
+        seq2 (str): Segunda sequência (colunas).
+        matriz_subst (dict | SubstitutionMatrix): Matriz de substituição.
+        gap (int): Penalização linear de gap.
+        direcoes (bool, optional): Se ``True``, devolve também as direções.
 
-    Começa na posição ``start`` (tipicamente a célula de score máximo) e segue
-    o caminho de traceback até encontrar uma célula com score 0.
+    Returns:
+        tuple[int | float, tuple[int, int], bytearray | None]:
+        ``(max_score, max_pos, dirs)``, onde ``max_pos`` é a primeira célula
+        (por linhas) com o score máximo.
+
+    Raises:
+        KeyError: Se a matriz de substituição não contiver algum símbolo usado.
+    """
+    sm = compilar_matriz(matriz_subst)
+    cod1, cod2 = sm.codificar_par(seq1, seq2)
+    cols = len(seq2)+1
+    dirs = bytearray((len(seq1)+1)*cols) if direcoes else None
+    max_score, max_pos = 0, (0, 0)
+
+    ant = [0]*cols
+    for i in range(1, len(seq1)+1):
+        linha_subst = sm.tabela[cod1[i-1]]
+        atual = [0]*cols
+        base = i*cols
+        esq = 0
+        for j in range(1, cols):
+            diag = ant[j-1] + linha_subst[cod2[j-1]]
+            cima = ant[j] + gap
+            esq += gap
+            if diag >= cima and diag >= esq:
+                valor, d = diag, _DIAG
+            elif cima >= esq:
+                valor, d = cima, _CIMA
+            else:
+                valor, d = esq, _ESQ
+            if valor > 0:
+                if dirs is not None:
+                    dirs[base+j] = d
+                if valor > max_score:
+                    max_score = valor
+                    max_pos = (i, j)
+            else:
+                valor = 0
+            atual[j] = esq = valor
+        ant = atual
+    return max_score, max_pos, dirs
+
+
+def _traceback_sw(seq1, seq2, dirs, start):
+    """Reconstrói um alinhamento seguindo as direções guardadas no preenchimento.
+
+    Começa na posição ``start`` (tipicamente a célula de score máximo) e segue os
+    ponteiros até uma célula marcada com ``_FIM`` (score 0 no alinhamento local,
+    ou ``(0, 0)`` no global). Não volta a consultar a matriz de substituição: as
+    colunas são escritas de trás para a frente num buffer pré-alocado e juntadas
+    uma única vez, pelo que o custo é linear no comprimento do alinhamento.
 
     Args:
         seq1 (str): Primeira sequência original.
         seq2 (str): Segunda sequência original.
-        m (list[list[int | float]]): Matriz de programação dinâmica já preenchida.
+        dirs (bytearray): Direções por célula, em ordem de linhas.
         start (tuple[int, int]): Coordenadas (i, j) do ponto inicial do traceback.
-        matriz_subst (dict): Matriz de substituição usada no preenchimento.
-        gap (int): Penalização linear de gap usada no preenchimento.
 
     Returns:
-        tuple[str, str, int | float]: Triplo ``(subseq1_alinhada, subseq2_alinhada, score_local)``.
+        tuple[str, str]: ``(subseq1_alinhada, subseq2_alinhada)``.
 
     Raises:
-        KeyError: Se a matriz de substituição não contiver símbolos necessários
-            para comparar durante o traceback.
-        IndexError: Se ``start`` estiver fora dos limites de ``m``.
+        IndexError: Se ``start`` estiver fora dos limites de ``dirs``.
 
     Notes:
         Tal como no traceback global, em empates a preferência de caminho é:
@@ -240,27 +1312,1021 @@ def _traceback_sw(seq1, seq2, m, start, matriz_subst, gap):
         >>> sc
         0
     """
+    cols = len(seq2)+1
     i, j = start
-    a1, a2 = "", ""
-    while m[i][j] != 0:
-        if m[i][j] == m[i-1][j-1] + score_subst(seq1[i-1], seq2[j-1], matriz_subst):
-            a1 += seq1[i-1]
-            a2 += seq2[j-1]
+    k = i + j
+    a1, a2 = [None]*k, [None]*k
+
+    while True:
+        d = dirs[i*cols+j]
+        if d == _FIM:
+            break
+        k -= 1
+        if d == _DIAG:
+            a1[k] = seq1[i-1]
+            a2[k] = seq2[j-1]
             i -= 1
             j -= 1
-        elif m[i][j] == m[i-1][j] + gap:
-            a1 += seq1[i-1]
-            a2 += "-"
+        elif d == _CIMA:
+            a1[k] = seq1[i-1]
+            a2[k] = "-"
             i -= 1
         else:
-            a1 += "-"
-            a2 += seq2[j-1]
+            a1[k] = "-"
+            a2[k] = seq2[j-1]
             j -= 1
 
-    return a1[::-1], a2[::-1], m[start[0]][start[1]]
+    return "".join(a1[k:]), "".join(a2[k:])
+
+
+def smith_waterman_multiplos(seq1, seq2, matriz_subst=BLOSUM62, gap=-5, k=None, score_minimo=1):
+    """Produz os melhores alinhamentos locais que não se sobrepõem (Waterman–Eggert).
+
+    A matriz de Smith–Waterman é preenchida uma única vez. Depois de cada
+    alinhamento reportado, as células do seu caminho passam a valer 0 (ficam
+    proibidas) e só são recalculadas as células a jusante cujo valor muda: cada
+    linha é recalculada apenas no intervalo de colunas alterado na linha
+    anterior, e o recálculo pára na primeira linha sem alterações. O máximo de
+    cada linha fica em cache, pelo que escolher o alinhamento seguinte custa
+    ``O(len(seq1))`` mais as linhas efetivamente alteradas.
+
+    Dois alinhamentos produzidos nunca partilham uma célula do caminho (em
+    particular, nenhum par de posições alinhadas). O primeiro resultado é o de
+    :func:`smith_waterman`.
+
+    Args:
+        seq1 (str): Primeira sequência.
+        seq2 (str): Segunda sequência.
+        matriz_subst (dict | SubstitutionMatrix, optional): Matriz de substituição.
+            Por omissão ``BLOSUM62``.
+        gap (int, optional): Penalização linear de gap. Por omissão ``-5``.
+        k (int | None, optional): Número máximo de alinhamentos (``None`` = todos).
+        score_minimo (int | float, optional): Score mínimo de um alinhamento
+            reportado. Por omissão ``1``.
+
+    Yields:
+        tuple[str, str, int | float, tuple[int, int]]:
+        ``(subseq1_alinhada, subseq2_alinhada, score, inicio)``, por ordem
+        decrescente de score, onde ``inicio`` são as posições (base 0) em
+        ``seq1`` e ``seq2`` onde o alinhamento começa.
+
+    Raises:
+        ValueError: Se ``k`` for negativo.
+        KeyError: Se a matriz de substituição não contiver algum símbolo presente
+            nas sequências.
+
+    Notes:
+        Ao contrário de :func:`smith_waterman`, guarda a matriz de scores completa
+        (``O(len(seq1)*len(seq2))`` de memória), necessária para o recálculo.
+
+    Examples:
+        >>> [r[2:] for r in smith_waterman_multiplos("ACGTTTTTACGT", "ACGT", k=2)]
+        [(24, (0, 0)), (24, (8, 0))]
+    """
+    if k is not None and k < 0:
+        raise ValueError("O número de alinhamentos k tem de ser >= 0.")
+    return _gerar_waterman_eggert(seq1, seq2, matriz_subst, gap, k, score_minimo)
+
+
+def _gerar_waterman_eggert(seq1, seq2, matriz_subst, gap, k, score_minimo):
+    """Gerador por trás de :func:`smith_waterman_multiplos`."""
+    sm = compilar_matriz(matriz_subst)
+    cod1, cod2 = sm.codificar_par(seq1, seq2)
+    tab = sm.tabela
+    n, m = len(cod1), len(cod2)
+
+    H = [[0]*(m+1) for _ in range(n+1)]
+    for i in range(1, n+1):
+        ant, atual, linha_subst = H[i-1], H[i], tab[cod1[i-1]]
+        esq = 0
+        for j in range(1, m+1):
+            valor = ant[j-1] + linha_subst[cod2[j-1]]
+            cima = ant[j] + gap
+            esq += gap
+            if cima > valor:
+                valor = cima
+            if esq > valor:
+                valor = esq
+            if valor < 0:
+                valor = 0
+            atual[j] = esq = valor
+
+    def maximo_linha(linha):
+        valor = max(linha)
+        return valor, linha.index(valor)
+
+    maximos = [maximo_linha(linha) for linha in H]
+    proibidas = set()
+    produzidos = 0
+
+    while (k is None or produzidos < k) and n:
+        i = max(range(1, n+1), key=lambda r: (maximos[r][0], -r))
+        score, j = maximos[i]
+        if score <= 0 or score < score_minimo:
+            return
+
+        # traceback pelos valores de H, com a mesma ordem de desempate que
+        # _preencher_sw (diagonal > cima > esquerda)
+        caminho, a1, a2 = [], [], []
+        while H[i][j] > 0:
+            caminho.append((i, j))
+            valor = H[i][j]
+            if valor == H[i-1][j-1] + tab[cod1[i-1]][cod2[j-1]]:
+                a1.append(seq1[i-1])
+                a2.append(seq2[j-1])
+                i -= 1
+                j -= 1
+            elif valor == H[i-1][j] + gap:
+                a1.append(seq1[i-1])
+                a2.append("-")
+                i -= 1
+            else:
+                a1.append("-")
+                a2.append(seq2[j-1])
+                j -= 1
+        yield "".join(reversed(a1)), "".join(reversed(a2)), score, (i, j)
+        produzidos += 1
+
+        por_linha = {}
+        for ci, cj in caminho:
+            proibidas.add((ci, cj))
+            por_linha.setdefault(ci, []).append(cj)
+        _recalcular_waterman_eggert(H, cod1, cod2, tab, gap, proibidas, por_linha, maximos, maximo_linha)
+
+
+def _recalcular_waterman_eggert(H, cod1, cod2, tab, gap, proibidas, por_linha, maximos, maximo_linha):
+    """Recalcula a matriz de Smith–Waterman depois de proibir novas células.
+
+    Percorre as linhas a partir da primeira com células proibidas; em cada linha
+    só recalcula as colunas a partir da primeira alterada (na linha anterior ou
+    proibida nesta), e continua para a direita enquanto houver alterações a
+    propagar. Atualiza o máximo em cache de cada linha alterada.
+    """
+    n, m = len(H)-1, len(H[0])-1
+    ultima = max(por_linha)
+    lo, hi = m+1, -1
+    for i in range(min(por_linha), n+1):
+        novas = por_linha.get(i, ())
+        inicio = min(lo, min(novas)) if novas else lo
+        fim = max(hi+1, max(novas)) if novas else hi+1
+        if inicio > m and i > ultima:
+            break
+        ant, atual, linha_subst = H[i-1], H[i], tab[cod1[i-1]]
+        lo, hi = m+1, -1
+        j = max(inicio, 1)
+        mudou = False
+        while j <= m and (j <= fim or mudou):
+            if (i, j) in proibidas:
+                valor = 0
+            else:
+                valor = max(0, ant[j-1] + linha_subst[cod2[j-1]], ant[j] + gap, atual[j-1] + gap)
+            mudou = valor != atual[j]
+            if mudou:
+                atual[j] = valor
+                lo = min(lo, j)
+                hi = j
+            j += 1
+        if hi >= 0:
+            maximos[i] = maximo_linha(atual)
+
+
+class PerfilQuery:
+    """Perfil de uma query para Smith–Waterman vetorizado.
+
+    O perfil guarda, para cada posição ``i`` da query, a linha da matriz de
+    substituição do seu símbolo (array ``linhas`` de forma ``(len(query),
+    alfabeto)``): os scores da linha ``i`` da matriz de Smith–Waterman contra um
+    alvo codificado são ``linhas[i][cod_alvo]``, obtidos de uma só vez.
+
+    O perfil é calculado uma única vez por query e pode ser reutilizado com muitos
+    alvos em :func:`smith_waterman_vetorizado`.
+
+    Args:
+        query (str): Sequência de consulta (corresponde a ``seq1`` em
+            :func:`smith_waterman`).
+        matriz_subst (dict | SubstitutionMatrix, optional): Matriz de substituição com scores inteiros.
+            Por omissão ``BLOSUM62``.
+        gap (int, optional): Penalização linear de gap (``<= 0``). Por omissão ``-5``.
+
+    Raises:
+        ImportError: Se o NumPy não estiver instalado.
+        KeyError: Se a matriz não contiver algum símbolo da query.
+        ValueError: Se ``gap`` for positivo ou não inteiro, ou se algum score da
+            matriz não for inteiro.
+
+    Examples:
+        >>> PerfilQuery("ACGT").linhas.shape[0]
+        4
+    """
+
+    def __init__(self, query, matriz_subst=BLOSUM62, gap=-5):
+        if np is None:
+            raise ImportError("PerfilQuery requer o pacote NumPy.")
+        if not isinstance(gap, Integral) or gap > 0:
+            raise ValueError("O gap tem de ser um inteiro <= 0.")
+
+        self.query = query
+        self.matriz_subst = compilar_matriz(matriz_subst)
+        if not self.matriz_subst.inteira:
+            raise ValueError("Smith–Waterman vetorizado só suporta scores inteiros.")
+        self.gap = gap
+        self.linhas = self.matriz_subst.array[np.array(self.matriz_subst.codificar(query), dtype=np.intp)]
+
+    def alinhar(self, alvo):
+        """Atalho para ``smith_waterman_vetorizado(self, alvo)``."""
+        return smith_waterman_vetorizado(self, alvo)
+
+
+def smith_waterman_vetorizado(perfil, alvo):
+    """Calcula o score máximo de Smith–Waterman vetorizado ao longo do alvo.
+
+    Cada posição da query é uma linha da matriz calculada de uma vez, como em
+    :func:`_mapear_read_numpy`: os candidatos diagonal, cima e 0 dependem só da
+    linha anterior e a dependência à esquerda (gap na query) é resolvida com um
+    máximo acumulado, ``h[j] = max_k (t[k] + (j-k)*gap)``. São ``len(query)``
+    operações sobre vetores do comprimento do alvo (o caso típico: queries curtas
+    contra alvos longos). O layout *striped* de Farrar, que vetoriza ao longo da
+    query, obriga em NumPy a um ciclo Python por coluna do alvo e fica mais lento
+    do que o próprio :func:`smith_waterman`.
+
+    Os vetores são ``int32`` quando o maior valor intermédio possível cabe no tipo
+    e ``int64`` caso contrário, por isso nunca há overflow.
+
+    Args:
+        perfil (PerfilQuery): Perfil precalculado da query.
+        alvo (str): Sequência alvo (corresponde a ``seq2`` em :func:`smith_waterman`).
+
+    Returns:
+        tuple[int, tuple[int, int]]: ``(max_score, max_pos)``, iguais aos obtidos
+        por :func:`smith_waterman` (``max_pos`` é a primeira célula ``(i, j)`` com o
+        score máximo, percorrendo a matriz por linhas; ``(0, 0)`` se o score for 0).
+
+    Raises:
+        KeyError: Se a matriz de substituição não contiver algum símbolo do alvo
+            (ou par query/alvo).
+
+    Examples:
+        >>> smith_waterman_vetorizado(PerfilQuery("ACGT"), "TACG")
+        (19, (3, 4))
+    """
+    # codificar_par verifica os pares em falta nas matrizes incompletas
+    _, cod_alvo = perfil.matriz_subst.codificar_par(perfil.query, alvo)
+    cod_alvo = np.array(cod_alvo, dtype=np.intp)
+    n, m, g = len(perfil.linhas), len(cod_alvo), perfil.gap
+    if not n or not m:
+        return 0, (0, 0)
+    maximo, minimo = int(perfil.linhas.max(initial=0)), int(perfil.linhas.min(initial=0))
+    # t[k] - k*gap chega a max(H) + m*|gap|; diag desce até ao menor score
+    limite = min(n, m)*maximo + (m+1)*(-g) + maximo - minimo
+    tipo = np.int32 if limite <= np.iinfo(np.int32).max else np.int64
+    linhas = perfil.linhas.astype(tipo)
+    desloc = np.arange(m+1, dtype=tipo) * tipo(g)
+    h = np.zeros(m+1, dtype=tipo)
+    t = np.zeros(m+1, dtype=tipo)
+    u = np.empty_like(t)
+    melhor, melhor_pos = 0, (0, 0)
+
+    for i in range(n):
+        # candidatos diagonal, cima e 0 (t[0] é a coluna 0, sempre 0)
+        np.add(h[:-1], linhas[i][cod_alvo], out=t[1:])
+        np.maximum(t[1:], h[1:] + tipo(g), out=t[1:])
+        np.maximum(t, 0, out=t)
+        # h[j] = max_{k<=j}(t[k] + (j-k)*gap)
+        np.subtract(t, desloc, out=u)
+        np.maximum.accumulate(u, out=h)
+        h += desloc
+        j = int(h.argmax())
+        if h[j] > melhor:
+            melhor, melhor_pos = int(h[j]), (i+1, j)
+
+    return melhor, melhor_pos
+
+
+smith_waterman_striped = smith_waterman_vetorizado
+"""Nome antigo de :func:`smith_waterman_vetorizado`, mantido por compatibilidade.
+
+A implementação já não usa o layout *striped* de Farrar (ver a docstring de
+:func:`smith_waterman_vetorizado`); use o novo nome em código novo.
+"""
+
+
+def needleman_wunsch_afim(seq1, seq2, matriz_subst=BLOSUM62, gap_abertura=-10, gap_extensao=-1):
+    """Executa alinhamento global com penalização de gaps afim (Gotoh).
+
+    Um gap de comprimento ``L`` custa ``gap_abertura + (L-1)*gap_extensao``.
+    O preenchimento usa três matrizes (ver :func:`_preencher_afim`):
+    ``M`` (match/mismatch), ``X`` (gap na seq2) e ``Y`` (gap na seq1), mas guarda
+    apenas duas linhas de cada uma, em arrays tipados, e um byte de direções por
+    célula para o traceback.
+
+    Args:
+        seq1 (str): Primeira sequência a alinhar.
+        seq2 (str): Segunda sequência a alinhar.
+        matriz_subst (dict | SubstitutionMatrix, optional): Matriz de substituição. Por omissão ``BLOSUM62``.
+        gap_abertura (int, optional): Penalização do primeiro símbolo de um gap.
+            Por omissão ``-10``.
+        gap_extensao (int, optional): Penalização de cada símbolo adicional do gap.
+            Por omissão ``-1``.
+
+    Returns:
+        tuple[str, str, int | float]: Triplo ``(seq1_alinhada, seq2_alinhada, score)``.
+
+    Raises:
+        KeyError: Se a matriz de substituição não contiver algum símbolo presente
+            nas sequências.
+
+    Notes:
+        Com ``gap_abertura == gap_extensao`` o score é igual ao de
+        :func:`needleman_wunsch` com ``gap`` linear. Em empates, a preferência é
+        ``M`` (diagonal), depois ``X`` (cima) e por fim ``Y`` (esquerda).
+
+    Examples:
+        >>> needleman_wunsch_afim("ACGTTTACGT", "ACGTACGT", gap_abertura=-5, gap_extensao=-1)
+        ('ACGTTTACGT', 'ACG--TACGT', 42)
+    """
+    dirs, score, fim = _preencher_afim(seq1, seq2, matriz_subst, gap_abertura, gap_extensao, False)
+    a1, a2 = _traceback_afim(seq1, seq2, dirs, fim)
+    return a1, a2, _score_afim(score, matriz_subst, gap_abertura, gap_extensao)
+
+
+def smith_waterman_afim(seq1, seq2, matriz_subst=BLOSUM62, gap_abertura=-10, gap_extensao=-1):
+    """Executa alinhamento local com penalização de gaps afim (Gotoh).
+
+    Versão local de :func:`needleman_wunsch_afim`: o alinhamento pode começar em
+    qualquer célula (score truncado a 0) e termina na célula ``M`` de score máximo
+    (a primeira, percorrendo a matriz por linhas, tal como em :func:`smith_waterman`).
+
+    Args:
+        seq1 (str): Primeira sequência a alinhar.
+        seq2 (str): Segunda sequência a alinhar.
+        matriz_subst (dict | SubstitutionMatrix, optional): Matriz de substituição. Por omissão ``BLOSUM62``.
+        gap_abertura (int, optional): Penalização do primeiro símbolo de um gap.
+            Por omissão ``-10``.
+        gap_extensao (int, optional): Penalização de cada símbolo adicional do gap.
+            Por omissão ``-1``.
+
+    Returns:
+        tuple[str, str, int | float]: Triplo ``(subseq1_alinhada, subseq2_alinhada, score)``.
+        Se não existir nenhum alinhamento com score positivo devolve ``("", "", 0)``.
+
+    Raises:
+        KeyError: Se a matriz de substituição não contiver algum símbolo presente
+            nas sequências.
+
+    Examples:
+        >>> smith_waterman_afim("TTACGTTTACGTTT", "ACGTACGT", gap_abertura=-5, gap_extensao=-1)
+        ('ACGTTTACGT', 'ACG--TACGT', 42)
+    """
+    dirs, score, fim = _preencher_afim(seq1, seq2, matriz_subst, gap_abertura, gap_extensao, True)
+    if score <= 0:
+        return "", "", 0
+    a1, a2 = _traceback_afim(seq1, seq2, dirs, fim)
+    return a1, a2, _score_afim(score, matriz_subst, gap_abertura, gap_extensao)
+
+
+def _preencher_afim(seq1, seq2, matriz_subst, gap_abertura, gap_extensao, local):
+    """Preenche as matrizes de Gotoh (M, X, Y) em modo *streaming*.
+
+    Recorrências (``ab`` = abertura, ``ext`` = extensão):
+
+    - ``M[i][j] = s(i, j) + max(M, X, Y)[i-1][j-1]`` (no modo local, também ``0``);
+    - ``X[i][j] = max(M[i-1][j] + ab, X[i-1][j] + ext, Y[i-1][j] + ab)``;
+    - ``Y[i][j] = max(M[i][j-1] + ab, X[i][j-1] + ab, Y[i][j-1] + ext)``.
+
+    Só a linha anterior e a atual de cada matriz são mantidas (``array('d')``).
+    Para cada célula é guardado um byte em ``dirs`` com a origem de cada estado:
+    bits 0-1 para ``M`` (0=M, 1=X, 2=Y, 3=início local), bits 2-3 para ``X`` e
+    bits 4-5 para ``Y``.
+
+    Args:
+        seq1 (str): Primeira sequência (linhas).
+        seq2 (str): Segunda sequência (colunas).
+        matriz_subst (dict | SubstitutionMatrix): Matriz de substituição.
+        gap_abertura (int | float): Penalização de abertura de gap.
+        gap_extensao (int | float): Penalização de extensão de gap.
+        local (bool): ``True`` para Smith–Waterman, ``False`` para Needleman–Wunsch.
+
+    Returns:
+        tuple[bytearray, float, tuple[int, int, int]]: ``(dirs, score, fim)``, onde
+        ``fim = (i, j, estado)`` é a célula e o estado onde o traceback começa.
+    """
+    sm = compilar_matriz(matriz_subst)
+    cod1, cod2 = sm.codificar_par(seq1, seq2)
+    neg = float("-inf")
+    cols = len(seq2)+1
+    dirs = bytearray((len(seq1)+1)*cols)
+    M_ant, X_ant, Y_ant = array('d', [neg])*cols, array('d', [neg])*cols, array('d', [neg])*cols
+
+    if not local:
+        M_ant[0] = 0
+        for j in range(1, cols):
+            Y_ant[j] = gap_abertura + (j-1)*gap_extensao
+            dirs[j] = (0 if j == 1 else 2) << 4
+
+    melhor, fim = 0, (0, 0, 0)
+    for i in range(1, len(seq1)+1):
+        M, X, Y = array('d', [neg])*cols, array('d', [neg])*cols, array('d', [neg])*cols
+        base = i*cols
+        linha_subst = sm.tabela[cod1[i-1]]
+        if not local:
+            X[0] = gap_abertura + (i-1)*gap_extensao
+            dirs[base] = (0 if i == 1 else 1) << 2
+
+        for j in range(1, cols):
+            dm, dx, dy = M_ant[j-1], X_ant[j-1], Y_ant[j-1]
+            if dm >= dx and dm >= dy:
+                prev, om = dm, 0
+            elif dx >= dy:
+                prev, om = dx, 1
+            else:
+                prev, om = dy, 2
+            if local and prev <= 0:
+                prev, om = 0, 3
+            M[j] = prev + linha_subst[cod2[j-1]]
+
+            cm, cx, cy = M_ant[j] + gap_abertura, X_ant[j] + gap_extensao, Y_ant[j] + gap_abertura
+            if cm >= cx and cm >= cy:
+                X[j], ox = cm, 0
+            elif cx >= cy:
+                X[j], ox = cx, 1
+            else:
+                X[j], ox = cy, 2
+
+            em, ex, ey = M[j-1] + gap_abertura, X[j-1] + gap_abertura, Y[j-1] + gap_extensao
+            if em >= ex and em >= ey:
+                Y[j], oy = em, 0
+            elif ex >= ey:
+                Y[j], oy = ex, 1
+            else:
+                Y[j], oy = ey, 2
+
+            dirs[base+j] = om | (ox << 2) | (oy << 4)
+            if local and M[j] > melhor:
+                melhor, fim = M[j], (i, j, 0)
+
+        M_ant, X_ant, Y_ant = M, X, Y
+
+    if local:
+        return dirs, melhor, fim
+
+    n, m = len(seq1), len(seq2)
+    finais = (M_ant[m], X_ant[m], Y_ant[m])
+    estado = finais.index(max(finais))
+    return dirs, finais[estado], (n, m, estado)
+
+
+def _traceback_afim(seq1, seq2, dirs, fim):
+    """Reconstrói o alinhamento de Gotoh seguindo o byte de direções de cada célula.
+
+    Args:
+        seq1 (str): Primeira sequência original.
+        seq2 (str): Segunda sequência original.
+        dirs (bytearray): Direções produzidas por :func:`_preencher_afim`.
+        fim (tuple[int, int, int]): Célula e estado iniciais ``(i, j, estado)``.
+
+    Returns:
+        tuple[str, str]: ``(seq1_alinhada, seq2_alinhada)``.
+    """
+    cols = len(seq2)+1
+    i, j, estado = fim
+    a1, a2 = [], []
+
+    while (i > 0 or j > 0) and estado != 3:
+        d = dirs[i*cols+j]
+        if estado == 0:
+            a1.append(seq1[i-1])
+            a2.append(seq2[j-1])
+            estado = d & 3
+            i -= 1
+            j -= 1
+        elif estado == 1:
+            a1.append(seq1[i-1])
+            a2.append("-")
+            estado = (d >> 2) & 3
+            i -= 1
+        else:
+            a1.append("-")
+            a2.append(seq2[j-1])
+            estado = (d >> 4) & 3
+            j -= 1
+
+    return "".join(reversed(a1)), "".join(reversed(a2))
+
 
+def _score_afim(score, matriz_subst, gap_abertura, gap_extensao):
+    """Converte o score (calculado em ``float``) para ``int`` quando os scores são inteiros.
 
-def consenso_multiplas(alinhamento):
+    Args:
+        score (float): Score obtido no preenchimento.
+        matriz_subst (dict | SubstitutionMatrix): Matriz de substituição.
+        gap_abertura (int | float): Penalização de abertura de gap.
+        gap_extensao (int | float): Penalização de extensão de gap.
+
+    Returns:
+        int | float: Score com o tipo coerente com os parâmetros de scoring.
+    """
+    if compilar_matriz(matriz_subst).inteira and all(isinstance(g, Integral) for g in (gap_abertura, gap_extensao)):
+        return int(score)
+    return score
+
+
+_ALGORITMOS_LOTE = {"global": needleman_wunsch, "local": smith_waterman,
+                    "score_global": score_global, "score_local": score_local}
+"""dict[str, callable]: Algoritmos disponíveis em :func:`alinhar_lote` (os ``score_*`` só calculam o score)."""
+
+_ESTADO_TRABALHADOR = {}
+"""dict: Estado de cada processo trabalhador, definido uma vez por :func:`_iniciar_trabalhador`."""
+
+
+def _iniciar_trabalhador(estado):
+    """Inicializa um processo trabalhador do lote.
+
+    Corre uma única vez por processo, pelo que a matriz de substituição (e a
+    query, no modo um-contra-muitos) só é enviada a cada trabalhador uma vez,
+    e não em cada tarefa.
+
+    Args:
+        estado (dict): Chaves ``funcao``, ``matriz`` (já compilada), ``gap`` e
+            ``query`` (``None`` se as tarefas forem pares).
+    """
+    _ESTADO_TRABALHADOR.update(estado)
+
+
+def _alinhar_item(estado, item):
+    """Alinha um item do lote segundo ``estado``.
+
+    Args:
+        estado (dict): Estado criado por :func:`_executar_lote`.
+        item (tuple[str, str] | str): Par ``(seq1, seq2)``, ou a sequência alvo
+            se o estado tiver uma query fixa.
+
+    Returns:
+        tuple[str, str, int | float] | int | float: Resultado do algoritmo
+        configurado (só o score com ``"score_global"``/``"score_local"``).
+    """
+    if estado["query"] is None:
+        seq1, seq2 = item
+    else:
+        seq1, seq2 = estado["query"], item
+    return estado["funcao"](seq1, seq2, estado["matriz"], estado["gap"])
+
+
+def _executar_lote(itens, algoritmo, matriz_subst, gap, query, processos, chunksize):
+    """Valida os parâmetros do lote e devolve o gerador de resultados.
+
+    Returns:
+        Iterator[tuple[str, str, int | float] | int | float]: Resultados pela ordem de entrada.
+
+    Raises:
+        ValueError: Se ``algoritmo``, ``processos`` ou ``chunksize`` forem inválidos.
+    """
+    if algoritmo not in _ALGORITMOS_LOTE:
+        raise ValueError(f"Algoritmo desconhecido: {algoritmo!r} (use {', '.join(map(repr, _ALGORITMOS_LOTE))}).")
+    if processos is not None and processos < 1:
+        raise ValueError("O número de processos tem de ser >= 1.")
+    if chunksize < 1:
+        raise ValueError("O chunksize tem de ser >= 1.")
+
+    estado = {"funcao": _ALGORITMOS_LOTE[algoritmo], "matriz": compilar_matriz(matriz_subst),
+              "gap": gap, "query": query}
+    if processos == 1:
+        # sem pool: evita o arranque dos processos e a serialização
+        return (_alinhar_item(estado, item) for item in itens)
+    return _gerar_lote(itens, estado, processos, chunksize)
+
+
+def _alinhar_bloco(itens):
+    """Alinha um bloco de itens com o estado do processo trabalhador atual."""
+    return [_alinhar_item(_ESTADO_TRABALHADOR, item) for item in itens]
+
+
+def _gerar_lote(itens, estado, processos, chunksize):
+    """Distribui blocos de itens por um ``ProcessPoolExecutor`` e produz os resultados por ordem.
+
+    Ao contrário de ``Executor.map``, que submete logo todas as tarefas, só há
+    ``2*processos`` blocos submetidos de cada vez: um novo bloco é lido de
+    ``itens`` quando o resultado do mais antigo é produzido.
+
+    Yields:
+        tuple[str, str, int | float] | int | float: Resultado de cada item, pela ordem de entrada.
+    """
+    processos = processos or os.cpu_count() or 1
+    itens = iter(itens)
+    blocos = iter(lambda: list(islice(itens, chunksize)), [])
+    executor = ProcessPoolExecutor(max_workers=processos, initializer=_iniciar_trabalhador,
+                                   initargs=(estado,))
+    pendentes = deque()
+    try:
+        for bloco in blocos:
+            pendentes.append(executor.submit(_alinhar_bloco, bloco))
+            if len(pendentes) >= 2*processos:
+                yield from pendentes.popleft().result()
+        while pendentes:
+            yield from pendentes.popleft().result()
+    finally:
+        # se o consumidor abandonar o gerador, não vale a pena terminar o resto
+        executor.shutdown(cancel_futures=True)
+
+
+def alinhar_lote(pares, matriz_subst=BLOSUM62, gap=-5, algoritmo="global", processos=None, chunksize=64):
+    """Alinha muitos pares de sequências em paralelo, em vários processos.
+
+    Os pares são agrupados em blocos de ``chunksize`` (uma tarefa por bloco, para
+    diluir o custo de comunicação entre processos) e distribuídos por um
+    :class:`concurrent.futures.ProcessPoolExecutor`. A matriz de substituição é
+    compilada uma vez e enviada a cada trabalhador apenas no seu arranque.
+
+    Os resultados são devolvidos como um gerador, pela ordem dos pares de
+    entrada, à medida que ficam prontos. Os pares também são lidos aos poucos
+    (no máximo ``2*processos`` blocos em curso), pelo que ``pares`` pode ser um
+    gerador sobre um ficheiro maior do que a memória.
+
+    Args:
+        pares (Iterable[tuple[str, str]]): Pares ``(seq1, seq2)`` a alinhar.
+        matriz_subst (dict | SubstitutionMatrix, optional): Matriz de substituição.
+            Por omissão ``BLOSUM62``.
+        gap (int, optional): Penalização linear de gap. Por omissão ``-5``.
+        algoritmo (str, optional): ``"global"`` (:func:`needleman_wunsch`),
+            ``"local"`` (:func:`smith_waterman`) ou, quando só interessa o score
+            (sem traceback, em memória linear), ``"score_global"``
+            (:func:`score_global`) ou ``"score_local"`` (:func:`score_local`).
+            Por omissão ``"global"``.
+        processos (int | None, optional): Número de processos trabalhadores
+            (``None`` usa o número de CPUs; ``1`` corre no processo atual).
+        chunksize (int, optional): Número de pares por tarefa. Por omissão ``64``.
+
+    Yields:
+        tuple[str, str, int | float] | int | float: ``(seq1_alinhada,
+        seq2_alinhada, score)`` para cada par, pela ordem de entrada (só o score
+        com os algoritmos ``score_*``).
+
+    Raises:
+        ValueError: Se ``algoritmo``, ``processos`` ou ``chunksize`` forem inválidos.
+        KeyError: Se a matriz de substituição não contiver algum símbolo presente
+            nas sequências.
+
+    Examples:
+        >>> list(alinhar_lote([("ACGT", "ACGT"), ("A", "T")], processos=1))
+        [('ACGT', 'ACGT', 24), ('A', 'T', 0)]
+        >>> list(alinhar_lote([("ACGT", "ACGT"), ("A", "T")], algoritmo="score_global", processos=1))
+        [24, 0]
+    """
+    return _executar_lote(pares, algoritmo, matriz_subst, gap, None, processos, chunksize)
+
+
+def alinhar_contra_muitos(query, alvos, matriz_subst=BLOSUM62, gap=-5, algoritmo="local",
+                          processos=None, chunksize=64):
+    """Alinha uma query contra muitas sequências alvo, em vários processos.
+
+    Variante de :func:`alinhar_lote` para o caso um-contra-muitos (ex.: uma read
+    contra um painel de referências): a query é enviada a cada trabalhador uma
+    única vez, juntamente com a matriz, e as tarefas transportam apenas os alvos.
+
+    Args:
+        query (str): Sequência alinhada contra todos os alvos (``seq1``).
+        alvos (Iterable[str]): Sequências alvo (``seq2``).
+        matriz_subst (dict | SubstitutionMatrix, optional): Matriz de substituição.
+            Por omissão ``BLOSUM62``.
+        gap (int, optional): Penalização linear de gap. Por omissão ``-5``.
+        algoritmo (str, optional): ``"global"``, ``"local"``, ``"score_global"`` ou
+            ``"score_local"`` (ver :func:`alinhar_lote`). Por omissão ``"local"``.
+        processos (int | None, optional): Número de processos trabalhadores
+            (``None`` usa o número de CPUs; ``1`` corre no processo atual).
+        chunksize (int, optional): Número de alvos por tarefa. Por omissão ``64``.
+
+    Yields:
+        tuple[str, str, int | float] | int | float: ``(query_alinhada,
+        alvo_alinhado, score)`` para cada alvo, pela ordem de entrada (só o score
+        com os algoritmos ``score_*``).
+
+    Raises:
+        ValueError: Se ``algoritmo``, ``processos`` ou ``chunksize`` forem inválidos.
+        KeyError: Se a matriz de substituição não contiver algum símbolo presente
+            nas sequências.
+
+    Examples:
+        >>> [r[2] for r in alinhar_contra_muitos("ACG", ["TTACGTT", "GGG"], processos=1)]
+        [19, 6]
+    """
+    return _executar_lote(alvos, algoritmo, matriz_subst, gap, query, processos, chunksize)
+
+
+class Perfil:
+    """Perfil de colunas de um alinhamento múltiplo, com scoring soma-de-pares.
+
+    Cada coluna é guardada como um vetor de contagens sobre o alfabeto da matriz
+    de substituição mais o gap (último índice). O score entre duas colunas é a
+    soma, sobre todos os pares de símbolos (um de cada coluna), de
+    ``matriz_subst[a][b]``, com ``gap`` para resíduo contra gap e ``0`` para
+    gap contra gap. Assim, alinhar dois perfis de uma sequência cada é o mesmo
+    que :func:`needleman_wunsch`.
+
+    Um perfil pode ser alinhado com outro perfil ou com uma sequência
+    (:meth:`alinhar`) e cresce de forma incremental com :meth:`adicionar`: juntar
+    a sequência ``k+1`` custa um único alinhamento sequência-perfil, sem refazer
+    o alinhamento múltiplo.
+
+    Args:
+        alinhamento (Iterable[str], optional): Sequências alinhadas (mesmo
+            comprimento), com gaps ``'-'``. Por omissão, um perfil vazio.
+        matriz_subst (dict | SubstitutionMatrix, optional): Matriz de substituição.
+            Por omissão ``BLOSUM62``.
+        gap (int, optional): Penalização linear de gap. Por omissão ``-5``.
+
+    Attributes:
+        sequencias (list[str]): Sequências alinhadas do perfil.
+        matriz (SubstitutionMatrix): Matriz de substituição compilada.
+        gap (int | float): Penalização linear de gap.
+        contagens (list[list[int]]): Contagens por coluna (alfabeto + gap).
+
+    Raises:
+        ValueError: Se as sequências não tiverem todas o mesmo comprimento.
+        KeyError: Se alguma sequência tiver símbolos fora da matriz.
+
+    Examples:
+        >>> p = Perfil(["AC-T", "ACGT"]).alinhar(Perfil(["AGT"]))
+        >>> p.sequencias
+        ['AC-T', 'ACGT', 'A-GT']
+        >>> p.adicionar("ACGGT")
+        'ACGGT'
+        >>> p.sequencias
+        ['AC--T', 'AC-GT', 'A--GT', 'ACGGT']
+    """
+
+    def __init__(self, alinhamento=(), matriz_subst=BLOSUM62, gap=-5):
+        self.sequencias = list(alinhamento)
+        if len({len(s) for s in self.sequencias}) > 1:
+            raise ValueError("As sequências de um perfil têm de ter o mesmo comprimento.")
+        self.matriz = compilar_matriz(matriz_subst)
+        self.gap = gap
+        indice, n_gap = self.matriz.indice, len(self.matriz.alfabeto)
+        self.contagens = []
+        for coluna in zip(*self.sequencias):
+            contagem = [0]*(n_gap+1)
+            for c in coluna:
+                contagem[n_gap if c == "-" else indice[c]] += 1
+            self.contagens.append(contagem)
+
+    def __len__(self):
+        return len(self.contagens)
+
+    def __repr__(self):
+        return f"Perfil(sequencias={len(self.sequencias)}, colunas={len(self)})"
+
+    def frequencias(self):
+        """Devolve as frequências relativas de cada símbolo por coluna.
+
+        Returns:
+            list[list[float]]: Para cada coluna, a frequência de cada símbolo de
+            ``matriz.alfabeto`` seguida da frequência do gap.
+
+        Examples:
+            >>> Perfil(["AC", "A-"]).frequencias()[1]
+            [0.0, 0.5, 0.0, 0.0, 0.5]
+        """
+        n = len(self.sequencias)
+        return [[c / n for c in contagem] for contagem in self.contagens]
+
+    def score_soma_pares(self):
+        """Calcula o score soma-de-pares do alinhamento do perfil.
+
+        Soma, em cada coluna, o score de todos os pares de sequências (resíduo
+        contra resíduo pela matriz, resíduo contra gap ``gap``, gap contra gap
+        ``0``). Para duas sequências é o score do seu alinhamento par-a-par.
+
+        Returns:
+            int | float: Score soma-de-pares.
+
+        Raises:
+            KeyError: Se a matriz não tiver score para algum par presente numa coluna.
+
+        Examples:
+            >>> Perfil(["ACGT", "A-GT"]).score_soma_pares()
+            10
+        """
+        tab, alf, n_gap = self.matriz.tabela, self.matriz.alfabeto, len(self.matriz.alfabeto)
+        total = 0
+        for contagem in self.contagens:
+            presentes = [a for a in range(n_gap) if contagem[a]]
+            residuos = 0
+            for x, a in enumerate(presentes):
+                ca = contagem[a]
+                residuos += ca
+                for b in presentes[x:]:
+                    if tab[a][b] is None:
+                        raise KeyError(f"Par sem score na matriz de substituição: {alf[a]!r}, {alf[b]!r}")
+                    pares = ca*(ca-1)//2 if a == b else ca*contagem[b]
+                    total += pares*tab[a][b]
+            total += self.gap*residuos*contagem[n_gap]
+        return total
+
+    def _simbolos(self):
+        """Índices do alfabeto que aparecem em alguma coluna (sem o gap)."""
+        n_gap = len(self.matriz.alfabeto)
+        return {a for contagem in self.contagens for a in range(n_gap) if contagem[a]}
+
+    def alinhar(self, outro):
+        """Alinha este perfil com outro perfil ou com uma sequência.
+
+        Faz Needleman–Wunsch sobre as colunas dos dois perfis, com o score
+        soma-de-pares descrito na classe; inserir uma coluna de gaps num perfil
+        custa ``gap`` por cada resíduo da coluna do outro perfil, vezes o número
+        de sequências do primeiro. As colunas de cada perfil nunca são
+        separadas, pelo que gaps já existentes se mantêm.
+
+        Args:
+            outro (Perfil | str): Perfil a alinhar (com a mesma matriz e ``gap``),
+                ou uma sequência, tratada como um perfil de uma só sequência.
+
+        Returns:
+            Perfil: Novo perfil com as sequências de ``self`` seguidas das de
+            ``outro``, todas com o mesmo comprimento. ``self`` não é alterado.
+
+        Raises:
+            KeyError: Se a matriz não tiver score para algum par de símbolos
+                presente nos dois perfis.
+        """
+        if isinstance(outro, str):
+            outro = Perfil([outro], self.matriz, self.gap)
+        idx1, idx2 = self._alinhar_colunas(outro)
+
+        n_gap = len(self.matriz.alfabeto)
+        vazia1 = [0]*n_gap + [len(self.sequencias)]
+        vazia2 = [0]*n_gap + [len(outro.sequencias)]
+        novo = Perfil((), self.matriz, self.gap)
+        novo.contagens = [[x + y for x, y in zip(self.contagens[i] if i >= 0 else vazia1,
+                                                 outro.contagens[j] if j >= 0 else vazia2)]
+                          for i, j in zip(idx1, idx2)]
+        novo.sequencias = _inserir_gaps(self.sequencias, idx1) + _inserir_gaps(outro.sequencias, idx2)
+        return novo
+
+    def adicionar(self, seq):
+        """Junta uma sequência ao perfil, alinhando-a com as colunas atuais.
+
+        Custa um alinhamento sequência-perfil; as sequências já no perfil só são
+        reescritas se for preciso inserir colunas de gaps.
+
+        Args:
+            seq (str): Sequência (sem gaps) a juntar.
+
+        Returns:
+            str: A sequência tal como ficou alinhada no perfil.
+
+        Raises:
+            KeyError: Se a sequência tiver símbolos sem score na matriz.
+        """
+        novo = self.alinhar(seq)
+        self.sequencias, self.contagens = novo.sequencias, novo.contagens
+        return self.sequencias[-1]
+
+    def _alinhar_colunas(self, outro):
+        """Preenche a matriz perfil-perfil e devolve o caminho ótimo.
+
+        Returns:
+            tuple[list[int], list[int]]: Índices de coluna de cada perfil por
+            coluna do alinhamento (``-1`` onde é inserida uma coluna de gaps).
+        """
+        tab, n_gap, gap = self.matriz.tabela, len(self.matriz.alfabeto), self.gap
+        simb1, simb2 = self._simbolos(), outro._simbolos()
+        for a in simb1:
+            for b in simb2:
+                if tab[a][b] is None:
+                    alf = self.matriz.alfabeto
+                    raise KeyError(f"Par sem score na matriz de substituição: {alf[a]!r}, {alf[b]!r}")
+
+        n_seq1, n_seq2 = len(self.sequencias), len(outro.sequencias)
+        # colunas de self em forma esparsa; para cada coluna de outro, o score
+        # de cada símbolo de self contra essa coluna inteira
+        esparsas = [[(a, c[a]) for a in simb1 if c[a]] for c in self.contagens]
+        gaps1 = [c[n_gap] for c in self.contagens]
+        pesos = [[sum(c[b]*tab[a][b] for b in simb2 if c[b]) if a in simb1 else 0 for a in range(n_gap)]
+                 for c in outro.contagens]
+        gaps2 = [c[n_gap] for c in outro.contagens]
+
+        n, m = len(self), len(outro)
+        cols = m+1
+        dirs = bytearray((n+1)*cols)
+        dirs[1:cols] = bytes([_ESQ])*m
+        custo_esq = [gap*n_seq1*(n_seq2-g) for g in gaps2]
+        ant = [0]*cols
+        for j in range(1, cols):
+            ant[j] = ant[j-1] + custo_esq[j-1]
+        for i in range(1, n+1):
+            coluna, g1 = esparsas[i-1], gaps1[i-1]
+            res1 = n_seq1 - g1
+            custo_cima = gap*n_seq2*res1
+            atual = [ant[0] + custo_cima] + [0]*m
+            base = i*cols
+            dirs[base] = _CIMA
+            valor = atual[0]
+            for j in range(1, cols):
+                g2 = gaps2[j-1]
+                peso = pesos[j-1]
+                diag = ant[j-1] + sum(c*peso[a] for a, c in coluna) + gap*(g1*(n_seq2-g2) + res1*g2)
+                cima = ant[j] + custo_cima
+                valor += custo_esq[j-1]
+                if diag >= cima and diag >= valor:
+                    valor = diag
+                    dirs[base+j] = _DIAG
+                elif cima >= valor:
+                    valor = cima
+                    dirs[base+j] = _CIMA
+                else:
+                    dirs[base+j] = _ESQ
+                atual[j] = valor
+            ant = atual
+        return _caminho(dirs, n, m)
+
+
+def _inserir_gaps(sequencias, indices):
+    """Reescreve sequências alinhadas segundo os índices de coluna de um caminho.
+
+    Args:
+        sequencias (list[str]): Sequências alinhadas de um perfil.
+        indices (list[int]): Coluna original de cada nova coluna (``-1`` = gap).
+
+    Returns:
+        list[str]: Novas sequências (as mesmas, se não houver colunas inseridas).
+    """
+    if -1 not in indices:
+        return list(sequencias)
+    return ["".join(s[i] if i >= 0 else "-" for i in indices) for s in sequencias]
+
+
+def _caminho(dirs, n, m):
+    """Segue as direções de uma matriz global ``(n+1) x (m+1)`` desde ``(n, m)``.
+
+    Args:
+        dirs (bytearray): Direções por célula, em ordem de linhas.
+        n (int): Número de linhas (sem a linha 0).
+        m (int): Número de colunas (sem a coluna 0).
+
+    Returns:
+        tuple[list[int], list[int]]: Para cada coluna do alinhamento, o índice
+        consumido em cada eixo (``-1`` onde há gap).
+    """
+    cols = m+1
+    i, j = n, m
+    idx1, idx2 = [], []
+    while i > 0 or j > 0:
+        d = dirs[i*cols+j]
+        if d == _DIAG:
+            i -= 1
+            j -= 1
+            idx1.append(i)
+            idx2.append(j)
+        elif d == _CIMA:
+            i -= 1
+            idx1.append(i)
+            idx2.append(-1)
+        else:
+            j -= 1
+            idx1.append(-1)
+            idx2.append(j)
+    idx1.reverse()
+    idx2.reverse()
+    return idx1, idx2
+
+
+def _arvore_guia(dist, k):
+    """Constrói uma árvore guia UPGMA a partir de distâncias entre índices.
+
+    Os clusters são identificados por inteiros: as folhas são ``0..k-1`` e o
+    cluster criado na fusão ``t`` recebe o identificador ``k + t`` (como na
+    representação "linkage" habitual). A distância de um novo cluster aos
+    restantes é a média ponderada pelo tamanho dos clusters fundidos.
+
+    Args:
+        dist (dict[tuple[int, int], float]): Distâncias para cada par ``(i, j)``
+            com ``i < j``.
+        k (int): Número de folhas.
+
+    Returns:
+        list[tuple[int, int]]: As ``k - 1`` fusões, pela ordem em que ocorrem.
+
+    Examples:
+        >>> _arvore_guia({(0, 1): 5, (0, 2): 1, (1, 2): 4}, 3)
+        [(0, 2), (1, 3)]
+    """
+    dist = dict(dist)
+    tamanhos = {i: 1 for i in range(k)}
+    fusoes = []
+    novo = k
+    while len(tamanhos) > 1:
+        a, b = min(dist, key=lambda par: (dist[par], par))
+        fusoes.append((a, b))
+        del dist[(a, b)]
+        na, nb = tamanhos.pop(a), tamanhos.pop(b)
+        for c in tamanhos:
+            dac = dist.pop((min(a, c), max(a, c)))
+            dbc = dist.pop((min(b, c), max(b, c)))
+            dist[(c, novo)] = (na*dac + nb*dbc) / (na+nb)
+        tamanhos[novo] = na + nb
+        novo += 1
+    return fusoes
+
+
+def consenso_multiplas(alinhamento, motor="python"):
     """Calcula a sequência consenso a partir de um alinhamento múltiplo.
 
     Para cada coluna do alinhamento, escolhe o carácter mais frequente.
@@ -269,53 +2335,164 @@ def consenso_multiplas(alinhamento):
     Args:
         alinhamento (list[str]): Lista de sequências já alinhadas (todas com o
             mesmo comprimento), tipicamente contendo gaps ``'-'``.
+        motor (str, optional): ``"python"`` (por omissão) ou ``"numpy"``, que
+            codifica o alinhamento numa matriz ``uint8`` e conta os símbolos de
+            todas as colunas de uma vez (ver :func:`estatisticas_colunas`);
+            indicado para alinhamentos grandes. Ambos devolvem o mesmo consenso.
 
     Returns:
         str: Sequência consenso (inclui gaps se forem o símbolo mais frequente).
 
     Raises:
         TypeError: Se ``alinhamento`` não for iterável.
-        ValueError: Se as sequências em ``alinhamento`` não tiverem o mesmo comprimento.
+        ValueError: Se as sequências em ``alinhamento`` não tiverem o mesmo
+            comprimento (só verificado com ``motor="numpy"``), ou se ``motor``
+            for desconhecido.
+        ImportError: Se ``motor="numpy"`` for pedido sem o NumPy instalado.
 
     Examples:
         >>> consenso_multiplas(["A-C", "ACC", "A-C"])
         'A-C'
+        >>> consenso_multiplas(["ATGC", "ATGA", "ATGT"], motor="numpy")
+        'ATGC'
     """
-    consenso = ""
+    if motor == "numpy":
+        return estatisticas_colunas(alinhamento)["consenso"]
+    if motor != "python":
+        raise ValueError(f"Motor desconhecido: {motor!r}")
+
+    consenso = []
     for col in zip(*alinhamento):
         freq = {c: col.count(c) for c in set(col)}
         max_freq = max(freq.values())
-        
+
         for c in col:
             if freq[c] == max_freq:
-                consenso += c
+                consenso.append(c)
                 break
-    return consenso
+    return "".join(consenso)
+
+
+_CELULAS_POR_BLOCO = 1 << 22
+"""int: Número aproximado de células processadas de cada vez em :func:`estatisticas_colunas`."""
+
+
+def estatisticas_colunas(alinhamento):
+    """Calcula consenso e estatísticas por coluna de um alinhamento múltiplo.
+
+    O alinhamento é codificado numa matriz ``uint8`` (sequências x colunas) e
+    os símbolos são contados em todas as colunas com um único ``bincount`` por
+    bloco de linhas, pelo que a memória extra é limitada mesmo para milhares de
+    sequências. O consenso mantém o desempate de :func:`consenso_multiplas`
+    (o primeiro símbolo da coluna entre os mais frequentes).
+
+    Args:
+        alinhamento (list[str]): Sequências alinhadas, todas com o mesmo comprimento.
+
+    Returns:
+        dict: Dicionário com as chaves:
+        - ``"consenso"`` (str): Sequência consenso.
+        - ``"simbolos"`` (str): Símbolos presentes, por ordem crescente.
+        - ``"contagens"`` (numpy.ndarray): Contagens ``(colunas, símbolos)``.
+        - ``"frequencias"`` (numpy.ndarray): Frequências relativas ``(colunas, símbolos)``.
+        - ``"entropia"`` (numpy.ndarray): Entropia de Shannon (bits) por coluna,
+          contando o gap como mais um símbolo.
+        - ``"fracao_gap"`` (numpy.ndarray): Fração de ``'-'`` por coluna.
+
+    Raises:
+        ImportError: Se o NumPy não estiver instalado.
+        ValueError: Se as sequências não tiverem todas o mesmo comprimento ou
+            tiverem caracteres fora do Latin-1.
+
+    Examples:
+        >>> est = estatisticas_colunas(["AC-", "AG-", "ACT"])
+        >>> est["consenso"], est["simbolos"]
+        ('AC-', '-ACGT')
+        >>> est["fracao_gap"].tolist()
+        [0.0, 0.0, 0.6666666666666666]
+    """
+    if np is None:
+        raise ImportError("estatisticas_colunas requer o pacote NumPy.")
+    alinhamento = list(alinhamento)
+    n_seqs = len(alinhamento)
+    n_cols = len(alinhamento[0]) if alinhamento else 0
+    if any(len(s) != n_cols for s in alinhamento):
+        raise ValueError("As sequências do alinhamento têm de ter o mesmo comprimento.")
+
+    matriz = np.frombuffer("".join(alinhamento).encode("latin-1"), dtype=np.uint8).reshape(n_seqs, n_cols)
+    presentes = np.flatnonzero(np.bincount(matriz.ravel(), minlength=256))
+    simbolos = bytes(presentes.tolist()).decode("latin-1")
+    n_simb = len(presentes)
+    tipo = np.int32 if n_cols * n_simb < 2**31 else np.intp
+    codigo = np.zeros(256, dtype=tipo)
+    codigo[presentes] = np.arange(n_simb)
+
+    # contagens por coluna: cada célula (r, c) vai para o índice c*n_simb + símbolo
+    bloco = max(1, _CELULAS_POR_BLOCO // max(n_cols, 1))
+    deslocamento = np.arange(n_cols, dtype=tipo) * n_simb
+    contagens = np.zeros(n_cols * n_simb, dtype=np.int64)
+    for r in range(0, n_seqs, bloco):
+        codigos = codigo[matriz[r:r+bloco]] + deslocamento
+        contagens += np.bincount(codigos.ravel(), minlength=n_cols * n_simb)
+    contagens = contagens.reshape(n_cols, n_simb)
+
+    # desempate: a primeira linha (por coluna) cujo símbolo tem a contagem máxima
+    maximos = contagens.max(axis=1) if n_simb else np.zeros(n_cols, dtype=np.int64)
+    colunas = np.arange(n_cols)
+    primeira = np.full(n_cols, -1, dtype=np.intp)
+    for r in range(0, n_seqs, bloco):
+        pendentes = np.flatnonzero(primeira < 0)
+        if not len(pendentes):
+            break
+        sub = matriz[r:r+bloco][:, pendentes]
+        e_maximo = contagens[pendentes, codigo[sub]] == maximos[pendentes]
+        achou = e_maximo.any(axis=0)
+        primeira[pendentes[achou]] = r + e_maximo[:, achou].argmax(axis=0)
+    consenso = matriz[primeira, colunas].tobytes().decode("latin-1") if n_cols else ""
+
+    frequencias = contagens / n_seqs if n_seqs else contagens.astype(float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        termos = np.where(frequencias > 0, frequencias * np.log2(frequencias), 0.0)
+    entropia = -termos.sum(axis=1) + 0.0
+    gap = simbolos.find("-")
+    fracao_gap = frequencias[:, gap] if gap >= 0 else np.zeros(n_cols)
+
+    return {"consenso": consenso, "simbolos": simbolos, "contagens": contagens,
+            "frequencias": frequencias, "entropia": entropia, "fracao_gap": fracao_gap}
 
 
 def alinhamento_multiplo(seqs, matriz_subst=BLOSUM62, gap=-5):
-    """Realiza um alinhamento múltiplo “progressivo” simplificado.
+    """Realiza um alinhamento múltiplo progressivo guiado por uma árvore.
 
     Estratégia implementada:
-        - Inicia cada sequência como um alinhamento “unitário”.
-        - Repetidamente, escolhe o par com melhor score de Needleman–Wunsch
-          (aplicado às strings representativas atuais) e junta-o num alinhamento
-          de 2 sequências.
-        - No final devolve o alinhamento final e a sequência consenso.
+        - Calcula uma única vez a matriz de distâncias par-a-par, a partir do
+          score global de cada par (:func:`score_global`): a distância entre
+          ``i`` e ``j`` é ``(s_ii + s_jj)/2 - s_ij``, onde ``s_ii`` é o score de
+          uma sequência contra si própria.
+        - Constrói uma árvore guia UPGMA sobre essas distâncias.
+        - Sobe a árvore juntando os grupos com alinhamento perfil-perfil
+          (:meth:`Perfil.alinhar`), pelo que nenhum membro de um grupo já
+          alinhado é perdido.
+        - No final devolve o alinhamento (pela ordem de ``seqs``) e a sequência
+          consenso.
+
+    O custo é de ``k(k-1)/2`` alinhamentos par-a-par (só score) mais ``k - 1``
+    fusões de perfis, para ``k`` sequências.
 
     Args:
         seqs (list[str]): Lista de sequências a alinhar.
-        matriz_subst (dict, optional): Matriz de substituição usada no NW.
+        matriz_subst (dict | SubstitutionMatrix, optional): Matriz de substituição.
             Por omissão usa ``BLOSUM62``.
         gap (int, optional): Penalização linear de gap. Por omissão ``-5``.
 
     Returns:
         tuple[list[str], str]: Par ``(alinhamento, consenso)`` onde:
-        - ``alinhamento`` é uma lista de strings alinhadas (com gaps).
+        - ``alinhamento`` é a lista das sequências alinhadas (com gaps), uma por
+          sequência de entrada e pela mesma ordem.
         - ``consenso`` é a sequência consenso calculada por ``consenso_multiplas``.
 
     Raises:
-        IndexError: Se ``seqs`` estiver vazio (o código assume pelo menos 1 sequência).
+        IndexError: Se ``seqs`` estiver vazio.
         KeyError: Se a matriz de substituição não contiver símbolos usados.
 
     Examples:
@@ -324,30 +2501,31 @@ def alinhamento_multiplo(seqs, matriz_subst=BLOSUM62, gap=-5):
         2
         >>> len(alin[0]) == len(alin[1])
         True
+        >>> alinhamento_multiplo(["ACGT", "AGT", "ACGT"])[0]
+        ['ACGT', 'A-GT', 'ACGT']
     """
+    if not seqs:
+        raise IndexError("O alinhamento múltiplo precisa de pelo menos uma sequência.")
     if len(seqs) == 1:
         return [[seqs[0]]], seqs[0]
 
-    alinhamentos = [[s] for s in seqs]
-
-    while len(alinhamentos) > 1:
-        melhor_score = -1e9
-        melhor_par = None
-        melhor_alin = None
-
-        for i in range(len(alinhamentos)):
-            for j in range(i+1, len(alinhamentos)):
-                a1, a2, score = needleman_wunsch(alinhamentos[i][0], alinhamentos[j][0], matriz_subst, gap)
-                if score > melhor_score:
-                    melhor_score = score
-                    melhor_par = (i, j)
-                    melhor_alin = (a1, a2)
-
-        i, j = melhor_par
-    
-        combinacao = [melhor_alin[0], melhor_alin[1]]
-        alinhamentos.pop(j)
-        alinhamentos.pop(i)
-        alinhamentos.append(combinacao)
-
-    return alinhamentos[0], consenso_multiplas(alinhamentos[0])
+    matriz_subst = compilar_matriz(matriz_subst)
+    k = len(seqs)
+    proprios = [sum(matriz_subst.score(c, c) for c in s) for s in seqs]
+    dist = {}
+    for i in range(k):
+        for j in range(i+1, k):
+            score = score_global(seqs[i], seqs[j], matriz_subst, gap)
+            dist[(i, j)] = (proprios[i] + proprios[j])/2 - score
+
+    grupos = {i: (Perfil([s], matriz_subst, gap), [i]) for i, s in enumerate(seqs)}
+    for novo, (a, b) in enumerate(_arvore_guia(dist, k), start=k):
+        perfil_a, membros_a = grupos.pop(a)
+        perfil_b, membros_b = grupos.pop(b)
+        grupos[novo] = (perfil_a.alinhar(perfil_b), membros_a + membros_b)
+
+    perfil, membros = grupos.popitem()[1]
+    alinhamento = [None]*k
+    for pos, i in enumerate(membros):
+        alinhamento[i] = perfil.sequencias[pos]
+    return alinhamento, consenso_multiplas(alinhamento)
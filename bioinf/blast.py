@@ -1,3 +1,6 @@
+from bioinf.sequencias import PackedDNA
+
+
 def blast_simplificado(query, seq_alvo, w=3, match=2, mismatch=-1):
     """Executa um BLAST simplificado (seed-and-extend) entre uma query e uma sequência alvo.
 
@@ -61,7 +64,8 @@ def construir_mapa(query, w):
     das posições (0-based) onde esse k-mer ocorre na query.
 
     Args:
-        query (str): Sequência de consulta (query).
+        query (str | PackedDNA): Sequência de consulta (query); um
+            :class:`~bioinf.sequencias.PackedDNA` é descompactado uma única vez.
         w (int): Tamanho do k-mer (seed/word size).
 
     Returns:
@@ -74,6 +78,8 @@ def construir_mapa(query, w):
         >>> construir_mapa("ACGTA", 3)
         {'ACG': [0], 'CGT': [1], 'GTA': [2]}
     """
+    if isinstance(query, PackedDNA):
+        query = str(query)
     mapa = {}
     for i in range(len(query) - w + 1):
         palavra = query[i:i+w]
@@ -0,0 +1,441 @@
+import mmap
+import os
+from collections import namedtuple
+
+
+Registo = namedtuple("Registo", ["id", "sequencia", "qualidade"])
+Registo.__doc__ = """Registo de um ficheiro FASTA/FASTQ.
+
+Attributes:
+    id (str): Identificador (primeira palavra do cabeçalho, sem ``>``/``@``).
+    sequencia (bytes | memoryview | str): Sequência (``str`` se pedido ``texto=True``).
+    qualidade (bytes | memoryview | str | None): Qualidades FASTQ (``None`` em FASTA).
+"""
+
+EntradaFai = namedtuple("EntradaFai", ["comprimento", "offset", "bases_linha", "bytes_linha"])
+EntradaFai.__doc__ = """Entrada de um índice ``.fai`` (formato do ``samtools faidx``).
+
+Attributes:
+    comprimento (int): Número de bases da sequência.
+    offset (int): Posição (em bytes) da primeira base no ficheiro.
+    bases_linha (int): Bases por linha.
+    bytes_linha (int): Bytes por linha, incluindo o fim de linha.
+"""
+
+
+def ler_fasta(origem, usar_mmap=False, texto=False):
+    """Lê um ficheiro FASTA de forma incremental, um registo de cada vez.
+
+    Com o backend por omissão o ficheiro é lido por linhas através de um buffer
+    (memória proporcional ao maior registo). Com ``usar_mmap=True`` o ficheiro é
+    mapeado em memória e as sequências que ocupam uma única linha são devolvidas
+    como ``memoryview`` sobre o mapeamento, sem cópia; as que ocupam várias
+    linhas são juntadas num ``bytes``.
+
+    Args:
+        origem (str | os.PathLike | BinaryIO): Caminho ou ficheiro aberto em modo
+            binário (só caminhos com ``usar_mmap=True``).
+        usar_mmap (bool, optional): Usar o backend ``mmap``. Por omissão ``False``.
+        texto (bool, optional): Devolver as sequências como ``str`` (para funções
+            que só aceitam texto, ex.: :mod:`bioinf.alinhamento`; as funções de
+            ORFs de :mod:`bioinf.sequencias` também aceitam ``bytes``).
+
+    Yields:
+        Registo: ``(id, sequencia, None)`` por cada registo do ficheiro.
+
+    Raises:
+        ValueError: Se houver conteúdo antes do primeiro cabeçalho ``>``.
+        OSError: Se o ficheiro não puder ser aberto.
+
+    Examples:
+        >>> import io
+        >>> list(ler_fasta(io.BytesIO(b">s1 desc\\nACG\\nT\\n>s2\\nGG\\n")))
+        [Registo(id='s1', sequencia=b'ACGT', qualidade=None), Registo(id='s2', sequencia=b'GG', qualidade=None)]
+    """
+    if usar_mmap:
+        registos = _fasta_mmap(origem)
+    else:
+        registos = _fasta_buffer(origem)
+    return _como_texto(registos) if texto else registos
+
+
+def ler_fastq(origem, usar_mmap=False, texto=False):
+    """Lê um ficheiro FASTQ (registos de 4 linhas) de forma incremental.
+
+    Args:
+        origem (str | os.PathLike | BinaryIO): Caminho ou ficheiro aberto em modo
+            binário (só caminhos com ``usar_mmap=True``).
+        usar_mmap (bool, optional): Usar o backend ``mmap``, em que a sequência e
+            as qualidades são ``memoryview`` sobre o ficheiro. Por omissão ``False``.
+        texto (bool, optional): Devolver sequência e qualidades como ``str``.
+
+    Yields:
+        Registo: ``(id, sequencia, qualidade)`` por cada registo do ficheiro.
+
+    Raises:
+        ValueError: Se um registo não começar por ``@``, não tiver a linha ``+``,
+            ou se a sequência e as qualidades tiverem comprimentos diferentes.
+
+    Examples:
+        >>> import io
+        >>> list(ler_fastq(io.BytesIO(b"@r1\\nACGT\\n+\\nIIII\\n"), texto=True))
+        [Registo(id='r1', sequencia='ACGT', qualidade='IIII')]
+    """
+    if usar_mmap:
+        registos = _fastq_mmap(origem)
+    else:
+        registos = _fastq_buffer(origem)
+    return _como_texto(registos) if texto else registos
+
+
+def ler_sequencias(caminho, usar_mmap=False, texto=False):
+    """Lê um ficheiro FASTA ou FASTQ, detetando o formato pelo primeiro carácter.
+
+    Args:
+        caminho (str | os.PathLike): Caminho do ficheiro.
+        usar_mmap (bool, optional): Usar o backend ``mmap``.
+        texto (bool, optional): Devolver sequências (e qualidades) como ``str``.
+
+    Returns:
+        Iterator[Registo]: Registos do ficheiro.
+
+    Raises:
+        ValueError: Se o ficheiro não começar por ``>`` nem por ``@``.
+    """
+    with open(caminho, "rb") as f:
+        primeiro = f.read(1)
+    if primeiro == b"@":
+        return ler_fastq(caminho, usar_mmap, texto)
+    if primeiro in (b">", b""):
+        return ler_fasta(caminho, usar_mmap, texto)
+    raise ValueError(f"Formato desconhecido (esperado '>' ou '@'): {caminho}")
+
+
+def _abrir(origem):
+    """Abre ``origem`` em modo binário, se for um caminho.
+
+    Returns:
+        tuple[BinaryIO, bool]: O ficheiro e se deve ser fechado no fim.
+    """
+    if isinstance(origem, (str, bytes, os.PathLike)):
+        return open(origem, "rb"), True
+    return origem, False
+
+
+def _identificador(cabecalho):
+    """Extrai o identificador (primeira palavra) de uma linha de cabeçalho."""
+    palavras = bytes(cabecalho[1:]).split(None, 1)
+    return palavras[0].decode() if palavras else ""
+
+
+def _como_texto(registos):
+    """Converte sequência e qualidades de cada registo para ``str``."""
+    for r in registos:
+        qualidade = None if r.qualidade is None else bytes(r.qualidade).decode("ascii")
+        yield Registo(r.id, bytes(r.sequencia).decode("ascii"), qualidade)
+
+
+def _fasta_buffer(origem):
+    """Backend FASTA por linhas (leitura com buffer)."""
+    f, fechar = _abrir(origem)
+    try:
+        id_, partes = None, []
+        for linha in f:
+            if linha.startswith(b">"):
+                if id_ is not None:
+                    yield Registo(id_, b"".join(partes), None)
+                id_, partes = _identificador(linha), []
+            elif id_ is not None:
+                partes.append(linha.rstrip())
+            elif linha.strip():
+                raise ValueError("Ficheiro FASTA inválido: conteúdo antes do primeiro '>'.")
+        if id_ is not None:
+            yield Registo(id_, b"".join(partes), None)
+    finally:
+        if fechar:
+            f.close()
+
+
+def _fastq_buffer(origem):
+    """Backend FASTQ por linhas (leitura com buffer)."""
+    f, fechar = _abrir(origem)
+    try:
+        while True:
+            cabecalho = f.readline()
+            if not cabecalho.strip():
+                if not cabecalho:
+                    return
+                continue
+            seq, mais, qual = f.readline().rstrip(), f.readline(), f.readline().rstrip()
+            yield _registo_fastq(cabecalho, seq, mais, qual)
+    finally:
+        if fechar:
+            f.close()
+
+
+def _registo_fastq(cabecalho, seq, mais, qual):
+    """Valida as quatro linhas de um registo FASTQ e constrói o :class:`Registo`."""
+    if not cabecalho.startswith(b"@") or not mais.startswith(b"+"):
+        raise ValueError("Registo FASTQ inválido: esperado '@id', sequência, '+' e qualidades.")
+    if len(seq) != len(qual):
+        raise ValueError(f"Registo FASTQ {_identificador(cabecalho)!r}: sequência e qualidades "
+                         f"com comprimentos diferentes.")
+    return Registo(_identificador(cabecalho), seq, qual)
+
+
+def _mapear(caminho):
+    """Abre e mapeia um ficheiro só para leitura (``None`` se estiver vazio)."""
+    with open(caminho, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _fechar_mapa(mm):
+    """Fecha o mapeamento, exceto se ainda houver ``memoryview`` em uso sobre ele."""
+    try:
+        mm.close()
+    except BufferError:
+        # o consumidor ainda guarda sequências; o mapa é libertado pelo GC
+        pass
+
+
+def _fim_linha(mm, inicio, fim):
+    """Devolve o fim de uma linha sem ``\\r``/``\\n`` finais."""
+    while fim > inicio and mm[fim-1] in b"\r\n":
+        fim -= 1
+    return fim
+
+
+def _fasta_mmap(caminho):
+    """Backend FASTA sobre ``mmap``."""
+    mm = _mapear(caminho)
+    if mm is None:
+        return
+    vista = memoryview(mm)
+    try:
+        tamanho = len(mm)
+        pos = 0
+        while pos < tamanho and mm[pos] in b" \t\r\n":
+            pos += 1
+        if pos < tamanho and mm[pos] != ord(">"):
+            raise ValueError("Ficheiro FASTA inválido: conteúdo antes do primeiro '>'.")
+        while pos < tamanho:
+            eol = mm.find(b"\n", pos)
+            eol = tamanho if eol < 0 else eol
+            id_ = _identificador(mm[pos:eol])
+            seguinte = mm.find(b"\n>", eol)
+            seguinte = tamanho if seguinte < 0 else seguinte + 1
+            inicio = min(eol + 1, tamanho)
+            fim = _fim_linha(mm, inicio, seguinte)
+            if mm.find(b"\n", inicio, fim) < 0:
+                sequencia = vista[inicio:fim]
+            else:
+                sequencia = b"".join(l.rstrip() for l in mm[inicio:fim].split(b"\n"))
+            yield Registo(id_, sequencia, None)
+            pos = seguinte
+    finally:
+        vista.release()
+        _fechar_mapa(mm)
+
+
+def _fastq_mmap(caminho):
+    """Backend FASTQ sobre ``mmap``."""
+    mm = _mapear(caminho)
+    if mm is None:
+        return
+    vista = memoryview(mm)
+    try:
+        tamanho = len(mm)
+        pos = 0
+
+        def linha():
+            nonlocal pos
+            eol = mm.find(b"\n", pos)
+            eol = tamanho if eol < 0 else eol
+            inicio, pos = pos, eol + 1
+            return inicio, _fim_linha(mm, inicio, eol)
+
+        while pos < tamanho:
+            cab = linha()
+            if cab[0] == cab[1]:
+                continue
+            seq, mais, qual = linha(), linha(), linha()
+            registo = _registo_fastq(mm[cab[0]:cab[1]], vista[seq[0]:seq[1]],
+                                     mm[mais[0]:mais[1]], vista[qual[0]:qual[1]])
+            yield registo
+    finally:
+        vista.release()
+        _fechar_mapa(mm)
+
+
+def indexar_fasta(caminho):
+    """Constrói o índice ``.fai`` de um ficheiro FASTA.
+
+    Cada registo tem de ter todas as linhas de sequência com o mesmo
+    comprimento (exceto a última), como exige o ``samtools faidx``. Uma linha
+    em branco termina a sequência do registo.
+
+    Args:
+        caminho (str | os.PathLike): Caminho do ficheiro FASTA.
+
+    Returns:
+        dict[str, EntradaFai]: Índice por identificador, pela ordem do ficheiro.
+
+    Raises:
+        ValueError: Se um registo tiver linhas de comprimentos irregulares, linhas
+            de sequência depois de uma linha em branco ou identificadores
+            repetidos.
+    """
+    indice = {}
+    id_ = None
+    with open(caminho, "rb") as f:
+        offset = 0
+        for linha in f:
+            if linha.startswith(b">"):
+                if id_ is not None:
+                    indice[id_] = EntradaFai(comprimento, inicio, bases, largura)
+                id_ = _identificador(linha)
+                if id_ in indice:
+                    raise ValueError(f"Identificador repetido no FASTA: {id_!r}")
+                comprimento, inicio, bases, largura, fechado = 0, offset + len(linha), 0, 0, False
+            elif id_ is not None:
+                n = len(linha.rstrip(b"\r\n"))
+                if n:
+                    if fechado or (bases and n > bases):
+                        raise ValueError(f"Registo {id_!r} com linhas de comprimentos diferentes.")
+                    if not bases:
+                        bases, largura = n, len(linha)
+                    elif n < bases or len(linha) != largura:
+                        fechado = True
+                    comprimento += n
+                else:
+                    fechado = True
+            offset += len(linha)
+        if id_ is not None:
+            indice[id_] = EntradaFai(comprimento, inicio, bases, largura)
+    return indice
+
+
+def escrever_fai(indice, caminho):
+    """Escreve um índice no formato ``.fai`` (colunas separadas por tabs).
+
+    Args:
+        indice (dict[str, EntradaFai]): Índice de :func:`indexar_fasta`.
+        caminho (str | os.PathLike): Caminho do ficheiro ``.fai`` a escrever.
+    """
+    with open(caminho, "w") as f:
+        for id_, e in indice.items():
+            f.write(f"{id_}\t{e.comprimento}\t{e.offset}\t{e.bases_linha}\t{e.bytes_linha}\n")
+
+
+def ler_fai(caminho):
+    """Lê um índice ``.fai``.
+
+    Args:
+        caminho (str | os.PathLike): Caminho do ficheiro ``.fai``.
+
+    Returns:
+        dict[str, EntradaFai]: Índice por identificador.
+    """
+    indice = {}
+    with open(caminho) as f:
+        for linha in f:
+            if linha.strip():
+                campos = linha.split("\t")
+                indice[campos[0]] = EntradaFai(*(int(c) for c in campos[1:5]))
+    return indice
+
+
+class FastaIndexado:
+    """Acesso aleatório a registos de um FASTA através de um índice ``.fai``.
+
+    Se existir ``caminho + ".fai"`` é usado; caso contrário o índice é
+    construído com :func:`indexar_fasta` (e escrito, se ``escrever=True``).
+    Ler uma região lê apenas os bytes correspondentes do ficheiro.
+
+    Args:
+        caminho (str | os.PathLike): Caminho do ficheiro FASTA.
+        escrever (bool, optional): Escrever o ``.fai`` se ainda não existir.
+
+    Attributes:
+        caminho (str): Caminho do ficheiro FASTA.
+        indice (dict[str, EntradaFai]): Índice por identificador.
+
+    Examples:
+        >>> import tempfile
+        >>> with tempfile.NamedTemporaryFile(suffix=".fa", delete=False) as f:
+        ...     _ = f.write(b">a\\nACGT\\nAC\\n>b\\nTTTT\\n")
+        >>> with FastaIndexado(f.name) as fa:
+        ...     fa["a"], fa.buscar("a", 3, 5), len(fa)
+        (b'ACGTAC', b'TA', 2)
+    """
+
+    def __init__(self, caminho, escrever=False):
+        self.caminho = os.fspath(caminho)
+        fai = self.caminho + ".fai"
+        if os.path.exists(fai):
+            self.indice = ler_fai(fai)
+        else:
+            self.indice = indexar_fasta(self.caminho)
+            if escrever:
+                escrever_fai(self.indice, fai)
+        self._ficheiro = None
+
+    def __repr__(self):
+        return f"FastaIndexado({self.caminho!r}, registos={len(self.indice)})"
+
+    def __len__(self):
+        return len(self.indice)
+
+    def __iter__(self):
+        return iter(self.indice)
+
+    def __contains__(self, id_):
+        return id_ in self.indice
+
+    def __getitem__(self, id_):
+        return self.buscar(id_)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+    def fechar(self):
+        """Fecha o ficheiro subjacente (reaberto automaticamente se necessário)."""
+        if self._ficheiro is not None:
+            self._ficheiro.close()
+            self._ficheiro = None
+
+    def buscar(self, id_, inicio=0, fim=None):
+        """Lê a região ``[inicio, fim)`` de um registo.
+
+        Args:
+            id_ (str): Identificador do registo.
+            inicio (int, optional): Primeira base (base 0). Por omissão ``0``.
+            fim (int | None, optional): Base a seguir à última (por omissão, o fim).
+
+        Returns:
+            bytes: Bases da região, sem fins de linha.
+
+        Raises:
+            KeyError: Se ``id_`` não existir no índice.
+        """
+        e = self.indice[id_]
+        fim = e.comprimento if fim is None else min(fim, e.comprimento)
+        inicio = max(0, inicio)
+        if inicio >= fim:
+            return b""
+        if self._ficheiro is None:
+            self._ficheiro = open(self.caminho, "rb")
+
+        def posicao(base):
+            return e.offset + (base // e.bases_linha)*e.bytes_linha + base % e.bases_linha
+
+        self._ficheiro.seek(posicao(inicio))
+        bruto = self._ficheiro.read(posicao(fim-1) + 1 - posicao(inicio))
+        if e.bytes_linha == e.bases_linha:
+            return bruto
+        return bruto.replace(b"\n", b"").replace(b"\r", b"")
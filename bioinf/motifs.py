@@ -1,13 +1,247 @@
+import os
 import re
 import math
+import heapq
+from array import array
+from collections import deque, namedtuple
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
+from functools import lru_cache
+
+
+ElementoProsite = namedtuple("ElementoProsite", ["simbolos", "negado", "minimo", "maximo", "ou_fim"])
+ElementoProsite.__doc__ = """Elemento de um padrão PROSITE já interpretado.
+
+Attributes:
+    simbolos (str): Resíduos do elemento (``""`` com ``negado=True`` é ``x``).
+    negado (bool): ``True`` para ``{...}`` (qualquer resíduo exceto ``simbolos``).
+    minimo (int): Número mínimo de repetições.
+    maximo (int): Número máximo de repetições.
+    ou_fim (bool): ``True`` se o elemento também aceitar o fim da sequência
+        (``>`` dentro de ``[...]``, ex.: ``[G>]``).
+"""
+
+_ELEMENTO_PROSITE = re.compile(
+    r"(?:(?P<residuo>[A-Za-z])|\[(?P<alternativas>[A-Za-z]*)(?P<fim>>?)\]|\{(?P<exclusoes>[A-Za-z]+)\})"
+    r"(?:\((?P<minimo>\d+)(?:,(?P<maximo>\d+))?\))?"
+)
+
+
+class PrositePattern:
+    """Padrão PROSITE interpretado e compilado uma única vez.
+
+    A gramática suportada é a da documentação do PROSITE: elementos separados
+    por ``-`` (o separador é opcional), resíduos isolados, ``x`` (qualquer
+    resíduo), alternativas ``[...]``, exclusões ``{...}``, repetições ``(n)`` e
+    ``(n,m)``, âncoras ``<`` (início) e ``>`` (fim, também dentro de ``[...]`` no
+    último elemento) e o ponto final opcional das entradas da base de dados.
+
+    O padrão é compilado para ``str`` e para ``bytes``, pelo que
+    :meth:`finditer` e :meth:`findall` aceitam ``str``, ``bytes``,
+    ``bytearray``, ``memoryview`` ou ``mmap``. Com ``sobrepostos=True`` usam
+    uma segunda versão do padrão, envolvida num lookahead ``(?=(...))``, que
+    devolve o match de cada posição inicial (incluindo os sobrepostos) numa
+    única passagem. Para reutilizar objetos já compilados, use
+    :func:`compilar_prosite`.
+
+    Args:
+        padrao (str): Padrão PROSITE (ex.: ``"C-x(2,4)-[ST]-{P}"``).
+
+    Attributes:
+        padrao (str): Padrão original.
+        elementos (tuple[ElementoProsite, ...]): Elementos interpretados.
+        ancora_inicio (bool): ``True`` se o padrão começar por ``<``.
+        ancora_fim (bool): ``True`` se o padrão terminar em ``>``.
+        regex (str): Expressão regular equivalente.
+
+    Raises:
+        ValueError: Se o padrão não respeitar a gramática PROSITE.
+        TypeError: Se ``padrao`` não for string.
+
+    Examples:
+        >>> p = PrositePattern("C-x(2)-[HC]")
+        >>> p.regex
+        'C.{2}[HC]'
+        >>> p.findall("ACAACHCGGC"), p.findall(b"CAAH")
+        ([(1, 5), (6, 10)], [(0, 4)])
+    """
+
+    def __init__(self, padrao):
+        if not isinstance(padrao, str):
+            raise TypeError("O padrão PROSITE tem de ser uma string.")
+        self.padrao = padrao
+        texto = padrao.strip()
+        if texto.endswith("."):
+            texto = texto[:-1]
+        self.ancora_inicio = texto.startswith("<")
+        if self.ancora_inicio:
+            texto = texto[1:]
+        self.ancora_fim = texto.endswith(">")
+        if self.ancora_fim:
+            texto = texto[:-1]
+
+        elementos = []
+        pos = 0
+        while pos < len(texto):
+            if texto[pos] == "-" and elementos and pos + 1 < len(texto):
+                pos += 1
+            m = _ELEMENTO_PROSITE.match(texto, pos)
+            if m is None:
+                raise ValueError(f"Padrão PROSITE inválido {padrao!r}: erro perto de {texto[pos:]!r}.")
+            elementos.append(self._elemento(m, padrao))
+            pos = m.end()
+
+        if any(e.ou_fim for e in elementos[:-1]):
+            raise ValueError(f"Padrão PROSITE inválido {padrao!r}: '>' só pode estar no último elemento.")
+        self.elementos = tuple(elementos)
+        self.regex = (("^" if self.ancora_inicio else "")
+                      + "".join(_elemento_para_regex(e) for e in self.elementos)
+                      + ("$" if self.ancora_fim else ""))
+        self._compilado = re.compile(self.regex)
+        self._compilado_bytes = re.compile(self.regex.encode("ascii"))
+        # modo sobreposto: o match fica dentro de um lookahead, que não consome
+        # caracteres, pelo que o finditer testa todas as posições numa passagem
+        sobreposto = f"(?=({self.regex}))"
+        self._sobreposto = re.compile(sobreposto)
+        self._sobreposto_bytes = re.compile(sobreposto.encode("ascii"))
+
+    @staticmethod
+    def _elemento(m, padrao):
+        """Constrói o :class:`ElementoProsite` de um match de ``_ELEMENTO_PROSITE``."""
+        minimo = maximo = 1
+        if m.group("minimo") is not None:
+            minimo = int(m.group("minimo"))
+            maximo = int(m.group("maximo")) if m.group("maximo") is not None else minimo
+            if minimo > maximo:
+                raise ValueError(f"Padrão PROSITE inválido {padrao!r}: repetição ({minimo},{maximo}).")
+        if m.group("residuo") is not None:
+            residuo = m.group("residuo")
+            if residuo == "x":
+                return ElementoProsite("", True, minimo, maximo, False)
+            return ElementoProsite(residuo, False, minimo, maximo, False)
+        if m.group("exclusoes") is not None:
+            return ElementoProsite(m.group("exclusoes"), True, minimo, maximo, False)
+        alternativas, fim = m.group("alternativas"), bool(m.group("fim"))
+        if not alternativas and not fim:
+            raise ValueError(f"Padrão PROSITE inválido {padrao!r}: alternativas vazias '[]'.")
+        return ElementoProsite(alternativas, False, minimo, maximo, fim)
+
+    def __repr__(self):
+        return f"PrositePattern({self.padrao!r})"
+
+    def __eq__(self, outro):
+        return isinstance(outro, PrositePattern) and outro.regex == self.regex
+
+    def __hash__(self):
+        return hash(self.regex)
+
+    def compilado(self, sequencia, sobrepostos=False):
+        """Devolve a regex compilada adequada ao tipo de ``sequencia``.
+
+        Args:
+            sequencia (str | bytes-like): Sequência a pesquisar.
+            sobrepostos (bool, optional): Devolver a versão com lookahead, cujo
+                grupo 1 é o match de cada posição.
+
+        Returns:
+            re.Pattern: Padrão para ``str`` ou para bytes-like.
+        """
+        if sobrepostos:
+            return self._sobreposto if isinstance(sequencia, str) else self._sobreposto_bytes
+        return self._compilado if isinstance(sequencia, str) else self._compilado_bytes
+
+    def finditer(self, sequencia, inicio=0, fim=None, sobrepostos=False):
+        """Percorre as ocorrências do padrão.
+
+        Args:
+            sequencia (str | bytes-like): Sequência onde procurar.
+            inicio (int, optional): Posição onde começar a procura. Por omissão ``0``.
+            fim (int | None, optional): Posição onde terminar (por omissão, o fim).
+            sobrepostos (bool, optional): Devolver uma ocorrência por cada posição
+                inicial onde o padrão ocorre, mesmo que se sobreponha à anterior.
+                Por omissão ``False`` (ocorrências não sobrepostas, como
+                :func:`re.finditer`).
+
+        Yields:
+            tuple[int, int]: ``(inicio, fim)`` de cada ocorrência (0-based, ``fim`` exclusivo).
+        """
+        fim = len(sequencia) if fim is None else fim
+        if sobrepostos:
+            for m in self.compilado(sequencia, True).finditer(sequencia, inicio, fim):
+                yield m.span(1)
+        else:
+            for m in self.compilado(sequencia).finditer(sequencia, inicio, fim):
+                yield m.span()
+
+    def findall(self, sequencia, inicio=0, fim=None, sobrepostos=False):
+        """Devolve as ocorrências do padrão.
+
+        Args:
+            sequencia (str | bytes-like): Sequência onde procurar.
+            inicio (int, optional): Posição onde começar a procura. Por omissão ``0``.
+            fim (int | None, optional): Posição onde terminar (por omissão, o fim).
+            sobrepostos (bool, optional): Incluir as ocorrências sobrepostas (ver
+                :meth:`finditer`).
+
+        Returns:
+            list[tuple[int, int]]: ``(inicio, fim)`` de cada ocorrência.
+
+        Examples:
+            >>> p = PrositePattern("C-x-C")
+            >>> p.findall("CACACAC"), p.findall("CACACAC", sobrepostos=True)
+            ([(0, 3), (4, 7)], [(0, 3), (2, 5), (4, 7)])
+        """
+        return list(self.finditer(sequencia, inicio, fim, sobrepostos))
+
+
+def _elemento_para_regex(elemento):
+    """Converte um :class:`ElementoProsite` para regex (sem âncoras globais)."""
+    simbolos, negado, minimo, maximo, ou_fim = elemento
+    if negado:
+        classe = f"[^{simbolos}]" if simbolos else "."
+    elif len(simbolos) == 1:
+        classe = simbolos
+    else:
+        classe = f"[{simbolos}]"
+    if ou_fim:
+        classe = f"(?:{classe}|$)" if simbolos else "$"
+    if (minimo, maximo) == (1, 1):
+        return classe
+    return f"{classe}{{{minimo}}}" if minimo == maximo else f"{classe}{{{minimo},{maximo}}}"
+
+
+@lru_cache(maxsize=4096)
+def compilar_prosite(padrao):
+    """Devolve o :class:`PrositePattern` de um padrão, com cache LRU.
+
+    Padrões repetidos (ex.: a mesma biblioteca PROSITE aplicada a milhares de
+    proteínas) são interpretados e compilados uma única vez.
+
+    Args:
+        padrao (str): Padrão PROSITE.
+
+    Returns:
+        PrositePattern: Padrão compilado (partilhado entre chamadas).
+
+    Raises:
+        ValueError: Se o padrão não respeitar a gramática PROSITE.
+
+    Examples:
+        >>> compilar_prosite("C-x(2)-C") is compilar_prosite("C-x(2)-C")
+        True
+    """
+    return PrositePattern(padrao)
 
 
 def prosite_para_regex(padrao):
     """Converte um padrão PROSITE para uma expressão regular (regex) equivalente.
 
-    Implementa uma conversão simples para suportar construções comuns de PROSITE:
+    O padrão é interpretado por :class:`PrositePattern` (com cache, ver
+    :func:`compilar_prosite`), que suporta a gramática completa:
     - ``-`` (separador) é removido;
     - ``x`` vira ``.`` (qualquer carácter);
+    - ``[...]`` vira classe ``[...]`` (``>`` lá dentro aceita o fim da sequência);
     - ``{...}`` vira classe negada ``[^...]``;
     - ``(n)`` e ``(n,m)`` viram quantificadores regex ``{n}`` e ``{n,m}``;
     - ``<`` no início ancora ao início da string (``^``);
@@ -20,6 +254,7 @@ def prosite_para_regex(padrao):
         str: Expressão regular compatível com o módulo :mod:`re`.
 
     Raises:
+        ValueError: Se o padrão não respeitar a gramática PROSITE.
         TypeError: Se ``padrao`` não for string.
 
     Examples:
@@ -29,45 +264,333 @@ def prosite_para_regex(padrao):
         '^A.{3}G$'
         >>> prosite_para_regex("C-{GP}-x-C")
         'C[^GP].C'
+        >>> prosite_para_regex("[AC]-x(0,1)-[ST>]")
+        '[AC].{0,1}(?:[ST]|$)'
     """
-    regex = padrao.replace('-', '')
-    regex = regex.replace('x', '.')
-    regex = regex.replace('{', '[^').replace('}', ']')
-
-    regex = re.sub(r'\((\d+),(\d+)\)', r'{\1,\2}', regex)
-    regex = re.sub(r'\((\d+)\)', r'{\1}', regex)
+    return compilar_prosite(padrao).regex
 
-    if regex.startswith('<'):
-        regex = '^' + regex[1:]
-    if regex.endswith('>'):
-        regex = regex[:-1] + '$'
 
-    return regex
-
-
-def procurar_motifs(sequencia, padrao_prosite):
+def procurar_motifs(sequencia, padrao_prosite, sobrepostos=False):
     """Procura ocorrências de um motif PROSITE numa sequência.
 
-    Converte o padrão PROSITE para regex (via :func:`prosite_para_regex`) e usa
-    :func:`re.finditer` para obter as posições iniciais (0-based) de cada match.
+    O padrão é compilado uma única vez (ver :func:`compilar_prosite`) e as
+    ocorrências são obtidas com :meth:`PrositePattern.finditer`, que devolve as
+    posições iniciais (0-based) de cada match. Por omissão, como em
+    :func:`re.finditer`, a procura continua no fim de cada match; com
+    ``sobrepostos=True`` são devolvidas todas as posições onde o motif começa,
+    numa única passagem linear (sem recomeçar a procura em cada posição).
 
     Args:
-        sequencia (str): Sequência onde procurar (DNA/RNA/proteína, dependendo do padrão).
+        sequencia (str | bytes-like): Sequência onde procurar (DNA/RNA/proteína,
+            dependendo do padrão).
         padrao_prosite (str): Padrão no formato PROSITE.
+        sobrepostos (bool, optional): Incluir as ocorrências sobrepostas. Por
+            omissão ``False``.
 
     Returns:
         list[int]: Lista de posições iniciais (0-based) onde o motif ocorre.
 
     Raises:
-        re.error: Se o padrão convertido gerar uma regex inválida.
-        TypeError: Se os argumentos não forem strings.
+        ValueError: Se o padrão não respeitar a gramática PROSITE.
+        TypeError: Se ``padrao_prosite`` não for string.
 
     Examples:
         >>> procurar_motifs("ACCCAC", "C-x(2)-C")
-        [1]
+        [2]
+        >>> procurar_motifs("AAAA", "AA"), procurar_motifs("AAAA", "AA", sobrepostos=True)
+        ([0, 2], [0, 1, 2])
+    """
+    padrao = compilar_prosite(padrao_prosite)
+    return [inicio for inicio, _ in padrao.finditer(sequencia, sobrepostos=sobrepostos)]
+
+
+class _AutomatoAhoCorasick:
+    """Automato de Aho–Corasick sobre bytes, para procurar muitas palavras de uma vez.
+
+    As transições são completadas na construção (cada estado sabe para onde ir
+    com qualquer byte do alfabeto das palavras), pelo que a procura faz uma
+    única consulta a um dicionário por byte da sequência, sem seguir ligações
+    de falha.
+
+    Args:
+        palavras (Sequence[bytes]): Palavras a procurar (não vazias).
+        ignorar_maiusculas (bool, optional): Se ``True`` (palavras em maiúsculas),
+            as letras minúsculas da sequência seguem as mesmas transições.
+    """
+
+    def __init__(self, palavras, ignorar_maiusculas=False):
+        self.palavras = list(palavras)
+        transicoes = [{}]
+        saidas = [[]]
+        for indice, palavra in enumerate(self.palavras):
+            estado = 0
+            for c in palavra:
+                if c not in transicoes[estado]:
+                    transicoes.append({})
+                    saidas.append([])
+                    transicoes[estado][c] = len(transicoes) - 1
+                estado = transicoes[estado][c]
+            saidas[estado].append(indice)
+
+        # BFS: ligação de falha de cada estado e transições completas
+        falha = [0] * len(transicoes)
+        delta = [dict(transicoes[0])] + [None] * (len(transicoes) - 1)
+        fila = deque(transicoes[0].values())
+        while fila:
+            estado = fila.popleft()
+            delta[estado] = dict(delta[falha[estado]])
+            delta[estado].update(transicoes[estado])
+            saidas[estado] = saidas[estado] + saidas[falha[estado]]
+            for c, filho in transicoes[estado].items():
+                falha[filho] = delta[falha[estado]].get(c, 0)
+                fila.append(filho)
+        if ignorar_maiusculas:
+            for transicoes_estado in delta:
+                for c, destino in list(transicoes_estado.items()):
+                    if 65 <= c <= 90:
+                        transicoes_estado.setdefault(c + 32, destino)
+        self._delta = delta
+        self._saidas = [tuple(s) for s in saidas]
+
+    def procurar(self, dados):
+        """Percorre as ocorrências (sobrepostas) de todas as palavras.
+
+        Args:
+            dados (bytes | bytearray | memoryview): Sequência onde procurar.
+
+        Yields:
+            tuple[int, int]: ``(fim, indice)``: posição a seguir ao último byte da
+            ocorrência e índice da palavra em :attr:`palavras`.
+        """
+        delta, saidas = self._delta, self._saidas
+        estado = 0
+        for i, c in enumerate(dados):
+            estado = delta[estado].get(c, 0)
+            if saidas[estado]:
+                for indice in saidas[estado]:
+                    yield i + 1, indice
+
+
+def _ancora_literal(padrao):
+    """Escolhe o maior troço literal de um padrão e o intervalo do seu deslocamento.
+
+    Um troço literal é uma sequência de elementos com um único resíduo e um
+    número fixo de repetições (ex.: ``C-G(2)`` dá ``"CGG"``). Como os elementos
+    anteriores têm comprimento entre ``minimo`` e ``maximo``, o troço começa a
+    uma distância do início do match entre a soma dos mínimos e a dos máximos.
+
+    Args:
+        padrao (PrositePattern): Padrão compilado.
+
+    Returns:
+        tuple[str, int, int] | None: ``(literal, desvio_min, desvio_max)``, ou
+        ``None`` se o padrão não tiver resíduos literais.
+    """
+    melhor = None
+    troco, troco_min, troco_max = "", 0, 0
+    desvio_min = desvio_max = 0
+    for e in padrao.elementos + (None,):
+        literal = (e is not None and not e.negado and len(e.simbolos) == 1
+                   and not e.ou_fim and e.minimo == e.maximo)
+        if literal:
+            if not troco:
+                troco_min, troco_max = desvio_min, desvio_max
+            troco += e.simbolos * e.minimo
+        else:
+            if troco and (melhor is None or len(troco) > len(melhor[0])):
+                melhor = (troco, troco_min, troco_max)
+            troco = ""
+        if e is not None:
+            desvio_min += 0 if e.ou_fim else e.minimo
+            desvio_max += e.maximo
+    return melhor
+
+
+class BibliotecaProsite:
+    """Biblioteca de padrões PROSITE procurados todos numa única passagem.
+
+    Cada padrão é compilado (:func:`compilar_prosite`) e reduzido ao seu maior
+    troço literal (a âncora) e ao intervalo de deslocamentos em que este pode
+    aparecer num match. As âncoras de todos os padrões (partilhadas quando são
+    iguais) são reunidas num automato de Aho–Corasick, que percorre cada
+    sequência uma única vez; cada ocorrência de uma âncora gera posições
+    candidatas, verificadas com ``regex.match`` do padrão respetivo. Os padrões
+    sem âncora com pelo menos ``ancora_minima`` resíduos são procurados
+    diretamente com a sua regex.
+
+    Os resultados são os mesmos de :meth:`PrositePattern.finditer` (ocorrências
+    não sobrepostas de cada padrão).
+
+    Args:
+        padroes (Mapping[Hashable, str] | Iterable[str]): Padrões PROSITE; com um
+            dicionário, as chaves são os identificadores devolvidos, caso
+            contrário são usados os índices.
+        ancora_minima (int, optional): Comprimento mínimo de uma âncora para usar
+            o pré-filtro. Por omissão ``2``.
+
+    Attributes:
+        ids (list): Identificadores dos padrões, pela ordem de entrada.
+        padroes (list[PrositePattern]): Padrões compilados.
+
+    Raises:
+        ValueError: Se algum padrão for inválido ou ``ancora_minima < 1``.
+
+    Examples:
+        >>> bib = BibliotecaProsite({"zinco": "C-x(2)-C-H", "glic": "N-{P}-[ST]"})
+        >>> bib.procurar("ACAACHNGSCTTCH")
+        [('zinco', 1, 6), ('glic', 6, 9), ('zinco', 9, 14)]
+    """
+
+    def __init__(self, padroes, ancora_minima=2):
+        if ancora_minima < 1:
+            raise ValueError("A âncora mínima tem de ser >= 1.")
+        pares = list(padroes.items()) if isinstance(padroes, Mapping) else list(enumerate(padroes))
+        self.ids = [id_ for id_, _ in pares]
+        self.padroes = [compilar_prosite(p) for _, p in pares]
+
+        grupos = {}
+        self._sem_ancora = []
+        for k, padrao in enumerate(self.padroes):
+            ancora = _ancora_literal(padrao)
+            if ancora is None or len(ancora[0]) < ancora_minima or padrao.ancora_inicio:
+                self._sem_ancora.append(k)
+            else:
+                literal, desvio_min, desvio_max = ancora
+                grupos.setdefault(literal, []).append((k, desvio_min, desvio_max))
+        self._ancoras = list(grupos)
+        self._grupos = [grupos[a] for a in self._ancoras]
+        self._automato = _AutomatoAhoCorasick([a.encode("ascii") for a in self._ancoras])
+
+    def __len__(self):
+        return len(self.padroes)
+
+    def __repr__(self):
+        return f"BibliotecaProsite({len(self)} padrões, {len(self._ancoras)} âncoras)"
+
+    def procurar(self, sequencia, sobrepostos=False):
+        """Procura todos os padrões numa sequência.
+
+        Args:
+            sequencia (str | bytes-like): Sequência onde procurar.
+            sobrepostos (bool, optional): Incluir as ocorrências sobrepostas de
+                cada padrão (ver :meth:`PrositePattern.finditer`).
+
+        Returns:
+            list[tuple[Hashable, int, int]]: ``(id_padrao, inicio, fim)`` de cada
+            ocorrência, ordenadas por ``inicio`` e pela ordem dos padrões.
+        """
+        if isinstance(sequencia, str):
+            dados = sequencia.encode("latin-1", "replace")
+        elif isinstance(sequencia, (bytes, bytearray)):
+            dados = sequencia
+        else:
+            dados = memoryview(sequencia).cast("B")
+
+        candidatos = {}
+        for fim, a in self._automato.procurar(dados):
+            inicio_ancora = fim - len(self._ancoras[a])
+            for k, desvio_min, desvio_max in self._grupos[a]:
+                if inicio_ancora >= desvio_min:
+                    candidatos.setdefault(k, set()).update(
+                        range(max(inicio_ancora - desvio_max, 0), inicio_ancora - desvio_min + 1))
+
+        resultados = []
+        for k, posicoes in candidatos.items():
+            regex = self.padroes[k].compilado(sequencia)
+            limite = 0
+            for inicio in sorted(posicoes):
+                if inicio < limite:
+                    continue
+                m = regex.match(sequencia, inicio)
+                if m:
+                    resultados.append((m.start(), k, m.end()))
+                    limite = inicio if sobrepostos else m.end()
+        for k in self._sem_ancora:
+            resultados.extend((inicio, k, fim)
+                              for inicio, fim in self.padroes[k].finditer(sequencia, sobrepostos=sobrepostos))
+        resultados.sort()
+        return [(self.ids[k], inicio, fim) for inicio, k, fim in resultados]
+
+    def procurar_muitas(self, sequencias, processos=None, chunksize=16, sobrepostos=False):
+        """Procura todos os padrões em muitas sequências, em vários processos.
+
+        A biblioteca é enviada a cada processo trabalhador uma única vez, no seu
+        arranque; as tarefas transportam apenas blocos de ``chunksize``
+        sequências. As sequências são lidas à medida que há processos livres (no
+        máximo ``2*processos`` blocos em curso), pelo que uma fonte muito grande
+        (ex.: :func:`bioinf.io.ler_fasta`) nunca é carregada toda em memória.
+
+        Args:
+            sequencias (Iterable[str | bytes]): Sequências onde procurar.
+            processos (int | None, optional): Número de processos trabalhadores
+                (``None`` usa o número de CPUs; ``1`` corre no processo atual).
+            chunksize (int, optional): Número de sequências por tarefa. Por
+                omissão ``16``.
+            sobrepostos (bool, optional): Incluir as ocorrências sobrepostas.
+
+        Yields:
+            list[tuple[Hashable, int, int]]: Resultado de :meth:`procurar` para
+            cada sequência, pela ordem de entrada.
+
+        Raises:
+            ValueError: Se ``processos`` ou ``chunksize`` forem inválidos.
+
+        Examples:
+            >>> bib = BibliotecaProsite(["C-x-C-H"])
+            >>> list(bib.procurar_muitas(["CACH", "AAAA"], processos=1))
+            [[(0, 0, 4)], []]
+        """
+        if processos is not None and processos < 1:
+            raise ValueError("O número de processos tem de ser >= 1.")
+        if chunksize < 1:
+            raise ValueError("O chunksize tem de ser >= 1.")
+        if processos == 1:
+            return (self.procurar(seq, sobrepostos) for seq in sequencias)
+        return _procurar_em_processos(self, sequencias, processos, chunksize, sobrepostos)
+
+
+_ESTADO_TRABALHADOR = {}
+"""dict: Estado de cada processo trabalhador, definido uma vez por :func:`_iniciar_trabalhador`."""
+
+
+def _iniciar_trabalhador(biblioteca, sobrepostos):
+    """Guarda a biblioteca no processo trabalhador (corre uma vez por processo)."""
+    _ESTADO_TRABALHADOR["biblioteca"] = biblioteca
+    _ESTADO_TRABALHADOR["sobrepostos"] = sobrepostos
+
+
+def _procurar_tarefa(sequencia):
+    """Procura a biblioteca do processo trabalhador atual numa sequência."""
+    return _ESTADO_TRABALHADOR["biblioteca"].procurar(sequencia, _ESTADO_TRABALHADOR["sobrepostos"])
+
+
+def _procurar_bloco(sequencias):
+    """Procura a biblioteca do processo trabalhador atual num bloco de sequências."""
+    return [_procurar_tarefa(sequencia) for sequencia in sequencias]
+
+
+def _procurar_em_processos(biblioteca, sequencias, processos, chunksize, sobrepostos):
+    """Distribui blocos de sequências por um ``ProcessPoolExecutor`` e produz os resultados por ordem.
+
+    Ao contrário de ``Executor.map``, que submete logo todas as tarefas, só há
+    ``2*processos`` blocos submetidos de cada vez: um novo bloco é lido de
+    ``sequencias`` quando o resultado do mais antigo é produzido.
     """
-    regex = prosite_para_regex(padrao_prosite)
-    return [m.start() for m in re.finditer(regex, sequencia)]
+    processos = processos or os.cpu_count() or 1
+    sequencias = iter(sequencias)
+    blocos = iter(lambda: list(islice(sequencias, chunksize)), [])
+    executor = ProcessPoolExecutor(max_workers=processos, initializer=_iniciar_trabalhador,
+                                   initargs=(biblioteca, sobrepostos))
+    pendentes = deque()
+    try:
+        for bloco in blocos:
+            pendentes.append(executor.submit(_procurar_bloco, bloco))
+            if len(pendentes) >= 2*processos:
+                yield from pendentes.popleft().result()
+        while pendentes:
+            yield from pendentes.popleft().result()
+    finally:
+        executor.shutdown(cancel_futures=True)
 
 
 def enzima_para_regex(sitio):
@@ -80,7 +603,8 @@ def enzima_para_regex(sitio):
 
     Nota:
         Apesar do nome, esta função **não** converte códigos de ambiguidade para
-        regex; devolve apenas a sequência literal e o índice do corte.
+        regex; devolve apenas a sequência literal e o índice do corte. A
+        expansão IUPAC é feita por :class:`PainelEnzimas`.
 
     Args:
         sitio (str): Sítio de enzima com ``^`` (ex.: ``"G^AATTC"``).
@@ -103,46 +627,445 @@ def enzima_para_regex(sitio):
     return seq, corte
 
 
-def fragmentar_dna(sequencia, sitio_enzima):
+_IUPAC = {
+    "A": "A", "C": "C", "G": "G", "T": "T",
+    "R": "AG", "Y": "CT", "S": "CG", "W": "AT", "K": "GT", "M": "AC",
+    "B": "CGT", "D": "AGT", "H": "ACT", "V": "ACG", "N": "ACGT",
+}
+"""dict[str, str]: Bases representadas por cada código IUPAC de nucleótidos."""
+
+_COMPLEMENTO_IUPAC = str.maketrans("ACGTRYSWKMBDHVN", "TGCAYRSWMKVHDBN")
+
+Corte = namedtuple("Corte", ["posicao", "enzima"])
+Corte.__doc__ = """Posição de corte de uma enzima de restrição.
+
+Attributes:
+    posicao (int): Posição (0-based) na cadeia direta antes da qual a enzima corta.
+    enzima (str): Nome da enzima.
+"""
+
+Fragmento = namedtuple("Fragmento", ["inicio", "fim", "enzima"])
+Fragmento.__doc__ = """Fragmento de uma digestão, em coordenadas (sem cópia da subsequência).
+
+Attributes:
+    inicio (int): Posição do primeiro nucleótido do fragmento.
+    fim (int): Posição a seguir ao último nucleótido. Em sequências circulares,
+        o fragmento que atravessa a origem tem ``fim > len(sequencia)``.
+    enzima (str | None): Enzima que corta em ``inicio`` (``None`` no primeiro
+        fragmento de uma sequência linear ou numa circular sem cortes).
+"""
+
+
+def _regex_iupac(sitio):
+    """Converte um sítio IUPAC (sem ``^``) numa regex com classes de bases."""
+    return "".join(b if len(_IUPAC[b]) == 1 else f"[{_IUPAC[b]}]" for b in sitio)
+
+
+def _padrao_sitio(sitio):
+    """Padrão de procura (sobreposta, em maiúsculas) de um sítio IUPAC.
+
+    Returns:
+        bytes | re.Pattern: O próprio sítio se for literal (procurado com
+        ``bytes.find``), senão uma regex cuja primeira base, se não for
+        degenerada, fica fora do *lookahead* para o motor usar a procura rápida
+        de prefixo literal.
+    """
+    if all(len(_IUPAC[b]) == 1 for b in sitio):
+        return sitio.encode("ascii")
+    if len(_IUPAC[sitio[0]]) == 1:
+        return re.compile(f"{sitio[0]}(?={_regex_iupac(sitio[1:])})".encode("ascii"))
+    return re.compile(f"(?={_regex_iupac(sitio)})".encode("ascii"))
+
+
+def _procurar_sitio(padrao, dados):
+    """Percorre as posições (sobrepostas) de um padrão de :func:`_padrao_sitio`."""
+    if isinstance(padrao, bytes):
+        p = dados.find(padrao)
+        while p != -1:
+            yield p
+            p = dados.find(padrao, p + 1)
+        return
+    for m in padrao.finditer(dados):
+        yield m.start()
+
+
+def _expandir_iupac(sitio, limite):
+    """Expande um sítio IUPAC em todas as sequências literais que representa.
+
+    Returns:
+        list[str] | None: Variantes literais, ou ``None`` se forem mais do que ``limite``.
+    """
+    total = 1
+    for b in sitio:
+        total *= len(_IUPAC[b])
+    if total > limite:
+        return None
+    variantes = [""]
+    for b in sitio:
+        variantes = [v + base for v in variantes for base in _IUPAC[b]]
+    return variantes
+
+
+class PainelEnzimas:
+    """Painel de enzimas de restrição digerido de uma só vez.
+
+    Cada sítio (com códigos IUPAC, ex.: ``"G^ANTC"``) é procurado na cadeia
+    direta e no complemento inverso (este só se o sítio não for palíndromo). Um
+    sítio na cadeia direta na posição ``p`` dá um corte em ``p + c`` (``c`` é a
+    posição do ``^``); um sítio no complemento inverso dá um corte em
+    ``p + L - c`` (``L`` é o comprimento do sítio).
+
+    Painéis pequenos (até ``max_varreduras`` padrões, contando cada enzima uma
+    vez por cadeia) são procurados padrão a padrão com ``bytes.find`` (sítios
+    literais) ou com uma regex (sítios degenerados): são várias passagens, mas
+    cada uma corre em C (sobre uma cópia da sequência em maiúsculas) e é muito
+    mais rápida do que o automato, que avança em Python base a base. Nos painéis
+    maiores, as variantes literais de todas as enzimas são reunidas num único
+    automato de Aho–Corasick, que percorre a sequência uma vez; aí, as enzimas
+    com mais de ``max_variantes`` variantes (ex.: muitos ``N``) continuam a ser
+    procuradas com uma regex.
+
+    Args:
+        enzimas (Mapping[str, str] | Iterable[str]): Sítios com a marca de corte
+            ``^``; com um dicionário, as chaves são os nomes das enzimas, caso
+            contrário o nome é o próprio sítio.
+        max_variantes (int, optional): Número máximo de variantes literais por
+            sítio e cadeia para entrar no automato. Por omissão ``256``.
+        max_varreduras (int, optional): Número máximo de padrões procurados
+            diretamente (uma passagem em C por padrão); acima disto usa-se o
+            automato. Por omissão ``12``.
+
+    Attributes:
+        nomes (list[str]): Nomes das enzimas, pela ordem do painel.
+        sitios (list[tuple[str, int]]): ``(sitio, corte)`` de cada enzima, em maiúsculas.
+
+    Raises:
+        ValueError: Se um sítio não tiver ``^`` ou tiver símbolos não IUPAC.
+
+    Examples:
+        >>> painel = PainelEnzimas({"EcoRI": "G^AATTC", "HinfI": "G^ANTC"})
+        >>> painel.cortes("TTGAATTCAAGACTCA")
+        [Corte(posicao=3, enzima='EcoRI'), Corte(posicao=11, enzima='HinfI')]
+        >>> painel.digerir("TTGAATTCAAGACTCA")
+        [Fragmento(inicio=0, fim=3, enzima=None), Fragmento(inicio=3, fim=11, enzima='EcoRI'), Fragmento(inicio=11, fim=16, enzima='HinfI')]
+    """
+
+    def __init__(self, enzimas, max_variantes=256, max_varreduras=12):
+        pares = list(enzimas.items()) if isinstance(enzimas, Mapping) else [(s, s) for s in enzimas]
+        self.nomes = [nome for nome, _ in pares]
+        self.sitios = []
+        fitas = []
+        for k, (nome, sitio) in enumerate(pares):
+            literal, corte = enzima_para_regex(sitio.upper())
+            invalidos = set(literal) - set(_IUPAC)
+            if invalidos or not literal:
+                raise ValueError(f"Sítio inválido para {nome!r}: {sitio!r}.")
+            self.sitios.append((literal, corte))
+            inverso = literal.translate(_COMPLEMENTO_IUPAC)[::-1]
+            fitas.append((k, "+", literal))
+            if inverso != literal:
+                fitas.append((k, "-", inverso))
+        self._comprimento_max = max((len(s) for s, _ in self.sitios), default=0)
+
+        # padrões procurados diretamente (todos, se o painel for pequeno) e automato
+        self._diretos = []
+        self._automato = None
+        if len(fitas) <= max_varreduras:
+            self._diretos = [(k, fita, _padrao_sitio(s)) for k, fita, s in fitas]
+            return
+        palavras = {}
+        for k, fita, s in fitas:
+            variantes = _expandir_iupac(s, max_variantes)
+            if variantes is None:
+                self._diretos.append((k, fita, _padrao_sitio(s)))
+            else:
+                for v in variantes:
+                    palavras.setdefault(v.encode("ascii"), []).append((k, fita))
+        self._palavras = list(palavras.values())
+        self._automato = _AutomatoAhoCorasick(list(palavras), ignorar_maiusculas=True)
+
+    def __len__(self):
+        return len(self.nomes)
+
+    def __repr__(self):
+        return f"PainelEnzimas({self.nomes!r})"
+
+    def _posicao_corte(self, k, fita, inicio_sitio):
+        """Posição de corte de um sítio da enzima ``k`` que começa em ``inicio_sitio``."""
+        literal, corte = self.sitios[k]
+        return inicio_sitio + (corte if fita == "+" else len(literal) - corte)
+
+    def _ocorrencias(self, dados, circular):
+        """Percorre ``(inicio_sitio, k, fita)`` de todos os sítios (com repetições).
+
+        Em sequências circulares, a procura continua ``L - 1`` bases para lá do
+        fim (voltando ao início), para encontrar os sítios que atravessam a origem.
+        """
+        n = len(dados)
+        extra = min(self._comprimento_max - 1, n) if circular else 0
+        if self._automato is not None:
+            for fim, indice in self._automato.procurar(chain(dados, bytes(dados[:extra]))):
+                for k, fita in self._palavras[indice]:
+                    inicio = fim - len(self.sitios[k][0])
+                    if inicio < n:
+                        yield inicio, k, fita
+        if self._diretos:
+            # os padrões diretos são em maiúsculas (a cópia custa menos do que
+            # procurar minúsculas ou usar regex sem distinção de maiúsculas)
+            dados = bytes(dados).upper()
+            # na sequência e, se circular, na junção fim→início
+            cauda = bytes(dados[n - extra:]) + bytes(dados[:extra]) if extra else b""
+            for k, fita, padrao in self._diretos:
+                comprimento = len(self.sitios[k][0])
+                for inicio in _procurar_sitio(padrao, dados):
+                    yield inicio, k, fita
+                for inicio in _procurar_sitio(padrao, cauda):
+                    if inicio < extra and comprimento > extra - inicio:
+                        yield n - extra + inicio, k, fita
+
+    def _posicoes_ordenadas(self, dados):
+        """Percorre as posições de corte distintas, por ordem, numa sequência linear.
+
+        Cada padrão direto produz os seus cortes por ordem; os do automato saem
+        desordenados no máximo ``L`` posições e são reordenados numa janela. Os
+        fluxos são fundidos e as repetições descartadas sem guardar os cortes
+        (nem objetos :class:`Corte`).
+        """
+        n = len(dados)
+        fluxos = []
+        if self._automato is not None:
+            fluxos.append(self._posicoes_automato(dados))
+        if self._diretos:
+            maiusculas = bytes(dados).upper()
+            fluxos.extend(self._posicoes_padrao(k, fita, padrao, maiusculas)
+                          for k, fita, padrao in self._diretos)
+        anterior = None
+        for posicao in heapq.merge(*fluxos):
+            if posicao != anterior and 0 <= posicao <= n:
+                yield posicao
+                anterior = posicao
+
+    def _posicoes_padrao(self, k, fita, padrao, dados):
+        """Cortes (ordenados) de um padrão direto."""
+        for inicio in _procurar_sitio(padrao, dados):
+            yield self._posicao_corte(k, fita, inicio)
+
+    def _posicoes_automato(self, dados):
+        """Cortes do automato, ordenados numa janela de ``L`` posições."""
+        janela = []
+        for fim, indice in self._automato.procurar(dados):
+            # os sítios seguintes acabam em ``fim`` ou depois: cortam em ``fim - L`` ou depois
+            while janela and janela[0] < fim - self._comprimento_max:
+                yield heapq.heappop(janela)
+            for k, fita in self._palavras[indice]:
+                heapq.heappush(janela, self._posicao_corte(k, fita, fim - len(self.sitios[k][0])))
+        while janela:
+            yield heapq.heappop(janela)
+
+    def cortes(self, sequencia, circular=False):
+        """Calcula todas as posições de corte do painel numa sequência.
+
+        Args:
+            sequencia (str | bytes-like): Sequência de DNA (case-insensitive).
+            circular (bool, optional): Tratar a sequência como circular (ex.:
+                plasmídeo): os sítios podem atravessar a origem e as posições são
+                tomadas módulo ``len(sequencia)``. Por omissão ``False``.
+
+        Returns:
+            list[Corte]: Cortes ordenados por posição e, na mesma posição, pela
+            ordem das enzimas no painel (sem repetições).
+        """
+        dados = _como_bytes(sequencia)
+        n = len(dados)
+        unicos = set()
+        for inicio, k, fita in self._ocorrencias(dados, circular):
+            posicao = self._posicao_corte(k, fita, inicio)
+            if circular:
+                unicos.add((posicao % n, k))
+            elif 0 <= posicao <= n:
+                unicos.add((posicao, k))
+        return [Corte(posicao, self.nomes[k]) for posicao, k in sorted(unicos)]
+
+    def digerir(self, sequencia, circular=False, tamanho_min=0, tamanho_max=None):
+        """Digere uma sequência com todas as enzimas do painel.
+
+        Os fragmentos são devolvidos como coordenadas (sem copiar subsequências);
+        o fragmento ``f`` é ``sequencia[f.inicio:f.fim]`` (nas circulares, o que
+        atravessa a origem é ``sequencia[f.inicio:] + sequencia[:f.fim - n]``).
+
+        Args:
+            sequencia (str | bytes-like): Sequência de DNA (case-insensitive).
+            circular (bool, optional): Tratar a sequência como circular.
+            tamanho_min (int, optional): Comprimento mínimo dos fragmentos
+                devolvidos (seleção de tamanhos). Por omissão ``0``.
+            tamanho_max (int | None, optional): Comprimento máximo (sem limite
+                por omissão).
+
+        Returns:
+            list[Fragmento]: Fragmentos não vazios, ordenados por ``inicio``. Se
+            várias enzimas cortarem na mesma posição, ``enzima`` é a primeira do
+            painel.
+        """
+        return list(self.fragmentos(sequencia, circular, tamanho_min, tamanho_max))
+
+    def fragmentos(self, sequencia, circular=False, tamanho_min=0, tamanho_max=None):
+        """Versão geradora de :meth:`digerir`.
+
+        Os cortes são calculados de uma vez (só posições inteiras); os
+        fragmentos são produzidos um a um e filtrados pelo comprimento, sem
+        nunca criar as subsequências.
+
+        Yields:
+            Fragmento: Fragmentos com ``tamanho_min <= fim - inicio <= tamanho_max``.
+        """
+        n = len(sequencia)
+        posicoes, enzimas = [], []
+        for corte in self.cortes(sequencia, circular):
+            if not posicoes or posicoes[-1] != corte.posicao:
+                posicoes.append(corte.posicao)
+                enzimas.append(corte.enzima)
+        return _filtrar_tamanho(_fragmentos_painel(posicoes, enzimas, n, circular),
+                                max(tamanho_min, 1), tamanho_max)
+
+
+def _como_bytes(sequencia):
+    """Converte uma sequência (``str`` ou bytes-like) em bytes indexáveis."""
+    dados = sequencia.encode("latin-1", "replace") if isinstance(sequencia, str) else sequencia
+    if not isinstance(dados, (bytes, bytearray)):
+        dados = memoryview(dados).cast("B")
+    return dados
+
+
+def _fragmentos_painel(posicoes, enzimas, n, circular):
+    """Produz os :class:`Fragmento` entre cortes consecutivos (distintos e ordenados)."""
+    if circular:
+        if not posicoes:
+            yield Fragmento(0, n, None)
+            return
+        yield from (Fragmento(a, b, e) for a, b, e in zip(posicoes, posicoes[1:], enzimas))
+        yield Fragmento(posicoes[-1], posicoes[0] + n, enzimas[-1])
+        return
+    limites = [0] + posicoes + [n]
+    yield from (Fragmento(a, b, e) for a, b, e in zip(limites, limites[1:], [None] + enzimas))
+
+
+def _filtrar_tamanho(fragmentos, tamanho_min, tamanho_max):
+    """Filtra fragmentos ``(inicio, fim, ...)`` pelo comprimento ``fim - inicio``."""
+    for f in fragmentos:
+        tamanho = f[1] - f[0]
+        if tamanho >= tamanho_min and (tamanho_max is None or tamanho <= tamanho_max):
+            yield f
+
+
+def estatisticas_fragmentos(fragmentos):
+    """Calcula estatísticas de tamanho de fragmentos sem criar subsequências.
+
+    Aceita coordenadas ``(inicio, fim)`` (ou :class:`Fragmento`) e também
+    ``memoryview``/strings, de que só é usado o comprimento; pode ser um
+    gerador (ex.: de :func:`fragmentar_dna` com ``preguicoso=True``), que é
+    consumido uma vez guardando apenas os comprimentos.
+
+    Args:
+        fragmentos (Iterable[tuple[int, int] | Sized]): Fragmentos.
+
+    Returns:
+        dict: Chaves ``numero``, ``total`` (soma dos comprimentos), ``minimo``,
+        ``maximo``, ``media``, ``mediana`` e ``n50`` (``None`` nas estatísticas
+        de posição se não houver fragmentos).
+
+    Examples:
+        >>> estatisticas_fragmentos([(0, 3), (3, 10), (10, 12)])["n50"]
+        7
+    """
+    tamanhos = sorted(f[1] - f[0] if isinstance(f, tuple) else len(f) for f in fragmentos)
+    numero, total = len(tamanhos), sum(tamanhos)
+    estatisticas = {"numero": numero, "total": total, "minimo": None, "maximo": None,
+                    "media": None, "mediana": None, "n50": None}
+    if not numero:
+        return estatisticas
+    meio = numero // 2
+    acumulado = 0
+    for tamanho in reversed(tamanhos):
+        acumulado += tamanho
+        if 2 * acumulado >= total:
+            estatisticas["n50"] = tamanho
+            break
+    estatisticas.update(minimo=tamanhos[0], maximo=tamanhos[-1], media=total / numero,
+                        mediana=tamanhos[meio] if numero % 2 else (tamanhos[meio-1] + tamanhos[meio]) / 2)
+    return estatisticas
+
+
+def fragmentar_dna(sequencia, sitio_enzima, preguicoso=False, vistas=False, tamanho_min=0,
+                   tamanho_max=None):
     """Fragmenta uma sequência de DNA com base num sítio de restrição.
 
     O processo é:
-    1) Extrair o padrão do sítio e a posição de corte (via :func:`enzima_para_regex`).
-    2) Encontrar todas as ocorrências do padrão na sequência (como *match literal*).
-    3) Gerar as posições de corte (offset + corte) e devolver os fragmentos.
+    1) Construir um :class:`PainelEnzimas` com a enzima (o sítio pode ter códigos
+       IUPAC e é procurado nas duas cadeias).
+    2) Calcular as posições de corte (``p + corte`` na cadeia direta,
+       ``p + L - corte`` no complemento inverso).
+    3) Devolver os fragmentos entre cortes consecutivos.
+
+    Com ``preguicoso=True`` os fragmentos não são copiados: é devolvido um
+    gerador de coordenadas ``(inicio, fim)`` ou, com ``vistas=True``, de fatias
+    ``memoryview`` sobre o buffer original (``bytes``, ``bytearray``, ``mmap``).
+    As posições de corte são ordenadas e deduplicadas à medida que são
+    encontradas e guardadas num ``array('q')`` (8 bytes por corte, sem objetos
+    :class:`Corte`); além disso, só durante a procura, existe uma cópia da
+    sequência em maiúsculas. O gerador pode ser filtrado por tamanho e passado
+    a :func:`estatisticas_fragmentos` ou a outros passos.
 
     Args:
-        sequencia (str): Sequência de DNA a fragmentar.
+        sequencia (str | bytes-like): Sequência de DNA a fragmentar.
         sitio_enzima (str): Sítio com marca de corte ``^`` (ex.: ``"G^AATTC"``).
+        preguicoso (bool, optional): Devolver um gerador em vez de listas.
+        vistas (bool, optional): No modo preguiçoso, produzir ``memoryview`` em
+            vez de coordenadas (requer uma sequência bytes-like).
+        tamanho_min (int, optional): Comprimento mínimo dos fragmentos devolvidos.
+            Por omissão ``0``.
+        tamanho_max (int | None, optional): Comprimento máximo dos fragmentos
+            devolvidos (sem limite por omissão).
 
     Returns:
-        tuple[list[str], list[int]]: ``(fragmentos, cortes)``, onde:
+        tuple[list[str], list[int]] | Iterator[tuple[int, int] | memoryview]:
+        Por omissão ``(fragmentos, cortes)``, onde:
         - ``fragmentos`` é a lista de fragmentos resultantes (strings),
         - ``cortes`` é a lista de posições de corte (0-based) na sequência original.
+        Com ``preguicoso=True``, o gerador dos fragmentos pela ordem da sequência.
 
     Raises:
-        ValueError: Se ``sitio_enzima`` não contiver ``^``.
-        re.error: Se o padrão produzir um erro de regex (pouco provável aqui porque é literal).
-        TypeError: Se os argumentos não forem strings.
+        ValueError: Se ``sitio_enzima`` não contiver ``^`` ou tiver símbolos não IUPAC.
+        TypeError: Se ``vistas=True`` e a sequência não for bytes-like.
 
     Examples:
         >>> fragmentar_dna("TTGAATTCAA", "G^AATTC")
         (['TTG', 'AATTCAA'], [3])
+        >>> fragmentar_dna("AAGACGCAAGCGTCAA", "GAC^GC")  # sítio também na cadeia inversa
+        (['AAGAC', 'GCAAGC', 'GTCAA'], [5, 11])
+        >>> list(fragmentar_dna(b"AAGACGCAAGCGTCAA", "GAC^GC", preguicoso=True, tamanho_min=6))
+        [(5, 11)]
     """
-    padrao, corte = enzima_para_regex(sitio_enzima)
-    posicoes = [m.start() for m in re.finditer(padrao, sequencia)]
-    cortes = [p + corte for p in posicoes]
+    painel = PainelEnzimas([sitio_enzima])
+    if preguicoso:
+        buffer = memoryview(sequencia).cast("B") if vistas else None
+        cortes = array("q", painel._posicoes_ordenadas(_como_bytes(sequencia)))
+        limites = zip(chain((0,), cortes), chain(cortes, (len(sequencia),)))
+        return _fragmentos_preguicosos(limites, buffer, tamanho_min, tamanho_max)
+
+    cortes = list(painel._posicoes_ordenadas(_como_bytes(sequencia)))
+    limites = zip(chain((0,), cortes), chain(cortes, (len(sequencia),)))
 
     fragmentos = []
-    inicio = 0
+    for inicio, fim in _filtrar_tamanho(limites, tamanho_min, tamanho_max):
+        fragmentos.append(sequencia[inicio:fim])
 
-    for c in cortes:
-        fragmentos.append(sequencia[inicio:c])
-        inicio = c
+    return fragmentos, cortes
 
-    fragmentos.append(sequencia[inicio:] if inicio < len(sequencia) else '')
 
-    return fragmentos, cortes
+def _fragmentos_preguicosos(limites, buffer, tamanho_min, tamanho_max):
+    """Gerador de :func:`fragmentar_dna` no modo preguiçoso."""
+    for inicio, fim in _filtrar_tamanho(limites, tamanho_min, tamanho_max):
+        yield (inicio, fim) if buffer is None else buffer[inicio:fim]
 
 
 def criar_pwm(lista_seqs, pseudocount=1):
@@ -1,18 +1,222 @@
-def validar_dna(seq):
+import re
+from bisect import bisect_right
+from collections import namedtuple
+from functools import lru_cache
+
+_TAMANHO_BLOCO = 1 << 22
+"""int: Tamanho (em bytes) dos blocos em que as sequências longas são convertidas."""
+
+
+def _tabela_traducao(pares):
+    """Constrói uma tabela de tradução de 256 bytes para ``bytes.translate``.
+
+    Cada símbolo de ``pares`` (em maiúsculas e minúsculas) é mapeado para o seu
+    destino; todos os outros bytes são mapeados para ``0``, que serve de
+    sentinela de símbolo inválido.
+
+    Args:
+        pares (dict[str, str]): Mapa símbolo -> símbolo de destino.
+
+    Returns:
+        bytes: Tabela com 256 entradas.
+    """
+    tabela = bytearray(256)
+    for origem, destino in pares.items():
+        tabela[ord(origem.upper())] = tabela[ord(origem.lower())] = ord(destino)
+    return bytes(tabela)
+
+
+_TABELA_COMPLEMENTO = _tabela_traducao({'A': 'T', 'C': 'G', 'G': 'C', 'T': 'A'})
+_TABELA_TRANSCRICAO = _tabela_traducao({'A': 'A', 'C': 'C', 'G': 'G', 'T': 'U'})
+
+
+def _traduzir(seq, tabela, inverter=False):
+    """Traduz uma sequência com uma tabela de bytes, validando na mesma passagem.
+
+    Aceita ``str`` ou qualquer objeto bytes-like (``bytes``, ``bytearray``,
+    ``memoryview``, ``mmap``). Sequências maiores do que ``_TAMANHO_BLOCO`` são
+    processadas bloco a bloco, pelo que a memória extra (além do resultado) é
+    limitada e a conversão pára no primeiro bloco com um símbolo inválido.
+
+    Args:
+        seq (str | bytes-like): Sequência a traduzir.
+        tabela (bytes): Tabela de :func:`_tabela_traducao`.
+        inverter (bool, optional): Se ``True``, devolve o resultado invertido.
+
+    Returns:
+        str | bytes | None: Sequência traduzida (``str`` para ``str``, ``bytes``
+        para bytes-like), ou ``None`` se estiver vazia ou tiver símbolos fora da
+        tabela.
+
+    Raises:
+        TypeError: Se ``seq`` não for ``str`` nem bytes-like.
+    """
+    texto = isinstance(seq, str)
+    if isinstance(seq, PackedDNA):
+        seq = bytes(seq)
+    elif not texto and not isinstance(seq, (bytes, bytearray)):
+        seq = memoryview(seq).cast("B")
+    if not len(seq):
+        return None
+
+    partes = []
+    for inicio in range(0, len(seq), _TAMANHO_BLOCO):
+        bloco = seq[inicio:inicio+_TAMANHO_BLOCO]
+        if texto:
+            try:
+                bloco = bloco.encode("latin-1")
+            except UnicodeEncodeError:
+                return None
+        elif isinstance(bloco, memoryview):
+            bloco = bloco.tobytes()
+        traduzido = bloco.translate(tabela)
+        if 0 in traduzido:
+            return None
+        partes.append(traduzido[::-1] if inverter else traduzido)
+
+    if inverter:
+        partes.reverse()
+    resultado = partes[0] if len(partes) == 1 else b"".join(partes)
+    return resultado.decode("ascii") if texto else bytes(resultado)
+
+
+def _vazia(seq):
+    """Devolve a sequência vazia do tipo de resultado correspondente a ``seq``."""
+    return b"" if isinstance(seq, (bytes, bytearray, memoryview, PackedDNA)) else ""
+
+
+_ALFABETOS = {
+    "dna": "ACGT",
+    "rna": "ACGU",
+    "proteina": "ACDEFGHIKLMNPQRSTVWY",
+}
+"""dict[str, str]: Símbolos canónicos de cada alfabeto aceite pelos validadores."""
+
+_AMBIGUOS = {
+    "dna": "RYSWKMBDHVN",
+    "rna": "RYSWKMBDHVN",
+    "proteina": "BZJX",
+}
+"""dict[str, str]: Códigos de ambiguidade IUPAC de cada alfabeto (incluem ``N``/``X``)."""
+
+
+@lru_cache(maxsize=None)
+def _tabela_validacao(alfabeto, iupac=False, permitir_n=False):
+    """Constrói a tabela de 256 bytes (1 = válido) de um alfabeto.
+
+    Args:
+        alfabeto (str): Chave de ``_ALFABETOS``.
+        iupac (bool, optional): Aceitar também os códigos de ambiguidade IUPAC.
+        permitir_n (bool, optional): Aceitar ``N`` (DNA/RNA) ou ``X`` (proteína).
+
+    Returns:
+        bytes: Tabela com 256 entradas, maiúsculas e minúsculas incluídas.
+
+    Raises:
+        ValueError: Se o alfabeto for desconhecido.
+    """
+    if alfabeto not in _ALFABETOS:
+        raise ValueError(f"Alfabeto desconhecido: {alfabeto!r}")
+    simbolos = _ALFABETOS[alfabeto]
+    if iupac:
+        simbolos += _AMBIGUOS[alfabeto]
+    elif permitir_n:
+        simbolos += "X" if alfabeto == "proteina" else "N"
+    tabela = bytearray(256)
+    for c in simbolos:
+        tabela[ord(c)] = tabela[ord(c.lower())] = 1
+    return bytes(tabela)
+
+
+@lru_cache(maxsize=None)
+def _padroes_validos(alfabeto, iupac=False, permitir_n=False):
+    """Compila, a partir da tabela de validação, o padrão "prefixo válido".
+
+    ``padrao.match(seq).end()`` é a posição do primeiro símbolo inválido: o
+    motor de expressões regulares percorre a sequência sem cópias (funciona
+    sobre ``memoryview`` e ``mmap``) e pára no primeiro símbolo fora da classe.
+
+    Returns:
+        tuple[re.Pattern, re.Pattern]: Padrões para ``str`` e para bytes-like.
+    """
+    tabela = _tabela_validacao(alfabeto, iupac, permitir_n)
+    validos = bytes(b for b in range(256) if tabela[b])
+    classe = re.escape(validos.decode("latin-1"))
+    return re.compile(f"[{classe}]*"), re.compile(f"[{classe}]*".encode("latin-1"))
+
+
+def posicao_invalida(seq, alfabeto="dna", iupac=False, permitir_n=False):
+    """Devolve a posição do primeiro símbolo inválido de uma sequência.
+
+    Usa uma tabela de 256 entradas por alfabeto (maiúsculas e minúsculas), pelo
+    que não é criada nenhuma cópia em maiúsculas; a procura pára no primeiro
+    símbolo inválido.
+
+    Args:
+        seq (str | bytes-like | PackedDNA): Sequência a validar.
+        alfabeto (str, optional): ``"dna"`` (por omissão), ``"rna"`` ou ``"proteina"``.
+        iupac (bool, optional): Aceitar os códigos de ambiguidade IUPAC
+            (``RYSWKMBDHVN`` em DNA/RNA, ``BZJX`` em proteínas).
+        permitir_n (bool, optional): Aceitar apenas ``N`` (DNA/RNA) ou ``X``
+            (proteína) além do alfabeto canónico.
+
+    Returns:
+        int: Índice do primeiro símbolo inválido, ou ``-1`` se todos forem válidos.
+
+    Raises:
+        ValueError: Se o alfabeto for desconhecido.
+        TypeError: Se ``seq`` não for string nem bytes-like.
+
+    Examples:
+        >>> posicao_invalida("ACGTXACG")
+        4
+        >>> posicao_invalida(b"acgtn", permitir_n=True)
+        -1
+        >>> posicao_invalida("ACGR", iupac=True)
+        -1
+    """
+    if isinstance(seq, PackedDNA):
+        return _posicao_invalida_compactada(seq, alfabeto, iupac, permitir_n)
+    padrao_str, padrao_bytes = _padroes_validos(alfabeto, iupac, permitir_n)
+    fim = (padrao_str if isinstance(seq, str) else padrao_bytes).match(seq).end()
+    return -1 if fim == len(seq) else fim
+
+
+def _posicao_invalida_compactada(seq, alfabeto, iupac, permitir_n):
+    """:func:`posicao_invalida` para :class:`PackedDNA`.
+
+    Se o alfabeto aceitar as quatro bases, basta consultar a máscara de ``N``;
+    caso contrário (ex.: RNA), a sequência é descompactada por blocos.
+    """
+    tabela = _tabela_validacao(alfabeto, iupac, permitir_n)
+    if all(tabela[b] for b in b"ACGT"):
+        regioes = [] if tabela[ord("N")] else seq.regioes_n()
+        return regioes[0][0] if regioes else -1
+    for inicio in range(0, len(seq), _TAMANHO_BLOCO):
+        pos = posicao_invalida(bytes(seq[inicio:inicio+_TAMANHO_BLOCO]), alfabeto, iupac, permitir_n)
+        if pos >= 0:
+            return inicio + pos
+    return -1
+
+
+def validar_dna(seq, iupac=False, permitir_n=False):
     """Valida se uma sequência contém apenas nucleótidos de DNA.
 
     Aceita as bases ``A, C, G, T`` (case-insensitive). Se a sequência for vazia
-    (``""``/``None``/falsy), devolve ``False``.
+    (``""``/``None``/falsy), devolve ``False``. A verificação é feita por
+    :func:`posicao_invalida`, sem cópias e parando no primeiro símbolo inválido.
 
     Args:
-        seq (str): Sequência a validar.
+        seq (str | bytes-like | PackedDNA): Sequência a validar.
+        iupac (bool, optional): Aceitar também os códigos de ambiguidade IUPAC.
+        permitir_n (bool, optional): Aceitar também ``N``.
 
     Returns:
-        bool: ``True`` se a sequência for não vazia e contiver apenas A/C/G/T;
-        caso contrário ``False``.
+        bool: ``True`` se a sequência for não vazia e contiver apenas A/C/G/T
+        (e os símbolos opcionais pedidos); caso contrário ``False``.
 
     Raises:
-        AttributeError: Se ``seq`` não for string e não tiver o método ``upper()``.
+        TypeError: Se ``seq`` não for string nem bytes-like.
 
     Examples:
         >>> validar_dna("ACGT")
@@ -21,30 +225,33 @@ def validar_dna(seq):
         True
         >>> validar_dna("ACGU")
         False
+        >>> validar_dna("ACGN", permitir_n=True)
+        True
         >>> validar_dna("")
         False
     """
     if not seq:
         return False
-    seq = seq.upper()
-    return set(seq).issubset({'A', 'C', 'G', 'T'})
+    return posicao_invalida(seq, "dna", iupac, permitir_n) < 0
 
 
-def validar_rna(seq):
+def validar_rna(seq, iupac=False, permitir_n=False):
     """Valida se uma sequência contém apenas nucleótidos de RNA.
 
     Aceita as bases ``A, C, G, U`` (case-insensitive). Se a sequência for vazia
     (``""``/``None``/falsy), devolve ``False``.
 
     Args:
-        seq (str): Sequência a validar.
+        seq (str | bytes-like | PackedDNA): Sequência a validar.
+        iupac (bool, optional): Aceitar também os códigos de ambiguidade IUPAC.
+        permitir_n (bool, optional): Aceitar também ``N``.
 
     Returns:
-        bool: ``True`` se a sequência for não vazia e contiver apenas A/C/G/U;
-        caso contrário ``False``.
+        bool: ``True`` se a sequência for não vazia e contiver apenas A/C/G/U
+        (e os símbolos opcionais pedidos); caso contrário ``False``.
 
     Raises:
-        AttributeError: Se ``seq`` não for string e não tiver o método ``upper()``.
+        TypeError: Se ``seq`` não for string nem bytes-like.
 
     Examples:
         >>> validar_rna("ACGU")
@@ -56,11 +263,10 @@ def validar_rna(seq):
     """
     if not seq:
         return False
-    seq = seq.upper()
-    return set(seq).issubset({'A', 'C', 'G', 'U'})
+    return posicao_invalida(seq, "rna", iupac, permitir_n) < 0
 
 
-def validar_proteina(seq):
+def validar_proteina(seq, iupac=False, permitir_x=False):
     """Valida se uma sequência contém apenas aminoácidos padrão (20 AA).
 
     Aceita o alfabeto:
@@ -68,14 +274,16 @@ def validar_proteina(seq):
     Se a sequência for vazia (``""``/``None``/falsy), devolve ``False``.
 
     Args:
-        seq (str): Sequência proteica a validar.
+        seq (str | bytes-like | PackedDNA): Sequência proteica a validar.
+        iupac (bool, optional): Aceitar também ``B``, ``Z``, ``J`` e ``X``.
+        permitir_x (bool, optional): Aceitar também ``X`` (aminoácido desconhecido).
 
     Returns:
         bool: ``True`` se a sequência for não vazia e contiver apenas aminoácidos
         do conjunto aceite; caso contrário ``False``.
 
     Raises:
-        AttributeError: Se ``seq`` não for string e não tiver o método ``upper()``.
+        TypeError: Se ``seq`` não for string nem bytes-like.
 
     Examples:
         >>> validar_proteina("ACDEFGHIKLMNPQRSTVWY")
@@ -87,39 +295,39 @@ def validar_proteina(seq):
     """
     if not seq:
         return False
-    seq = seq.upper()
-    aminoacidos = {
-        'A','C','D','E','F','G','H','I','K','L',
-        'M','N','P','Q','R','S','T','V','W','Y'
-    }
-    return set(seq).issubset(aminoacidos)
+    return posicao_invalida(seq, "proteina", iupac, permitir_x) < 0
 
 
 def transcricao(dna_seq):
     """Transcreve DNA para RNA substituindo ``T`` por ``U``.
 
     Se a sequência de entrada não for DNA válido (ver :func:`validar_dna`),
-    devolve string vazia ``""`` em vez de levantar exceção.
+    devolve string vazia ``""`` em vez de levantar exceção. A validação e a
+    conversão são feitas numa única passagem com ``bytes.translate`` (ver
+    :func:`_traduzir`).
 
     Args:
-        dna_seq (str): Sequência de DNA.
+        dna_seq (str | bytes | bytearray | memoryview): Sequência de DNA.
 
     Returns:
-        str: Sequência de RNA resultante (em maiúsculas), ou ``""`` se a entrada
-        não for DNA válido.
+        str | bytes: Sequência de RNA resultante (em maiúsculas), ou vazia se a
+        entrada não for DNA válido. É ``bytes`` se a entrada for bytes-like.
 
     Raises:
-        AttributeError: Se ``dna_seq`` não for string e não tiver ``upper()``.
+        TypeError: Se ``dna_seq`` não for string nem bytes-like.
 
     Examples:
         >>> transcricao("ATGC")
         'AUGC'
+        >>> transcricao(b"atgc")
+        b'AUGC'
         >>> transcricao("AUGC")
         ''
     """
-    if not validar_dna(dna_seq):
-        return ""
-    return dna_seq.upper().replace('T', 'U')
+    if not dna_seq:
+        return _vazia(dna_seq)
+    resultado = _traduzir(dna_seq, _TABELA_TRANSCRICAO)
+    return _vazia(dna_seq) if resultado is None else resultado
 
 
 def complemento(dna_seq):
@@ -130,31 +338,32 @@ def complemento(dna_seq):
     - C ↔ G
 
     Se a sequência de entrada não for DNA válido (ver :func:`validar_dna`),
-    devolve ``""``.
+    devolve ``""``. A validação e o complemento são feitos numa única passagem
+    com ``bytes.translate`` (ver :func:`_traduzir`), por blocos nas sequências
+    longas.
 
     Args:
-        dna_seq (str): Sequência de DNA.
+        dna_seq (str | bytes | bytearray | memoryview): Sequência de DNA.
 
     Returns:
-        str: Complemento (em maiúsculas), ou ``""`` se a entrada não for DNA válido.
+        str | bytes: Complemento (em maiúsculas), ou vazio se a entrada não for
+        DNA válido. É ``bytes`` se a entrada for bytes-like.
 
     Raises:
-        AttributeError: Se ``dna_seq`` não for string e não tiver ``upper()``.
+        TypeError: Se ``dna_seq`` não for string nem bytes-like.
 
     Examples:
         >>> complemento("ATGC")
         'TACG'
+        >>> complemento(bytearray(b"atgc"))
+        b'TACG'
         >>> complemento("AUGC")
         ''
     """
-    if not validar_dna(dna_seq):
-        return ""
-        
-    mapa = {'A': 'T', 'T': 'A', 'C': 'G', 'G': 'C'}
-    complemento = ""
-    for base in dna_seq.upper():
-        complemento += mapa[base]
-    return complemento
+    if not dna_seq:
+        return _vazia(dna_seq)
+    resultado = _traduzir(dna_seq, _TABELA_COMPLEMENTO)
+    return _vazia(dna_seq) if resultado is None else resultado
 
 
 def reverso(seq):
@@ -184,31 +393,36 @@ def complemento_inverso(dna_seq):
 
     Produz o complemento e inverte a orientação, equivalente ao complemento reverso
     usado frequentemente em bioinformática para obter a cadeia complementar no sentido
-    5'→3'. Se a sequência de entrada não for DNA válido, devolve ``""``.
+    5'→3'. Se a sequência de entrada não for DNA válido, devolve ``""``. Tal como
+    :func:`complemento`, valida e converte numa única passagem por bloco.
 
     Args:
-        dna_seq (str): Sequência de DNA.
+        dna_seq (str | bytes | bytearray | memoryview | PackedDNA): Sequência de DNA.
 
     Returns:
-        str: Complemento inverso (em maiúsculas), ou ``""`` se a entrada não for DNA válido.
+        str | bytes | PackedDNA: Complemento inverso (em maiúsculas), ou vazio se a
+        entrada não for DNA válido. É ``bytes`` se a entrada for bytes-like; para
+        um :class:`PackedDNA` é uma vista em O(1) (os ``N`` mantêm-se).
 
     Raises:
-        AttributeError: Se ``dna_seq`` não for string e não tiver ``upper()``.
+        TypeError: Se ``dna_seq`` não for string nem bytes-like.
 
     Examples:
         >>> complemento_inverso("ATGC")
         'GCAT'
+        >>> complemento_inverso(memoryview(b"ATGC"))
+        b'GCAT'
         >>> complemento_inverso("AUGC")
         ''
+        >>> str(complemento_inverso(PackedDNA("ATGCN")))
+        'NGCAT'
     """
-    if not validar_dna(dna_seq):
-        return ""
-        
-    mapa = {'A': 'T', 'T': 'A', 'C': 'G', 'G': 'C'}
-    complemento = ""
-    for base in dna_seq.upper():
-        complemento += mapa[base]
-    return complemento[::-1]
+    if isinstance(dna_seq, PackedDNA):
+        return dna_seq.complemento_inverso()
+    if not dna_seq:
+        return _vazia(dna_seq)
+    resultado = _traduzir(dna_seq, _TABELA_COMPLEMENTO, inverter=True)
+    return _vazia(dna_seq) if resultado is None else resultado
 
 
 def encontra_codao_stop(seq,start_index):
@@ -220,7 +434,7 @@ def encontra_codao_stop(seq,start_index):
 
 
     >>> encontra_codao_stop("ATGCCCTAGGGG", 0)
-        'ATGCCCTAG'
+    'ATGCCCTAG'
 
     """
     codao_stop = {"TAA", "TAG", "TGA"}
@@ -229,35 +443,366 @@ def encontra_codao_stop(seq,start_index):
             return seq[start_index:j+3]
 
 
+ORF = namedtuple("ORF", ["inicio", "fim", "frame", "cadeia"])
+ORF.__doc__ = """Registo leve de uma ORF, com coordenadas na cadeia direta.
+
+Attributes:
+    inicio (int): Posição (base 0) do primeiro nucleótido da ORF na cadeia direta.
+    fim (int): Posição a seguir ao último nucleótido (o codão stop está incluído).
+    frame (int): Fase de leitura (0, 1 ou 2) na cadeia onde a ORF está.
+    cadeia (str): ``"+"`` (cadeia direta) ou ``"-"`` (complementar inversa).
+"""
+
+_PADRAO_START = re.compile("(?=ATG)")
+_PADRAO_STOP = re.compile("(?=TAA|TAG|TGA)")
+_COMPLEMENTO_STR = str.maketrans("ACGT", "TGCA")
+
+
+def _orfs_cadeia(seq, frames=(0, 1, 2)):
+    """Encontra as ORFs de uma cadeia (já em maiúsculas), frame a frame.
+
+    Os codões start e stop são localizados com expressões regulares (uma
+    passagem em C sobre a sequência) e agrupados por frame. Em cada frame, cada
+    stop fecha de uma vez todos os starts abertos desde o stop anterior, pelo
+    que o custo é linear no comprimento da sequência mais o número de ORFs.
+
+    Args:
+        seq (str): Sequência em maiúsculas.
+        frames (tuple[int, ...], optional): Frames a percorrer.
+
+    Yields:
+        tuple[int, int, int]: ``(inicio, fim, frame)`` de cada ORF, por frame e,
+        dentro de cada frame, por ordem de início.
+    """
+    starts = [[], [], []]
+    stops = [[], [], []]
+    for m in _PADRAO_START.finditer(seq):
+        starts[m.start() % 3].append(m.start())
+    for m in _PADRAO_STOP.finditer(seq):
+        stops[m.start() % 3].append(m.start())
+    for frame in frames:
+        abertos = starts[frame]
+        k = 0
+        for stop in stops[frame]:
+            while k < len(abertos) and abertos[k] < stop:
+                yield abertos[k], stop + 3, frame
+                k += 1
+            if k == len(abertos):
+                break
+
+
+def encontrar_orfs(dna, min_comprimento=0, cadeias="+-"):
+    """Encontra as ORFs nas seis fases de leitura de uma sequência de DNA.
+
+    Cada codão ``ATG`` abre uma ORF que termina no primeiro codão stop (``TAA``,
+    ``TAG``, ``TGA``) na mesma fase; ORFs aninhadas (um ``ATG`` dentro de outra
+    ORF) também são devolvidas, tal como em :func:`get_orfs`. Os starts sem stop
+    a jusante são ignorados. O custo é linear (ver :func:`_orfs_cadeia`) e, em
+    vez de substrings, são devolvidos registos :class:`ORF` com coordenadas; a
+    subsequência de uma ORF direta é ``dna[orf.inicio:orf.fim]`` e a de uma ORF
+    inversa é o complemento inverso dessa fatia.
+
+    Args:
+        dna (str | bytes | bytearray | memoryview | PackedDNA): Sequência de
+            DNA (case-insensitive).
+        min_comprimento (int, optional): Comprimento mínimo (em nucleótidos,
+            com o stop) das ORFs devolvidas. Por omissão ``0``.
+        cadeias (str, optional): Cadeias a percorrer: ``"+"``, ``"-"`` ou ``"+-"``
+            (por omissão).
+
+    Returns:
+        list[ORF]: ORFs da cadeia ``"+"`` seguidas das da cadeia ``"-"``; em cada
+        cadeia, por frame e por posição. As coordenadas são sempre na cadeia
+        direta; ``frame`` é a fase na cadeia da própria ORF.
+
+    Raises:
+        ValueError: Se ``cadeias`` tiver símbolos diferentes de ``"+"``/``"-"``.
+
+    Examples:
+        >>> encontrar_orfs("CATGAAATAGC")
+        [ORF(inicio=1, fim=10, frame=1, cadeia='+')]
+        >>> encontrar_orfs("GCTATTTCATCC")
+        [ORF(inicio=1, fim=10, frame=2, cadeia='-')]
+    """
+    if set(cadeias) - {"+", "-"}:
+        raise ValueError(f"Cadeias inválidas: {cadeias!r} (use '+', '-' ou '+-').")
+    if not isinstance(dna, str):
+        dna = bytes(dna).decode("latin-1")
+    seq = dna.upper()
+    n = len(seq)
+
+    orfs = []
+    if "+" in cadeias:
+        for inicio, fim, frame in _orfs_cadeia(seq):
+            if fim - inicio >= min_comprimento:
+                orfs.append(ORF(inicio, fim, frame, "+"))
+    if "-" in cadeias:
+        inversa = seq.translate(_COMPLEMENTO_STR)[::-1]
+        for inicio, fim, frame in _orfs_cadeia(inversa):
+            if fim - inicio >= min_comprimento:
+                orfs.append(ORF(n - fim, n - inicio, frame, "-"))
+    return orfs
+
+
 def get_orfs(dna):
-   """
+    """
     Identifica Open Reading Frames (ORFs) numa sequência de DNA.
 
     Esta função percorre a sequência à procura de um codão de início (ATG) 
     e termina quando encontra um dos codoes stop (TAA, TAG, TGA).
+    Só considera a fase 0 da cadeia direta; para as seis fases, com
+    coordenadas, ver :func:`encontrar_orfs`.
 
     Args:
-        dna (str): A sequência de DNA a analisar.
+        dna (str | bytes | bytearray | memoryview | PackedDNA): A sequência
+            de DNA a analisar. Outros tipos dão uma lista vazia.
 
     Returns:
         list: Uma lista de strings, onde cada string é uma ORF encontrada.
 
     >>> get_orfs("atgcccatgtaattt")
-        ['ATGCCCATGTAA', 'ATGTAA']
-"""
+    ['ATGCCCATGTAA', 'ATGTAA']
+    """
 
-    codao_stop = {"TAA", "TAG", "TGA"}
+    if isinstance(dna, PackedDNA):
+        dna = str(dna)
+    elif isinstance(dna, (bytes, bytearray, memoryview)):
+        dna = bytes(dna).decode("latin-1")
     if not isinstance(dna, str):
         return []
     seq = dna.upper().replace(" ", "").replace("\n", "")
-    orfs = []
-    for i in range(0, len(seq) - 2,3):
-        if seq[i:i+3] == "ATG":
-            orf = encontra_codao_stop(seq,i)
-            if orf:
-                orfs.append(orf)
-    return orfs
+    return [seq[inicio:fim] for inicio, fim, _ in _orfs_cadeia(seq, frames=(0,))]
+
+
+_CODIGO_BASE = bytes(
+    {ord('A'): 0, ord('C'): 1, ord('G'): 2, ord('T'): 3, ord('N'): 0,
+     ord('a'): 0, ord('c'): 1, ord('g'): 2, ord('t'): 3, ord('n'): 0}.get(b, 4)
+    for b in range(256)
+)
+"""bytes: Tabela base -> código de 2 bits (``N`` -> 0, inválidos -> 4)."""
+
+_DESLOCAR_CODIGO = tuple(bytes((b << 2*k) & 0xFF for b in range(256)) for k in range(4))
+"""tuple[bytes, ...]: Tabelas que deslocam um código para a posição ``k`` do byte."""
 
+_DESEMPACOTAR = tuple(bytes(b"ACGT"[(b >> 2*k) & 3] for b in range(256)) for k in range(4))
+"""tuple[bytes, ...]: Tabelas byte compactado -> base na posição ``k`` do byte."""
 
+_COMPLEMENTO_INVERSO_BYTE = bytes(
+    sum((3 - ((b >> 2*k) & 3)) << 2*(3-k) for k in range(4)) for b in range(256)
+)
+"""bytes: Complemento inverso das quatro bases de um byte compactado."""
 
+_COMPLEMENTO_BYTES = bytes.maketrans(b"ACGTN", b"TGCAN")
+_PADRAO_N = re.compile(b"[Nn]+")
 
+
+class PackedDNA:
+    """Sequência de DNA compactada em 2 bits por base, com máscara de ``N``.
+
+    As bases ``A, C, G, T`` são guardadas num ``bytearray`` com quatro bases por
+    byte (um quarto da memória de uma ``str``); as posições ``N`` são guardadas
+    à parte, como regiões ``(inicio, fim)``. A compactação e a descompactação
+    são feitas com tabelas de ``bytes.translate`` e operações sobre inteiros
+    grandes, sem ciclos Python por base.
+
+    O fatiamento (``seq[i:j]``) e :meth:`complemento_inverso` devolvem vistas em
+    O(1) que partilham o buffer original; :meth:`compactar` copia uma vista
+    para um buffer próprio (o complemento inverso é feito byte a byte sobre as
+    palavras compactadas). Uma instância é aceite por :func:`validar_dna` e
+    restantes validadores, :func:`complemento_inverso`, :func:`get_orfs`,
+    :func:`encontrar_orfs` e :func:`bioinf.blast.construir_mapa`.
+
+    Args:
+        seq (str | bytes | bytearray | memoryview): Sequência de DNA
+            (case-insensitive), só com ``A, C, G, T`` e ``N``.
+
+    Raises:
+        ValueError: Se ``seq`` tiver outros símbolos.
+
+    Examples:
+        >>> s = PackedDNA("acgtNNacg")
+        >>> len(s), str(s), s.regioes_n()
+        (9, 'ACGTNNACG', [(4, 6)])
+        >>> str(s[1:5]), str(s.complemento_inverso())
+        ('CGTN', 'CGTNNACGT')
+    """
+
+    __slots__ = ("_dados", "_inicios_n", "_fins_n", "_inicio", "_comprimento", "_inverso")
+
+    def __init__(self, seq):
+        if isinstance(seq, str):
+            try:
+                seq = seq.encode("latin-1")
+            except UnicodeEncodeError:
+                raise ValueError("PackedDNA só aceita as bases A, C, G, T e N.") from None
+        elif not isinstance(seq, (bytes, bytearray)):
+            seq = memoryview(seq).cast("B")
+
+        self._dados = bytearray()
+        self._inicios_n, self._fins_n = [], []
+        for inicio in range(0, len(seq), _TAMANHO_BLOCO):
+            bloco = bytes(seq[inicio:inicio+_TAMANHO_BLOCO])
+            codigos = bloco.translate(_CODIGO_BASE)
+            invalido = codigos.find(4)
+            if invalido >= 0:
+                raise ValueError(f"Símbolo inválido {chr(bloco[invalido])!r} na posição "
+                                 f"{inicio + invalido}; PackedDNA só aceita A, C, G, T e N.")
+            self._dados += _empacotar(codigos)
+            for m in _PADRAO_N.finditer(bloco):
+                a, b = inicio + m.start(), inicio + m.end()
+                if self._fins_n and self._fins_n[-1] == a:
+                    self._fins_n[-1] = b
+                else:
+                    self._inicios_n.append(a)
+                    self._fins_n.append(b)
+        self._inicio, self._comprimento, self._inverso = 0, len(seq), False
+
+    @classmethod
+    def _vista(cls, base, inicio, comprimento, inverso):
+        """Cria uma vista sobre o buffer e a máscara de ``base`` (sem cópias)."""
+        vista = cls.__new__(cls)
+        vista._dados, vista._inicios_n, vista._fins_n = base._dados, base._inicios_n, base._fins_n
+        vista._inicio, vista._comprimento, vista._inverso = inicio, comprimento, inverso
+        return vista
+
+    def __len__(self):
+        return self._comprimento
+
+    def __repr__(self):
+        texto = str(self[:20]) + ("..." if len(self) > 20 else "")
+        return f"PackedDNA({texto!r}, comprimento={len(self)})"
+
+    def __str__(self):
+        return self._descompactar().decode("ascii")
+
+    def __bytes__(self):
+        return self._descompactar()
+
+    def __iter__(self):
+        return iter(str(self))
+
+    def __eq__(self, outro):
+        if isinstance(outro, PackedDNA):
+            return len(self) == len(outro) and bytes(self) == bytes(outro)
+        if isinstance(outro, str):
+            return str(self) == outro
+        return NotImplemented
+
+    __hash__ = None
+
+    def __getitem__(self, indice):
+        n = self._comprimento
+        if isinstance(indice, slice):
+            inicio, fim, passo = indice.indices(n)
+            if passo != 1:
+                raise ValueError("PackedDNA só suporta fatias contíguas (passo 1).")
+            fim = max(fim, inicio)
+            if self._inverso:
+                return PackedDNA._vista(self, self._inicio + n - fim, fim - inicio, True)
+            return PackedDNA._vista(self, self._inicio + inicio, fim - inicio, False)
+        if indice < 0:
+            indice += n
+        if not 0 <= indice < n:
+            raise IndexError("Índice fora da sequência.")
+        pos = self._inicio + (n - 1 - indice if self._inverso else indice)
+        k = bisect_right(self._inicios_n, pos) - 1
+        if k >= 0 and pos < self._fins_n[k]:
+            return "N"
+        codigo = (self._dados[pos >> 2] >> 2*(pos & 3)) & 3
+        return "ACGT"[3 - codigo if self._inverso else codigo]
+
+    @property
+    def nbytes(self):
+        """int: Bytes do buffer compactado (partilhado) de que esta vista depende."""
+        return len(self._dados)
+
+    def _regioes_diretas(self):
+        """Regiões ``N`` em coordenadas absolutas do buffer, cortadas à vista."""
+        a, b = self._inicio, self._inicio + self._comprimento
+        k = max(bisect_right(self._inicios_n, a) - 1, 0)
+        regioes = []
+        while k < len(self._inicios_n) and self._inicios_n[k] < b:
+            inicio, fim = max(self._inicios_n[k], a), min(self._fins_n[k], b)
+            if inicio < fim:
+                regioes.append((inicio, fim))
+            k += 1
+        return regioes
+
+    def regioes_n(self):
+        """Devolve as regiões de ``N`` da sequência (coordenadas da vista).
+
+        Returns:
+            list[tuple[int, int]]: Intervalos ``(inicio, fim)`` ordenados.
+        """
+        a, n = self._inicio, self._comprimento
+        if self._inverso:
+            return [(a + n - fim, a + n - inicio) for inicio, fim in reversed(self._regioes_diretas())]
+        return [(inicio - a, fim - a) for inicio, fim in self._regioes_diretas()]
+
+    def complemento_inverso(self):
+        """Devolve o complemento inverso como vista em O(1) (os ``N`` mantêm-se).
+
+        Returns:
+            PackedDNA: Vista sobre o mesmo buffer.
+        """
+        return PackedDNA._vista(self, self._inicio, self._comprimento, not self._inverso)
+
+    def compactar(self):
+        """Copia a vista para um buffer próprio, alinhado na posição 0.
+
+        Permite libertar o buffer de uma sequência grande de que só interessa uma
+        fatia. Nas vistas invertidas, o complemento inverso é calculado sobre os
+        bytes compactados (tabela de 256 entradas e inversão da ordem dos bytes).
+
+        Returns:
+            PackedDNA: Nova sequência, independente da original.
+        """
+        a, n = self._inicio, self._comprimento
+        b0, b1 = a >> 2, (a + n + 3) >> 2
+        palavras = bytes(self._dados[b0:b1])
+        if self._inverso:
+            palavras = palavras.translate(_COMPLEMENTO_INVERSO_BYTE)[::-1]
+            desvio = 4*b1 - a - n
+        else:
+            desvio = a - 4*b0
+        valor = int.from_bytes(palavras, "little") >> 2*desvio
+        valor &= (1 << 2*n) - 1
+
+        nova = PackedDNA._vista(self, 0, n, False)
+        nova._dados = bytearray(valor.to_bytes((n + 3) >> 2, "little"))
+        regioes = self.regioes_n()
+        nova._inicios_n = [inicio for inicio, _ in regioes]
+        nova._fins_n = [fim for _, fim in regioes]
+        return nova
+
+    def _descompactar(self):
+        """Descompacta a vista para ``bytes`` em maiúsculas."""
+        a, n = self._inicio, self._comprimento
+        b0, b1 = a >> 2, (a + n + 3) >> 2
+        palavras = bytes(self._dados[b0:b1])
+        bases = bytearray(4*len(palavras))
+        for k in range(4):
+            bases[k::4] = palavras.translate(_DESEMPACOTAR[k])
+        desvio = a - 4*b0
+        del bases[:desvio]
+        del bases[n:]
+        for inicio, fim in self._regioes_diretas():
+            bases[inicio-a:fim-a] = b"N" * (fim - inicio)
+        if self._inverso:
+            return bytes(bases).translate(_COMPLEMENTO_BYTES)[::-1]
+        return bytes(bases)
+
+
+def _empacotar(codigos):
+    """Compacta códigos de 2 bits (um por byte) em quatro códigos por byte.
+
+    As quatro fatias ``codigos[k::4]`` são deslocadas com tabelas de tradução e
+    combinadas com ``|`` sobre inteiros grandes (os bits não se sobrepõem); a
+    base ``i`` fica nos bits ``2*(i % 4)`` do byte ``i // 4``.
+    """
+    codigos += bytes(-len(codigos) % 4)
+    total = len(codigos) // 4
+    valor = 0
+    for k in range(4):
+        valor |= int.from_bytes(codigos[k::4].translate(_DESLOCAR_CODIGO[k]), "little")
+    return valor.to_bytes(total, "little")
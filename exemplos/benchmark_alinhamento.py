@@ -0,0 +1,44 @@
+import sys
+import os
+import random
+import time
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from bioinf import alinhamento
+
+
+def cronometrar(funcao, repeticoes=3):
+    """Devolve o melhor tempo (em segundos) de ``repeticoes`` execuções e o resultado."""
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resultado = funcao()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor, resultado
+
+
+# Read curta contra alvos longos (o caso típico de Smith–Waterman)
+random.seed(0)
+casos = [(150, 5000), (150, 50000), (1000, 5000)]
+
+for n, m in casos:
+    query = "".join(random.choice("ACGT") for _ in range(n))
+    alvo = "".join(random.choice("ACGT") for _ in range(m))
+    print(f"=== Query de {n} contra alvo de {m} ===")
+    t, (_, _, sw) = cronometrar(lambda: alinhamento.smith_waterman(query, alvo), repeticoes=1)
+    print(f"smith_waterman:                    score {sw} em {t:.4f} s")
+    t, local = cronometrar(lambda: alinhamento.score_local(query, alvo), repeticoes=1)
+    print(f"score_local:                       score {local} em {t:.4f} s")
+    perfil = alinhamento.PerfilQuery(query)
+    t, (vetorizado, _) = cronometrar(lambda: alinhamento.smith_waterman_vetorizado(perfil, alvo))
+    print(f"smith_waterman_vetorizado (NumPy): score {vetorizado} em {t:.4f} s")
+    assert sw == local == vetorizado
+
+# O mesmo perfil reutilizado com muitos alvos
+query = "".join(random.choice("ACGT") for _ in range(150))
+alvos = ["".join(random.choice("ACGT") for _ in range(1000)) for _ in range(100)]
+perfil = alinhamento.PerfilQuery(query)
+print(f"=== Query de 150 contra {len(alvos)} alvos de 1000 ===")
+t, _ = cronometrar(lambda: [alinhamento.score_local(query, a) for a in alvos], repeticoes=1)
+print(f"score_local:                       {t:.4f} s")
+t, _ = cronometrar(lambda: [perfil.alinhar(a) for a in alvos])
+print(f"PerfilQuery.alinhar:               {t:.4f} s")
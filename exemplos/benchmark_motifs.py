@@ -0,0 +1,62 @@
+import sys
+import os
+import time
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from bioinf import motifs
+
+
+def cronometrar(funcao, repeticoes=3):
+    """Devolve o melhor tempo (em segundos) de ``repeticoes`` execuções e o resultado."""
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resultado = funcao()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor, resultado
+
+
+def recomecar_em_cada_posicao(sequencia, padrao):
+    """Alternativa ingénua: aplica o padrão ao sufixo que começa em cada posição (O(n²))."""
+    regex = motifs.compilar_prosite(padrao).compilado(sequencia)
+    return [i for i in range(len(sequencia)) if regex.match(sequencia[i:])]
+
+
+# Proteína rica em repetições: muitas ocorrências sobrepostas do motif
+casos = [
+    ("C-x-C", "CA" * 20000),
+    ("Q(2)-x-Q", "Q" * 40000),
+    ("G-x(0,50)-P", "G" * 40000 + "P"),
+]
+
+for padrao, sequencia in casos:
+    print(f"=== {padrao} em {len(sequencia)} resíduos ===")
+    t, atual = cronometrar(lambda: motifs.procurar_motifs(sequencia, padrao))
+    print(f"Não sobrepostos (comportamento atual): {len(atual):6d} ocorrências em {t:.4f} s")
+    t, ingenuo = cronometrar(lambda: recomecar_em_cada_posicao(sequencia, padrao), repeticoes=1)
+    print(f"Recomeçar em cada posição:             {len(ingenuo):6d} ocorrências em {t:.4f} s")
+    t, sobrepostos = cronometrar(lambda: motifs.procurar_motifs(sequencia, padrao, sobrepostos=True))
+    print(f"sobrepostos=True (lookahead):          {len(sobrepostos):6d} ocorrências em {t:.4f} s")
+    assert sobrepostos == ingenuo
+
+
+# Digestão de restrição: procura direta (em C) vs. automato de Aho-Corasick
+import random
+import re
+
+random.seed(0)
+genoma = "".join(random.choice("ACGT") for _ in range(2_000_000))
+paineis = [
+    ("EcoRI", {"EcoRI": "G^AATTC"}),
+    ("EcoRI+HinfI+BglI", {"EcoRI": "G^AATTC", "HinfI": "G^ANTC", "BglI": "GCCNNNN^NGGC"}),
+    ("16 enzimas", {f"E{i}": s for i, s in enumerate(
+        ["G^AATTC", "G^GATCC", "A^AGCTT", "CTGCA^G", "GT^MKAC", "G^ANTC", "CC^WGG", "GGTAC^C",
+         "C^TCGAG", "GAGCT^C", "T^CTAGA", "C^CCGGG", "GC^GGCCGC", "A^CCGGT", "CA^TATG", "G^TCGAC"])}),
+]
+print(f"=== Digestão de {len(genoma)} pb ===")
+t, base = cronometrar(lambda: [m.start() + 1 for m in re.finditer("GAATTC", genoma)])
+print(f"re.finditer literal (EcoRI, só cadeia direta): {len(base):6d} cortes em {t:.4f} s")
+for nome, enzimas in paineis:
+    t, direto = cronometrar(lambda: motifs.PainelEnzimas(enzimas, max_varreduras=100).cortes(genoma))
+    t_ac, automato = cronometrar(lambda: motifs.PainelEnzimas(enzimas, max_varreduras=0).cortes(genoma))
+    print(f"{nome:18s} {len(direto):6d} cortes | procura direta: {t:.4f} s | automato: {t_ac:.4f} s")
+    assert direto == automato
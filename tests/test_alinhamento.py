@@ -1,13 +1,91 @@
 import unittest
+import random
+from bioinf import alinhamento
 from bioinf.alinhamento import (
     needleman_wunsch,
     smith_waterman,
+    smith_waterman_multiplos,
+    hirschberg,
+    needleman_wunsch_banda,
+    alinhamento_semiglobal,
+    mapear_read,
+    needleman_wunsch_afim,
+    smith_waterman_afim,
+    alinhar_lote,
+    alinhar_contra_muitos,
+    Perfil,
+    PerfilQuery,
+    smith_waterman_vetorizado,
+    smith_waterman_striped,
+    SubstitutionMatrix,
+    carregar_matriz,
+    compilar_matriz,
+    score_global,
+    score_local,
     dot_plot,
+    dot_plot_esparso,
     consenso_multiplas,
+    estatisticas_colunas,
     alinhamento_multiplo,
     BLOSUM62
 )
 
+class TestSubstitutionMatrix(unittest.TestCase):
+    def test_compila_dict(self):
+        sm = SubstitutionMatrix(BLOSUM62)
+        self.assertEqual(sm.alfabeto, ("A", "C", "G", "T"))
+        self.assertEqual(sm.score("C", "G"), -3)
+        self.assertEqual(sm["C"]["G"], -3)
+        self.assertEqual(sm.codificar("TGCA"), [3, 2, 1, 0])
+        self.assertTrue(sm.completa)
+        self.assertTrue(sm.inteira)
+
+    def test_matriz_incompleta(self):
+        sm = SubstitutionMatrix({'A': {'A': 1}, 'C': {'C': 1}})
+        self.assertFalse(sm.completa)
+        with self.assertRaises(KeyError):
+            sm.score("A", "C")
+        with self.assertRaises(KeyError):
+            needleman_wunsch("A", "C", sm)
+
+    def test_cache_de_dict(self):
+        self.assertIs(compilar_matriz(BLOSUM62), compilar_matriz(BLOSUM62))
+        sm = SubstitutionMatrix(BLOSUM62)
+        self.assertIs(compilar_matriz(sm), sm)
+
+    def test_cache_recompila_dict_alterado(self):
+        m = {'A': {'A': 1, 'C': -1}, 'C': {'A': -1, 'C': 1}}
+        antes = compilar_matriz(m)
+        m['A']['A'] = 5
+        self.assertEqual(compilar_matriz(m).score('A', 'A'), 5)
+        self.assertIsNot(compilar_matriz(m), antes)
+
+    def test_cache_limitada(self):
+        for _ in range(3 * alinhamento._MAX_MATRIZES_COMPILADAS):
+            compilar_matriz({'A': {'A': 1}})
+        self.assertLessEqual(len(alinhamento._MATRIZES_COMPILADAS), alinhamento._MAX_MATRIZES_COMPILADAS)
+        self.assertIs(compilar_matriz(BLOSUM62), compilar_matriz(BLOSUM62))
+
+    def test_matrizes_proteinas(self):
+        blosum = carregar_matriz("BLOSUM62")
+        self.assertIs(blosum, carregar_matriz("blosum62"))
+        self.assertEqual(blosum.score("W", "W"), 11)
+        self.assertEqual(blosum.score("A", "R"), blosum.score("R", "A"))
+        self.assertEqual(carregar_matriz("PAM250").score("C", "C"), 12)
+        with self.assertRaises(ValueError):
+            carregar_matriz("PAM999")
+
+    def test_alinhamentos_aceitam_dict_ou_compilada(self):
+        sm = SubstitutionMatrix(BLOSUM62)
+        seq1, seq2 = "ACGTACGT", "ACGTCGTA"
+        self.assertEqual(needleman_wunsch(seq1, seq2, sm), needleman_wunsch(seq1, seq2, BLOSUM62))
+        self.assertEqual(smith_waterman(seq1, seq2, sm), smith_waterman(seq1, seq2, BLOSUM62))
+        self.assertEqual(alinhamento_multiplo([seq1, seq2], sm), alinhamento_multiplo([seq1, seq2], BLOSUM62))
+
+    def test_alinhamento_proteinas(self):
+        a1, a2, score = smith_waterman("HEAGAWGHEE", "PAWHEAE", carregar_matriz("BLOSUM62"), -8)
+        self.assertEqual((a1, a2, score), ("AWGHE", "AW-HE", 20))
+
 class TestNeedlemanWunsch(unittest.TestCase):
     def test_sequencias_identicas(self):
         a1, a2, score = needleman_wunsch("ATGC", "ATGC", BLOSUM62)
@@ -26,6 +104,120 @@ class TestNeedlemanWunsch(unittest.TestCase):
         self.assertEqual(len(a1), 1)
         self.assertEqual(len(a2), 1)
 
+@unittest.skipIf(alinhamento.np is None, "NumPy não instalado")
+class TestNeedlemanWunschNumpy(unittest.TestCase):
+    def test_igual_ao_motor_python(self):
+        pares = [("ACGTACGT", "ACGTCGTA"), ("GATTACA", "GCATGCT"), ("A", "T"), ("", "ACG"), ("", "")]
+        for seq1, seq2 in pares:
+            esperado = needleman_wunsch(seq1, seq2, BLOSUM62)
+            obtido = needleman_wunsch(seq1, seq2, BLOSUM62, motor="numpy")
+            self.assertEqual(obtido, esperado)
+            self.assertIsInstance(obtido[2], int)
+
+    def test_matriz_nao_inteira(self):
+        m = {'A': {'A': 1.5}}
+        with self.assertRaises(ValueError):
+            needleman_wunsch("A", "A", m, motor="numpy")
+
+    def test_motor_desconhecido(self):
+        with self.assertRaises(ValueError):
+            needleman_wunsch("A", "A", BLOSUM62, motor="gpu")
+
+class TestTracebackDirecoes(unittest.TestCase):
+    def test_direcoes_nw(self):
+        ultima, dirs = alinhamento._preencher_nw("AC", "A", BLOSUM62, -5, direcoes=True)
+        self.assertEqual(ultima, [-10, -1])
+        self.assertEqual(len(dirs), 3 * 2)
+        self.assertEqual(alinhamento._traceback_nw("AC", "A", dirs), ("AC", "A-"))
+
+    def test_sem_direcoes(self):
+        self.assertIsNone(alinhamento._preencher_nw("AC", "A", BLOSUM62, -5)[1])
+        self.assertIsNone(alinhamento._preencher_sw("AC", "A", BLOSUM62, -5)[2])
+
+    def test_sw_comeca_no_maximo(self):
+        score, pos, dirs = alinhamento._preencher_sw("TTACG", "ACG", BLOSUM62, -5, direcoes=True)
+        self.assertEqual((score, pos), (19, (5, 3)))
+        self.assertEqual(alinhamento._traceback_sw("TTACG", "ACG", dirs, pos), ("ACG", "ACG"))
+
+class TestHirschberg(unittest.TestCase):
+    def test_score_igual_ao_nw(self):
+        pares = [("ACGTACGT", "ACGTCGTA"), ("GATTACA", "GCATGCT"), ("ACGT", "A")]
+        for seq1, seq2 in pares:
+            a1, a2, score = hirschberg(seq1, seq2, BLOSUM62)
+            self.assertEqual(score, needleman_wunsch(seq1, seq2, BLOSUM62)[2])
+            self.assertEqual(len(a1), len(a2))
+            self.assertEqual(a1.replace("-", ""), seq1)
+            self.assertEqual(a2.replace("-", ""), seq2)
+
+    def test_sequencia_vazia(self):
+        self.assertEqual(hirschberg("", "AC", BLOSUM62), ("--", "AC", -10))
+        self.assertEqual(hirschberg("", "", BLOSUM62), ("", "", 0))
+
+class TestNeedlemanWunschBanda(unittest.TestCase):
+    def test_igual_ao_nw_quase_identicas(self):
+        seq1, seq2 = "ACGTACGTTGCA", "ACGTCGTTGGCA"
+        self.assertEqual(needleman_wunsch_banda(seq1, seq2, BLOSUM62, k=2),
+                         needleman_wunsch(seq1, seq2, BLOSUM62))
+
+    def test_banda_cresce(self):
+        seq1, seq2 = "AAAAAAAACCCC", "CCCCAAAAAAAA"
+        a1, a2, score = needleman_wunsch_banda(seq1, seq2, BLOSUM62, k=0)
+        self.assertEqual(score, needleman_wunsch(seq1, seq2, BLOSUM62)[2])
+        self.assertEqual(a1.replace("-", ""), seq1)
+        self.assertEqual(a2.replace("-", ""), seq2)
+
+    def test_score_exato_aleatorio(self):
+        rnd = random.Random(4)
+        for _ in range(200):
+            seq1 = "".join(rnd.choice("ACGT") for _ in range(rnd.randint(0, 12)))
+            seq2 = "".join(rnd.choice("ACGT") for _ in range(rnd.randint(0, 12)))
+            self.assertEqual(needleman_wunsch_banda(seq1, seq2, BLOSUM62, gap=-3, k=1)[2],
+                             needleman_wunsch(seq1, seq2, BLOSUM62, gap=-3)[2])
+
+    def test_k_negativo(self):
+        with self.assertRaises(ValueError):
+            needleman_wunsch_banda("A", "A", BLOSUM62, k=-1)
+
+class TestSemiGlobal(unittest.TestCase):
+    def test_sem_extremidades_livres_igual_ao_nw(self):
+        for seq1, seq2 in [("GATTACA", "GCATGCT"), ("ACGT", "A"), ("", "AC")]:
+            self.assertEqual(alinhamento_semiglobal(seq1, seq2, BLOSUM62),
+                             needleman_wunsch(seq1, seq2, BLOSUM62))
+
+    def test_read_na_referencia(self):
+        a1, a2, score = alinhamento_semiglobal("ACGT", "TTACGTTT", BLOSUM62,
+                                               livre_inicio2=True, livre_fim2=True)
+        self.assertEqual((a1, a2, score), ("--ACGT--", "TTACGTTT", 24))
+
+    def test_sobreposicao(self):
+        # sufixo de seq1 sobrepõe-se ao prefixo de seq2
+        a1, a2, score = alinhamento_semiglobal("TTTTACGT", "ACGTGGGG", BLOSUM62,
+                                               livre_inicio1=True, livre_fim2=True)
+        self.assertEqual((a1, a2, score), ("TTTTACGT----", "----ACGTGGGG", 24))
+
+class TestMapearRead(unittest.TestCase):
+    def test_coordenadas(self):
+        referencia = "GGGGGGACGTTGCAGGGGGG"
+        score, inicio, fim = mapear_read("ACGTAGCA", referencia, BLOSUM62)
+        self.assertEqual((inicio, fim), (6, 14))
+        self.assertEqual(score, needleman_wunsch("ACGTAGCA", referencia[6:14], BLOSUM62)[2])
+
+    def test_read_vazia(self):
+        self.assertEqual(mapear_read("", "ACGT", BLOSUM62), (0, 0, 0))
+
+    @unittest.skipIf(alinhamento.np is None, "NumPy não instalado")
+    def test_motor_numpy(self):
+        rnd = random.Random(2)
+        referencia = "".join(rnd.choice("ACGT") for _ in range(300))
+        for inicio in (0, 40, 250):
+            read = referencia[inicio:inicio+30]
+            self.assertEqual(mapear_read(read, referencia, BLOSUM62, motor="numpy"),
+                             mapear_read(read, referencia, BLOSUM62))
+
+    def test_motor_desconhecido(self):
+        with self.assertRaises(ValueError):
+            mapear_read("A", "A", BLOSUM62, motor="gpu")
+
 class TestSmithWaterman(unittest.TestCase):
     def test_alinhamento_local_simples(self):
         a1, a2, score = smith_waterman("ATGC", "TGC", BLOSUM62)
@@ -38,17 +230,247 @@ class TestSmithWaterman(unittest.TestCase):
         self.assertEqual(a2, "")
         self.assertEqual(score, 0)
 
+class TestSmithWatermanMultiplos(unittest.TestCase):
+    def test_primeiro_igual_ao_sw(self):
+        for seq1, seq2 in [("ACGTACGT", "ACGTCGTA"), ("GATTACA", "GCATGCT"), ("TTACGTT", "ACG")]:
+            primeiro = next(smith_waterman_multiplos(seq1, seq2, BLOSUM62))
+            self.assertEqual(primeiro[:3], smith_waterman(seq1, seq2, BLOSUM62))
+
+    def test_repeticoes(self):
+        res = list(smith_waterman_multiplos("ACGTTTTTACGT", "ACGT", BLOSUM62, k=2))
+        self.assertEqual([(r[0], r[2], r[3]) for r in res], [("ACGT", 24, (0, 0)), ("ACGT", 24, (8, 0))])
+
+    def test_ordem_e_sem_sobreposicao(self):
+        seq1, seq2 = "ACGTAGGCTTACGATCGA", "TTACGACGTAGGC"
+        res = list(smith_waterman_multiplos(seq1, seq2, BLOSUM62, gap=-3))
+        scores = [r[2] for r in res]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+        pares = set()
+        for a1, a2, _, (i, j) in res:
+            for c1, c2 in zip(a1, a2):
+                if c1 != "-" and c2 != "-":
+                    self.assertNotIn((i, j), pares)
+                    pares.add((i, j))
+                i += c1 != "-"
+                j += c2 != "-"
+
+    def test_score_minimo_e_k(self):
+        self.assertEqual(list(smith_waterman_multiplos("ACGT", "ACGT", BLOSUM62, k=0)), [])
+        res = list(smith_waterman_multiplos("ACGTTTTTACGT", "ACGT", BLOSUM62, score_minimo=10))
+        self.assertEqual(len(res), 2)
+        with self.assertRaises(ValueError):
+            smith_waterman_multiplos("A", "A", BLOSUM62, k=-1)
+
+class TestScoreSemTraceback(unittest.TestCase):
+    def test_score_global_igual_ao_nw(self):
+        for seq1, seq2 in [("ACGTACGT", "ACGTCGTA"), ("A", "T"), ("", "ACG")]:
+            self.assertEqual(score_global(seq1, seq2, BLOSUM62),
+                             needleman_wunsch(seq1, seq2, BLOSUM62)[2])
+
+    def test_score_local_igual_ao_sw(self):
+        for seq1, seq2 in [("ACGTACGT", "ACGTCGTA"), ("A", "T"), ("", "ACG")]:
+            self.assertEqual(score_local(seq1, seq2, BLOSUM62),
+                             smith_waterman(seq1, seq2, BLOSUM62)[2])
+
+@unittest.skipIf(alinhamento.np is None, "NumPy não instalado")
+class TestSmithWatermanVetorizado(unittest.TestCase):
+    def test_igual_ao_sw(self):
+        query = "ACGTTGCAAC"
+        perfil = PerfilQuery(query, BLOSUM62, gap=-5)
+        for alvo in ["TTACGTTGCA", "GGGG", "CAACGTACGTTGCAACGT", ""]:
+            score, _ = smith_waterman_vetorizado(perfil, alvo)
+            self.assertEqual(score, smith_waterman(query, alvo, BLOSUM62)[2])
+
+    def test_posicao_final(self):
+        self.assertEqual(PerfilQuery("ACGT").alinhar("TACG"), (19, (3, 4)))
+        self.assertEqual(PerfilQuery("A").alinhar("T"), (0, (0, 0)))
+
+    def test_promove_tipo_sem_overflow(self):
+        m = {'A': {'A': 1000}}
+        self.assertEqual(PerfilQuery("A" * 50, m, gap=-5).alinhar("A" * 50), (50000, (50, 50)))
+        m = {'A': {'A': 10**8}}
+        self.assertEqual(PerfilQuery("A" * 50, m, gap=-5).alinhar("A" * 50), (5 * 10**9, (50, 50)))
+
+    def test_gap_positivo(self):
+        with self.assertRaises(ValueError):
+            PerfilQuery("ACGT", BLOSUM62, gap=1)
+
+    def test_nome_antigo(self):
+        self.assertIs(smith_waterman_striped, smith_waterman_vetorizado)
+
+class TestGapsAfim(unittest.TestCase):
+    def test_nw_afim_igual_linear(self):
+        seq1, seq2 = "ACGTACGT", "ACGTCGTA"
+        _, _, score = needleman_wunsch_afim(seq1, seq2, BLOSUM62, gap_abertura=-5, gap_extensao=-5)
+        self.assertEqual(score, needleman_wunsch(seq1, seq2, BLOSUM62, gap=-5)[2])
+
+    def test_nw_afim_prefere_um_gap_longo(self):
+        a1, a2, score = needleman_wunsch_afim("ACGTTTACGT", "ACGTACGT", BLOSUM62, -5, -1)
+        self.assertEqual(a1, "ACGTTTACGT")
+        self.assertEqual(a2.count("-"), 2)
+        self.assertIn("--", a2)
+        self.assertEqual(score, 42)
+
+    def test_sw_afim(self):
+        a1, a2, score = smith_waterman_afim("TTACGTTTACGTTT", "ACGTACGT", BLOSUM62, -5, -1)
+        self.assertEqual((a1, a2, score), ("ACGTTTACGT", "ACG--TACGT", 42))
+
+    def test_sequencias_vazias(self):
+        self.assertEqual(needleman_wunsch_afim("", "", BLOSUM62), ("", "", 0))
+        self.assertEqual(needleman_wunsch_afim("AC", "", BLOSUM62, -10, -1), ("AC", "--", -11))
+        self.assertEqual(smith_waterman_afim("", "AC", BLOSUM62), ("", "", 0))
+
+class TestAlinhamentoLote(unittest.TestCase):
+    PARES = [("ACGTACGT", "ACGTCGTA"), ("GATTACA", "GCATGCT"), ("A", "T"), ("", "ACG")]
+
+    def test_pool_igual_ao_ciclo(self):
+        esperado = [needleman_wunsch(a, b, BLOSUM62) for a, b in self.PARES]
+        self.assertEqual(list(alinhar_lote(self.PARES, BLOSUM62, processos=2, chunksize=3)), esperado)
+        self.assertEqual(list(alinhar_lote(self.PARES, BLOSUM62, processos=1)), esperado)
+
+    def test_um_contra_muitos(self):
+        alvos = [b for _, b in self.PARES]
+        esperado = [smith_waterman("ACGT", b, BLOSUM62) for b in alvos]
+        self.assertEqual(list(alinhar_contra_muitos("ACGT", alvos, BLOSUM62, processos=2)), esperado)
+
+    def test_so_scores(self):
+        esperado = [score_local(a, b, BLOSUM62) for a, b in self.PARES]
+        self.assertEqual(list(alinhar_lote(self.PARES, BLOSUM62, algoritmo="score_local", processos=2)),
+                         esperado)
+        alvos = [b for _, b in self.PARES]
+        self.assertEqual(list(alinhar_contra_muitos("ACGT", alvos, BLOSUM62, algoritmo="score_global",
+                                                    processos=1)),
+                         [needleman_wunsch("ACGT", b, BLOSUM62)[2] for b in alvos])
+
+    def test_le_os_pares_aos_poucos(self):
+        lidos = []
+
+        def infinitos():
+            while True:
+                lidos.append(1)
+                yield "ACGT", "ACGA"
+
+        resultados = alinhar_lote(infinitos(), BLOSUM62, processos=2, chunksize=1)
+        for _ in range(3):
+            self.assertEqual(next(resultados), needleman_wunsch("ACGT", "ACGA", BLOSUM62))
+        resultados.close()
+        self.assertLessEqual(len(lidos), 3 + 2*2)
+
+    def test_parametros_invalidos(self):
+        with self.assertRaises(ValueError):
+            alinhar_lote(self.PARES, algoritmo="semi")
+        with self.assertRaises(ValueError):
+            alinhar_lote(self.PARES, processos=0)
+        with self.assertRaises(ValueError):
+            alinhar_contra_muitos("A", ["A"], chunksize=0)
+
+class TestPerfil(unittest.TestCase):
+    def test_contagens_e_frequencias(self):
+        p = Perfil(["AC-", "ACG"], BLOSUM62)
+        self.assertEqual(len(p), 3)
+        self.assertEqual(p.contagens[2], [0, 0, 1, 0, 1])
+        self.assertEqual(p.frequencias()[0], [1.0, 0.0, 0.0, 0.0, 0.0])
+
+    def test_comprimentos_diferentes(self):
+        with self.assertRaises(ValueError):
+            Perfil(["AC", "A"])
+
+    def test_sequencia_contra_sequencia_igual_ao_nw(self):
+        for seq1, seq2 in [("GATTACA", "GCATGCT"), ("ACGT", "A"), ("", "AC")]:
+            p = Perfil([seq1], BLOSUM62).alinhar(seq2)
+            a1, a2, score = needleman_wunsch(seq1, seq2, BLOSUM62)
+            self.assertEqual(p.sequencias, [a1, a2])
+            self.assertEqual(p.score_soma_pares(), score)
+
+    def test_perfil_contra_perfil_mantem_colunas(self):
+        p1 = Perfil(["ACG-T", "AC-GT"], BLOSUM62)
+        p2 = Perfil(["ACGT", "ACTT"], BLOSUM62)
+        p = p1.alinhar(p2)
+        self.assertEqual(len(p.sequencias), 4)
+        self.assertEqual([s.replace("-", "") for s in p.sequencias], ["ACGT", "ACGT", "ACGT", "ACTT"])
+        self.assertEqual(p.contagens, Perfil(p.sequencias, BLOSUM62).contagens)
+        self.assertEqual(p1.sequencias, ["ACG-T", "AC-GT"])
+
+    def test_adicionar_incremental(self):
+        seqs = ["ACGTACGT", "ACGACGT", "ACGTTACGT"]
+        p = Perfil(matriz_subst=BLOSUM62)
+        for s in seqs:
+            p.adicionar(s)
+        self.assertEqual([s.replace("-", "") for s in p.sequencias], seqs)
+        self.assertEqual(p.contagens, Perfil(p.sequencias, BLOSUM62).contagens)
+
 class TestDotPlot(unittest.TestCase):
     def test_dotplot_basico(self):
         matriz = dot_plot("AT", "AG")
         self.assertEqual(matriz, [[1,0],[0,0]])
 
+class TestDotPlotEsparso(unittest.TestCase):
+    def test_igual_ao_denso_com_k1(self):
+        seq1, seq2 = "ACGTTGCA", "TTGCAACG"
+        denso = dot_plot(seq1, seq2)
+        esperado = [(i, j) for i, linha in enumerate(denso) for j, v in enumerate(linha) if v]
+        self.assertEqual(dot_plot_esparso(seq1, seq2), esperado)
+
+    def test_kmers(self):
+        self.assertEqual(dot_plot_esparso("ACGTAC", "TACGT", k=3), [(0, 1), (1, 2), (3, 0)])
+        self.assertEqual(dot_plot_esparso("AC", "ACGT", k=3), [])
+
+    def test_filtro_janela(self):
+        # os pontos isolados desaparecem; a diagonal contínua fica
+        pontos = dot_plot_esparso("ACGTAT", "TACGTA", janela=4, minimo=3)
+        self.assertEqual(pontos, [(0, 1), (1, 2), (2, 3), (3, 4), (4, 5)])
+
+    def test_filtro_esquece_diagonais_antigas(self):
+        # diagonal 0 contínua (produz um ponto por linha) e uma diagonal nova por linha
+        pontos = ((i, j) for i in range(2000) for j in (i, 2*i + 5))
+        filtro = alinhamento._filtrar_diagonais(pontos, 10, 3)
+        for _ in filtro:
+            self.assertLessEqual(len(filtro.gi_frame.f_locals["diagonais"]), 2*10 + 1)
+
+    def test_iterador(self):
+        it = dot_plot_esparso("AAAA", "AAAA", k=2, iterador=True)
+        self.assertEqual(next(it), (0, 0))
+        self.assertEqual(len(list(it)), 8)
+
+    def test_parametros_invalidos(self):
+        with self.assertRaises(ValueError):
+            dot_plot_esparso("A", "A", k=0)
+        with self.assertRaises(ValueError):
+            dot_plot_esparso("A", "A", janela=3)
+        with self.assertRaises(ValueError):
+            dot_plot_esparso("A", "A", janela=2, minimo=3)
+
 class TestConsensoMultiplo(unittest.TestCase):
     def test_consenso_simples(self):
         alin = ["ATGC", "ATGA", "ATGT"]
         c = consenso_multiplas(alin)
         self.assertEqual(c, "ATGA")
 
+@unittest.skipIf(alinhamento.np is None, "NumPy não instalado")
+class TestConsensoNumpy(unittest.TestCase):
+    def test_igual_ao_motor_python(self):
+        rnd = random.Random(7)
+        for _ in range(100):
+            n_cols = rnd.randint(0, 12)
+            alin = ["".join(rnd.choice("ACGT-") for _ in range(n_cols)) for _ in range(rnd.randint(1, 9))]
+            self.assertEqual(consenso_multiplas(alin, motor="numpy"), consenso_multiplas(alin))
+
+    def test_estatisticas(self):
+        est = estatisticas_colunas(["AC-", "AG-", "ACT", "AGT"])
+        self.assertEqual(est["consenso"], "AC-")
+        self.assertEqual(est["simbolos"], "-ACGT")
+        self.assertEqual(est["contagens"][1].tolist(), [0, 0, 2, 2, 0])
+        self.assertEqual(est["entropia"].tolist(), [0.0, 1.0, 1.0])
+        self.assertEqual(est["fracao_gap"].tolist(), [0.0, 0.0, 0.5])
+
+    def test_comprimentos_diferentes(self):
+        with self.assertRaises(ValueError):
+            estatisticas_colunas(["AC", "A"])
+
+    def test_motor_desconhecido(self):
+        with self.assertRaises(ValueError):
+            consenso_multiplas(["A"], motor="gpu")
+
 class TestAlinhamentoMultiplo(unittest.TestCase):
     def test_alinhamento_multiplo_basico(self):
         seqs = ["ATGC", "ATGA", "ATGT"]
@@ -56,6 +478,22 @@ class TestAlinhamentoMultiplo(unittest.TestCase):
         self.assertEqual(cons, "ATGA")
         self.assertTrue(all(len(a) == len(alin[0]) for a in alin))
 
+    def test_todas_as_sequencias_no_resultado(self):
+        seqs = ["ACGTACGT", "ACGTCGT", "ACGAACGT", "TTACGTACG", "ACGTACGT"]
+        alin, _ = alinhamento_multiplo(seqs, BLOSUM62)
+        self.assertEqual(len(alin), len(seqs))
+        self.assertEqual([a.replace("-", "") for a in alin], seqs)
+        self.assertTrue(all(len(a) == len(alin[0]) for a in alin))
+
+    def test_duas_sequencias_igual_ao_nw(self):
+        seq1, seq2 = "GATTACA", "GCATGCT"
+        alin, _ = alinhamento_multiplo([seq1, seq2], BLOSUM62)
+        self.assertEqual(tuple(alin), needleman_wunsch(seq1, seq2, BLOSUM62)[:2])
+
+    def test_arvore_guia_upgma(self):
+        dist = {(0, 1): 8, (0, 2): 2, (0, 3): 8, (1, 2): 8, (1, 3): 1, (2, 3): 8}
+        self.assertEqual(alinhamento._arvore_guia(dist, 4), [(1, 3), (0, 2), (4, 5)])
+
     def test_sequencia_unica(self):
         seqs = ["A"]
         alin, cons = alinhamento_multiplo(seqs, BLOSUM62)
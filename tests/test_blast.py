@@ -5,6 +5,7 @@ from bioinf.blast import (
     encontrar_hits,
     estender_hit
 )
+from bioinf.sequencias import PackedDNA
 
 
 class TestConstruirMapa(unittest.TestCase):
@@ -15,6 +16,10 @@ class TestConstruirMapa(unittest.TestCase):
         self.assertIn("TGC", mapa)
         self.assertEqual(mapa["ATG"], [0])
     
+    def test_mapa_packed_dna(self):
+        query = "ATGCATNNATG"
+        self.assertEqual(construir_mapa(PackedDNA(query), 3), construir_mapa(query, 3))
+
     def test_query_tamanho_menor_w(self):
         query = "AT"
         mapa = construir_mapa(query, 3)
@@ -0,0 +1,122 @@
+import os
+import tempfile
+import unittest
+from io import BytesIO
+from bioinf.io import (ler_fasta, ler_fastq, ler_sequencias, indexar_fasta,
+                       escrever_fai, ler_fai, FastaIndexado, EntradaFai)
+
+FASTA = b">s1 primeira\nACGTAC\nGTA\n>s2\nTTTT\n\n>s3\nGGGGCC\nCCAAAA\nT\n"
+FASTQ = b"@r1 desc\nACGT\n+\nIIII\n@r2\nGG\n+r2\n#!\n"
+
+
+class _ComFicheiros(unittest.TestCase):
+    def escrever(self, conteudo, sufixo):
+        f = tempfile.NamedTemporaryFile(suffix=sufixo, delete=False)
+        f.write(conteudo)
+        f.close()
+        self.addCleanup(os.remove, f.name)
+        return f.name
+
+
+class TestLerFasta(_ComFicheiros):
+    ESPERADO = [("s1", b"ACGTACGTA"), ("s2", b"TTTT"), ("s3", b"GGGGCCCCAAAAT")]
+
+    def test_buffer(self):
+        regs = [(r.id, r.sequencia, r.qualidade) for r in ler_fasta(BytesIO(FASTA))]
+        self.assertEqual(regs, [(i, s, None) for i, s in self.ESPERADO])
+
+    def test_mmap_igual_ao_buffer(self):
+        caminho = self.escrever(FASTA.replace(b"\n", b"\r\n"), ".fa")
+        regs = [(r.id, bytes(r.sequencia)) for r in ler_fasta(caminho, usar_mmap=True)]
+        self.assertEqual(regs, self.ESPERADO)
+        self.assertEqual([(r.id, r.sequencia) for r in ler_fasta(caminho)], self.ESPERADO)
+
+    def test_mmap_linha_unica_memoryview(self):
+        caminho = self.escrever(b">a\nACGT\n", ".fa")
+        r = next(ler_fasta(caminho, usar_mmap=True))
+        self.assertIsInstance(r.sequencia, memoryview)
+        self.assertEqual(bytes(r.sequencia), b"ACGT")
+
+    def test_texto(self):
+        r = next(ler_fasta(BytesIO(FASTA), texto=True))
+        self.assertEqual(r.sequencia, "ACGTACGTA")
+
+    def test_vazio(self):
+        caminho = self.escrever(b"", ".fa")
+        self.assertEqual(list(ler_fasta(caminho)), [])
+        self.assertEqual(list(ler_fasta(caminho, usar_mmap=True)), [])
+
+    def test_conteudo_antes_do_cabecalho(self):
+        with self.assertRaises(ValueError):
+            list(ler_fasta(BytesIO(b"ACGT\n>a\nA\n")))
+        caminho = self.escrever(b"ACGT\n>a\nA\n", ".fa")
+        with self.assertRaises(ValueError):
+            list(ler_fasta(caminho, usar_mmap=True))
+
+
+class TestLerFastq(_ComFicheiros):
+    def test_buffer_e_mmap(self):
+        caminho = self.escrever(FASTQ, ".fq")
+        for usar_mmap in (False, True):
+            regs = [(r.id, bytes(r.sequencia), bytes(r.qualidade))
+                    for r in ler_fastq(caminho, usar_mmap=usar_mmap)]
+            self.assertEqual(regs, [("r1", b"ACGT", b"IIII"), ("r2", b"GG", b"#!")])
+
+    def test_comprimentos_diferentes(self):
+        with self.assertRaises(ValueError):
+            list(ler_fastq(BytesIO(b"@r1\nACGT\n+\nIII\n")))
+
+    def test_sem_mais(self):
+        with self.assertRaises(ValueError):
+            list(ler_fastq(BytesIO(b"@r1\nACGT\nIIII\nIIII\n")))
+
+    def test_deteccao_formato(self):
+        fq = self.escrever(FASTQ, ".fq")
+        fa = self.escrever(FASTA, ".fa")
+        self.assertEqual(next(ler_sequencias(fq, texto=True)).qualidade, "IIII")
+        self.assertEqual(next(ler_sequencias(fa)).id, "s1")
+        with self.assertRaises(ValueError):
+            ler_sequencias(self.escrever(b"ACGT\n", ".txt"))
+
+
+class TestFastaIndexado(_ComFicheiros):
+    def test_indice(self):
+        caminho = self.escrever(FASTA, ".fa")
+        indice = indexar_fasta(caminho)
+        self.assertEqual(indice["s1"], EntradaFai(9, 13, 6, 7))
+        self.assertEqual(indice["s3"], EntradaFai(13, FASTA.index(b"GGGG"), 6, 7))
+
+    def test_fai_ida_e_volta(self):
+        caminho = self.escrever(FASTA, ".fa")
+        escrever_fai(indexar_fasta(caminho), caminho + ".fai")
+        self.addCleanup(os.remove, caminho + ".fai")
+        self.assertEqual(ler_fai(caminho + ".fai"), indexar_fasta(caminho))
+
+    def test_regioes(self):
+        caminho = self.escrever(FASTA, ".fa")
+        esperado = {r.id: r.sequencia for r in ler_fasta(caminho)}
+        with FastaIndexado(caminho) as fa:
+            self.assertEqual(list(fa), ["s1", "s2", "s3"])
+            for id_, seq in esperado.items():
+                self.assertEqual(fa[id_], seq)
+                for i in range(len(seq)):
+                    for j in range(i, len(seq) + 2):
+                        self.assertEqual(fa.buscar(id_, i, j), seq[i:j])
+            with self.assertRaises(KeyError):
+                fa["x"]
+
+    def test_linhas_irregulares(self):
+        caminho = self.escrever(b">a\nAC\nACGT\n", ".fa")
+        with self.assertRaises(ValueError):
+            indexar_fasta(caminho)
+
+    def test_linha_em_branco_no_registo(self):
+        caminho = self.escrever(b">a\nACGT\n\nACGT\n", ".fa")
+        with self.assertRaises(ValueError):
+            indexar_fasta(caminho)
+        caminho = self.escrever(b">a\nACGT\n\n>b\nAC\n", ".fa")
+        self.assertEqual(indexar_fasta(caminho)["b"], EntradaFai(2, 12, 2, 3))
+
+
+if __name__ == "__main__":
+    unittest.main()
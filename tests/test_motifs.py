@@ -31,6 +31,98 @@ class TestProcurarMotifs(unittest.TestCase):
         posicoes = motifs.procurar_motifs(seq, padrao)
         self.assertEqual(posicoes, [])
 
+    def test_sobrepostos(self):
+        seq = "CACACAC"
+        self.assertEqual(motifs.procurar_motifs(seq, "C-x-C"), [0, 4])
+        self.assertEqual(motifs.procurar_motifs(seq, "C-x-C", sobrepostos=True), [0, 2, 4])
+        self.assertEqual(motifs.procurar_motifs(b"GGGGP", "G-x(0,3)-P", sobrepostos=True), [0, 1, 2, 3])
+
+    def test_sobrepostos_spans(self):
+        p = motifs.PrositePattern("A-x(0,2)-A")
+        self.assertEqual(p.findall("AAAA", sobrepostos=True), [(0, 4), (1, 4), (2, 4)])
+
+
+class TestPrositePattern(unittest.TestCase):
+    def test_gramatica_completa(self):
+        self.assertEqual(motifs.prosite_para_regex("C-x(2,4)-[ST]-{P}."), "C.{2,4}[ST][^P]")
+        self.assertEqual(motifs.prosite_para_regex("<[MV]-x(2)-[G>]"), "^[MV].{2}(?:G|$)")
+        self.assertEqual(motifs.prosite_para_regex("ATG"), "ATG")
+
+    def test_padroes_invalidos(self):
+        for padrao in ["A--C", "A-", "A(3,2)", "[]", "[A>]-C", "(2)"]:
+            with self.assertRaises(ValueError):
+                motifs.PrositePattern(padrao)
+
+    def test_cache(self):
+        self.assertIs(motifs.compilar_prosite("C-x-C"), motifs.compilar_prosite("C-x-C"))
+
+    def test_spans_str_e_bytes(self):
+        p = motifs.PrositePattern("C-x(2)-[HC]")
+        self.assertEqual(p.findall("ACAACHCGGC"), [(1, 5), (6, 10)])
+        self.assertEqual(p.findall(b"ACAACHCGGC"), [(1, 5), (6, 10)])
+        self.assertEqual(p.findall(memoryview(b"CAAH")), [(0, 4)])
+        self.assertEqual(list(p.finditer("ACAACHCGGC", 2)), [(6, 10)])
+
+    def test_fim_dentro_de_alternativas(self):
+        p = motifs.PrositePattern("A-[G>]")
+        self.assertEqual(p.findall("AGTTA"), [(0, 2), (4, 5)])
+
+
+class TestBibliotecaProsite(unittest.TestCase):
+    PADROES = {"zinco": "C-x(2)-C-H", "glic": "N-{P}-[ST]", "rep": "x(0,2)-GG-x", "fim": "K-[G>]"}
+
+    def esperado(self, seq):
+        res = [(inicio, k, fim) for k, (id_, p) in enumerate(self.PADROES.items())
+               for inicio, fim in motifs.PrositePattern(p).finditer(seq)]
+        return [(list(self.PADROES)[k], inicio, fim) for inicio, k, fim in sorted(res)]
+
+    def test_igual_a_finditer(self):
+        bib = motifs.BibliotecaProsite(self.PADROES)
+        for seq in ["ACAACHNGSCTTCH", "GGGGGGAK", "NPSNAT", "", "KGGGK"]:
+            self.assertEqual(bib.procurar(seq), self.esperado(seq))
+            self.assertEqual(bib.procurar(seq.encode()), self.esperado(seq))
+
+    def test_ids_por_indice(self):
+        bib = motifs.BibliotecaProsite(["C-x-C", "AA"])
+        self.assertEqual(bib.procurar("CACAA"), [(0, 0, 3), (1, 3, 5)])
+
+    def test_automato_sobreposto(self):
+        automato = motifs._AutomatoAhoCorasick([b"AA", b"A", b"CAA"])
+        self.assertEqual(sorted(automato.procurar(b"CAAA")),
+                         [(2, 1), (3, 0), (3, 1), (3, 2), (4, 0), (4, 1)])
+
+    def test_sobrepostos(self):
+        bib = motifs.BibliotecaProsite(self.PADROES)
+        seq = "GGGGGGAKG"
+        esperado = [(inicio, k, fim) for k, p in enumerate(self.PADROES.values())
+                    for inicio, fim in motifs.PrositePattern(p).finditer(seq, sobrepostos=True)]
+        self.assertEqual(bib.procurar(seq, sobrepostos=True),
+                         [(list(self.PADROES)[k], inicio, fim) for inicio, k, fim in sorted(esperado)])
+
+    def test_muitas_sequencias(self):
+        bib = motifs.BibliotecaProsite(self.PADROES)
+        seqs = ["ACAACHNGSCTTCH", "GGGGGGAK", "NPSNAT"]
+        self.assertEqual(list(bib.procurar_muitas(seqs, processos=1)), [bib.procurar(s) for s in seqs])
+        self.assertEqual(list(bib.procurar_muitas(seqs, processos=2, chunksize=1)),
+                         [bib.procurar(s) for s in seqs])
+        with self.assertRaises(ValueError):
+            bib.procurar_muitas(seqs, processos=0)
+
+    def test_muitas_sequencias_le_a_entrada_aos_poucos(self):
+        bib = motifs.BibliotecaProsite(self.PADROES)
+        lidas = []
+
+        def infinitas():
+            while True:
+                lidas.append(1)
+                yield "ACAACHNGSCTTCH"
+
+        resultados = bib.procurar_muitas(infinitas(), processos=2, chunksize=1)
+        for _ in range(3):
+            self.assertEqual(next(resultados), bib.procurar("ACAACHNGSCTTCH"))
+        resultados.close()
+        self.assertLessEqual(len(lidas), 3 + 2*2)
+
 
 class TestEnzimaFragmentacao(unittest.TestCase):
     def test_enzima_para_regex(self):
@@ -45,6 +137,100 @@ class TestEnzimaFragmentacao(unittest.TestCase):
         self.assertEqual(cortes, [1, 7])
 
 
+class TestPainelEnzimas(unittest.TestCase):
+    def test_iupac(self):
+        painel = motifs.PainelEnzimas({"HinfI": "G^ANTC"})
+        self.assertEqual([c.posicao for c in painel.cortes("GAATCAGACTCgagtc")], [1, 7, 12])
+
+    def test_cadeia_inversa(self):
+        painel = motifs.PainelEnzimas({"X": "GAC^GC"})
+        self.assertEqual([c.posicao for c in painel.cortes("AAGACGCAAGCGTCAA")], [5, 11])
+
+    def test_palindromo_so_uma_vez(self):
+        painel = motifs.PainelEnzimas({"EcoRI": "G^AATTC"})
+        self.assertEqual(painel.cortes("GAATTC"), [motifs.Corte(1, "EcoRI")])
+
+    def test_varias_enzimas_ordenadas(self):
+        painel = motifs.PainelEnzimas({"EcoRI": "G^AATTC", "MluCI": "^AATT"})
+        self.assertEqual(painel.cortes("CGAATTCG"),
+                         [motifs.Corte(2, "EcoRI"), motifs.Corte(2, "MluCI")])
+        self.assertEqual(painel.digerir("CGAATTCG"),
+                         [motifs.Fragmento(0, 2, None), motifs.Fragmento(2, 8, "EcoRI")])
+
+    def test_circular(self):
+        painel = motifs.PainelEnzimas({"EcoRI": "G^AATTC"})
+        seq = "ATTCCCCCGA"  # o sítio atravessa a origem
+        self.assertEqual(painel.cortes(seq), [])
+        self.assertEqual(painel.cortes(seq, circular=True), [motifs.Corte(9, "EcoRI")])
+        self.assertEqual(painel.digerir(seq, circular=True), [motifs.Fragmento(9, 19, "EcoRI")])
+        self.assertEqual(painel.digerir("CCCC", circular=True), [motifs.Fragmento(0, 4, None)])
+
+    def test_regex_para_sitios_degenerados(self):
+        seq = "AAGCCTTAAGGGCTTGCCAAAAGGC"
+        automato = motifs.PainelEnzimas({"BglI": "GCCNNNN^NGGC"}, max_varreduras=0)
+        regex = motifs.PainelEnzimas({"BglI": "GCCNNNN^NGGC"}, max_variantes=1, max_varreduras=0)
+        self.assertEqual(automato.cortes(seq), regex.cortes(seq))
+        self.assertEqual(automato.cortes(seq, circular=True), regex.cortes(seq, circular=True))
+
+    def test_procura_direta_igual_ao_automato(self):
+        enzimas = {"EcoRI": "G^AATTC", "HinfI": "G^ANTC", "X": "GAC^GC", "BglI": "GCCNNNN^NGGC"}
+        seq = "gaattcAGACTCaagcgtcGCCTTAAGGGCTTGCCAAAAGGCgaa"
+        direto = motifs.PainelEnzimas(enzimas)
+        automato = motifs.PainelEnzimas(enzimas, max_varreduras=0)
+        for circular in (False, True):
+            for entrada in (seq, seq.encode(), memoryview(seq.encode())):
+                self.assertEqual(direto.cortes(entrada, circular), automato.cortes(seq, circular))
+
+    def test_sitio_invalido(self):
+        with self.assertRaises(ValueError):
+            motifs.PainelEnzimas({"X": "GAXTC^"})
+        with self.assertRaises(ValueError):
+            motifs.PainelEnzimas({"X": "GAATTC"})
+
+
+class TestFragmentosPreguicosos(unittest.TestCase):
+    SEQ = "AAGAATTCCCCCCCGAATTCAAGAATTCA"
+
+    def test_coordenadas_iguais_as_copias(self):
+        fragmentos, _ = motifs.fragmentar_dna(self.SEQ, "G^AATTC")
+        coords = list(motifs.fragmentar_dna(self.SEQ, "G^AATTC", preguicoso=True))
+        self.assertEqual([self.SEQ[a:b] for a, b in coords], fragmentos)
+
+    def test_vistas_sobre_o_buffer(self):
+        dados = self.SEQ.encode()
+        vistas = list(motifs.fragmentar_dna(dados, "G^AATTC", preguicoso=True, vistas=True))
+        self.assertTrue(all(isinstance(v, memoryview) for v in vistas))
+        self.assertEqual(b"".join(vistas), dados)
+        with self.assertRaises(TypeError):
+            motifs.fragmentar_dna(self.SEQ, "G^AATTC", preguicoso=True, vistas=True)
+
+    def test_selecao_de_tamanho(self):
+        coords = motifs.fragmentar_dna(self.SEQ, "G^AATTC", preguicoso=True, tamanho_min=5, tamanho_max=10)
+        self.assertEqual(list(coords), [(15, 23), (23, 29)])
+
+    def test_posicoes_ordenadas_sem_repeticoes(self):
+        enzimas = {"EcoRI": "G^AATTC", "MluCI": "^AATT", "X": "GAC^GC", "BglI": "GCCNNNN^NGGC"}
+        seq = "CGAATTCGaattAAGACGCAAGCGTCAAGCCTTAAGGGCTTGCCAAAAGGC"
+        for max_varreduras in (12, 0):
+            painel = motifs.PainelEnzimas(enzimas, max_varreduras=max_varreduras)
+            esperado = sorted({c.posicao for c in painel.cortes(seq)})
+            self.assertEqual(list(painel._posicoes_ordenadas(seq.encode())), esperado)
+        fragmentos, cortes = motifs.fragmentar_dna(self.SEQ, "G^AATTC", tamanho_min=5, tamanho_max=10)
+        self.assertEqual((fragmentos, cortes), (["AATTCAAG", "AATTCA"], [3, 15, 23]))
+
+    def test_estatisticas(self):
+        coords = motifs.fragmentar_dna(self.SEQ, "G^AATTC", preguicoso=True)
+        est = motifs.estatisticas_fragmentos(coords)
+        self.assertEqual((est["numero"], est["total"], est["minimo"], est["maximo"]), (4, 29, 3, 12))
+        self.assertEqual((est["mediana"], est["n50"]), (7.0, 8))
+        self.assertIsNone(motifs.estatisticas_fragmentos([])["n50"])
+
+    def test_painel_gerador(self):
+        painel = motifs.PainelEnzimas({"EcoRI": "G^AATTC"})
+        self.assertEqual(list(painel.fragmentos(self.SEQ, tamanho_min=8)),
+                         [motifs.Fragmento(3, 15, "EcoRI"), motifs.Fragmento(15, 23, "EcoRI")])
+
+
 class TestPWM(unittest.TestCase):
     def test_criar_pwm_simples(self):
         seqs = ["ACG", "ACG"]
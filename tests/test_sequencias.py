@@ -1,5 +1,6 @@
 import unittest
 from bioinf import sequencias
+from bioinf.sequencias import encontra_codao_stop, get_orfs
 
 class TestValidacaoDNA(unittest.TestCase):
     def test_dna_valido(self):
@@ -28,6 +29,37 @@ class TestValidacaoProteina(unittest.TestCase):
         self.assertFalse(sequencias.validar_proteina("ACDEFX"))
         self.assertFalse(sequencias.validar_proteina(""))  # vazia
 
+class TestPosicaoInvalida(unittest.TestCase):
+    def test_primeira_posicao(self):
+        self.assertEqual(sequencias.posicao_invalida("ACGTXACGTX"), 4)
+        self.assertEqual(sequencias.posicao_invalida("acgt"), -1)
+        self.assertEqual(sequencias.posicao_invalida(""), -1)
+
+    def test_iupac_e_n(self):
+        self.assertFalse(sequencias.validar_dna("ACGN"))
+        self.assertTrue(sequencias.validar_dna("ACGN", permitir_n=True))
+        self.assertFalse(sequencias.validar_dna("ACGR", permitir_n=True))
+        self.assertTrue(sequencias.validar_dna("ACGRYn", iupac=True))
+        self.assertTrue(sequencias.validar_rna("ACGUN", permitir_n=True))
+        self.assertTrue(sequencias.validar_proteina("ACDX", permitir_x=True))
+        self.assertTrue(sequencias.validar_proteina("ACDBZ", iupac=True))
+
+    def test_bytes_memoryview_mmap(self):
+        import mmap
+        import tempfile
+        self.assertEqual(sequencias.posicao_invalida(b"ACGU", "rna"), -1)
+        self.assertEqual(sequencias.posicao_invalida(memoryview(b"ACGTU")), 4)
+        with tempfile.TemporaryFile() as f:
+            f.write(b"ACGT" * 100 + b"N")
+            f.flush()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                self.assertEqual(sequencias.posicao_invalida(mm), 400)
+                self.assertTrue(sequencias.validar_dna(mm, permitir_n=True))
+
+    def test_alfabeto_desconhecido(self):
+        with self.assertRaises(ValueError):
+            sequencias.posicao_invalida("ACGT", "lipidos")
+
 class TestTranscricao(unittest.TestCase):
     def test_transcricao_basica(self):
         self.assertEqual(sequencias.transcricao("ATGC"), "AUGC")
@@ -44,6 +76,26 @@ class TestComplemento(unittest.TestCase):
         self.assertEqual(sequencias.complemento("ATGX"), "")
         self.assertEqual(sequencias.complemento(""), "")
 
+class TestTraducaoBytes(unittest.TestCase):
+    def test_aceita_bytes_like(self):
+        self.assertEqual(sequencias.complemento(b"ATGC"), b"TACG")
+        self.assertEqual(sequencias.complemento_inverso(bytearray(b"atgc")), b"GCAT")
+        self.assertEqual(sequencias.transcricao(memoryview(b"ATGC")), b"AUGC")
+        self.assertEqual(sequencias.complemento(b"ATGN"), b"")
+
+    def test_por_blocos(self):
+        original = sequencias._TAMANHO_BLOCO
+        sequencias._TAMANHO_BLOCO = 3
+        try:
+            self.assertEqual(sequencias.complemento_inverso("AACGTTG"), "CAACGTT")
+            self.assertEqual(sequencias.complemento("AACGTTGX"), "")
+        finally:
+            sequencias._TAMANHO_BLOCO = original
+
+    def test_caracteres_nao_ascii(self):
+        self.assertEqual(sequencias.complemento("AÇ"), "")
+        self.assertEqual(sequencias.transcricao("A\u4e00"), "")
+
 class TestReverso(unittest.TestCase):
     def test_reverso_basico(self):
         self.assertEqual(sequencias.reverso("ATGC"), "CGTA")
@@ -88,6 +140,80 @@ class TestGetOrfs(unittest.TestCase):
         self.assertEqual(get_orfs(dna),[])
     def test_input_invalido(self):
         self.assertEqual(get_orfs(123),[])
+    def test_bytes(self):
+        esperado = ["ATGAAATAG", "ATGTTTTAA"]
+        dna = b"ATGAAATAGATGTTTTAA"
+        self.assertEqual(get_orfs(dna), esperado)
+        self.assertEqual(get_orfs(memoryview(bytearray(dna.lower()))), esperado)
+
+class TestEncontrarOrfs(unittest.TestCase):
+    def test_tres_frames_diretos(self):
+        orfs = sequencias.encontrar_orfs("ATGAAATAGCATGTTTTAAGG", cadeias="+")
+        self.assertEqual([(o.inicio, o.fim, o.frame) for o in orfs], [(0, 9, 0), (10, 19, 1)])
+        self.assertTrue(all(o.cadeia == "+" for o in orfs))
+
+    def test_cadeia_inversa_em_coordenadas_diretas(self):
+        dna = "GCTATTTCATCC"
+        orfs = sequencias.encontrar_orfs(dna)
+        self.assertEqual(orfs, [sequencias.ORF(1, 10, 2, "-")])
+        self.assertEqual(sequencias.complemento_inverso(dna[1:10]), "ATGAAATAG")
+
+    def test_aninhadas_e_comprimento_minimo(self):
+        dna = "ATGATGAAATAA"
+        self.assertEqual([(o.inicio, o.fim) for o in sequencias.encontrar_orfs(dna, cadeias="+")],
+                         [(0, 12), (3, 12)])
+        self.assertEqual([(o.inicio, o.fim) for o in sequencias.encontrar_orfs(dna, 10, "+")],
+                         [(0, 12)])
+
+    def test_get_orfs_usa_frame_zero(self):
+        self.assertEqual(get_orfs("atgcccatgtaattt"), ["ATGCCCATGTAA", "ATGTAA"])
+        self.assertEqual(get_orfs("CATGAAATAG"), [])
+
+    def test_cadeias_invalidas(self):
+        with self.assertRaises(ValueError):
+            sequencias.encontrar_orfs("ATG", cadeias="x")
+
+class TestPackedDNA(unittest.TestCase):
+    def test_ida_e_volta(self):
+        s = sequencias.PackedDNA("acgtNNNacgTA")
+        self.assertEqual(str(s), "ACGTNNNACGTA")
+        self.assertEqual(len(s), 12)
+        self.assertEqual(s.nbytes, 3)
+        self.assertEqual(s.regioes_n(), [(4, 7)])
+
+    def test_simbolo_invalido(self):
+        with self.assertRaises(ValueError):
+            sequencias.PackedDNA("ACGU")
+
+    def test_fatias_e_complemento_inverso(self):
+        dna = "ATGCNNGGATTACA"
+        s = sequencias.PackedDNA(dna)
+        self.assertEqual(str(s[3:9]), dna[3:9])
+        self.assertEqual(s[-1], "A")
+        inv = sequencias.complemento_inverso(s)
+        self.assertIs(inv._dados, s._dados)  # vista, sem cópia
+        self.assertEqual(str(inv), "TGTAATCCNNGCAT")
+        self.assertEqual(str(inv[2:10]), "TAATCCNN")
+        self.assertEqual(inv.regioes_n(), [(8, 10)])
+        compacta = inv[2:10].compactar()
+        self.assertEqual(str(compacta), "TAATCCNN")
+        self.assertEqual(compacta.nbytes, 2)
+        with self.assertRaises(ValueError):
+            s[::2]
+
+    def test_validadores(self):
+        self.assertTrue(sequencias.validar_dna(sequencias.PackedDNA("ACGT")))
+        self.assertFalse(sequencias.validar_dna(sequencias.PackedDNA("ACNGT")))
+        self.assertTrue(sequencias.validar_dna(sequencias.PackedDNA("ACNGT"), permitir_n=True))
+        self.assertEqual(sequencias.posicao_invalida(sequencias.PackedDNA("ACNGT")), 2)
+        self.assertEqual(sequencias.posicao_invalida(sequencias.PackedDNA("ACGT"), "rna"), 3)
+        self.assertFalse(sequencias.validar_dna(sequencias.PackedDNA("")))
+
+    def test_orfs(self):
+        dna = "atgcccatgtaatttGCTATTTCATCC"
+        s = sequencias.PackedDNA(dna)
+        self.assertEqual(get_orfs(s), get_orfs(dna))
+        self.assertEqual(sequencias.encontrar_orfs(s), sequencias.encontrar_orfs(dna))
 
 if __name__ == "__main__":
     unittest.main()